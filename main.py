@@ -5,6 +5,7 @@ import tkinter as tk
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from src.core import xlib
 from src.ui.main_window import MainWindow
 
 
@@ -17,6 +18,9 @@ def main():
     print("개발: 2025 by ys-ongyeol")
     print("=" * 60)
     
+    # Xlib 멀티스레드 지원은 Tk가 X 디스플레이를 열기 전에 켜야 함 (캡처 백엔드가 별도 스레드에서 사용)
+    xlib.init_threads()
+
     # GUI 실행
     root = tk.Tk()
     app = MainWindow(root)
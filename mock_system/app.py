@@ -26,13 +26,26 @@ class HaengbokEumMockSystem:
         self.create_widgets()
         
     def load_database(self):
-        """CSV 데이터베이스 로드"""
+        """CSV 데이터베이스 로드 (주민등록번호 색인과 세대원 수 컬럼을 미리 만들어 둠)"""
         try:
-            self.df = pd.read_csv(self.db_path, encoding='utf-8')
+            self.df = pd.read_csv(self.db_path, encoding='utf-8', dtype={'주민등록번호': str})
             print(f"데이터베이스 로드 완료: {len(self.df)}건")
         except Exception as e:
             print(f"데이터베이스 로드 실패: {e}")
-            self.df = pd.DataFrame()
+            self.df = pd.DataFrame(columns=['주민등록번호'])
+
+        # 세대원 수 (본인 + 이름이 있는 세대원)
+        count = pd.Series(1, index=self.df.index)
+        for i in range(1, 4):  # 세대원1, 세대원2, 세대원3
+            col_name = f'세대원{i}'
+            if col_name in self.df:
+                count += self.df[col_name].fillna('').astype(str).str.strip().ne('').astype(int)
+        self.df['세대원 수'] = count
+
+        # 주민등록번호 → 행 위치 (중복 번호는 첫 행, 검색 시 전체 컬럼 비교 없음)
+        rrns = self.df['주민등록번호']
+        first = ~rrns.duplicated()
+        self.index = dict(zip(rrns[first], first.to_numpy().nonzero()[0].tolist()))
     
     def create_widgets(self):
         """UI 위젯 생성"""
@@ -181,19 +194,22 @@ class HaengbokEumMockSystem:
             messagebox.showwarning("입력 오류", "주민등록번호를 입력하세요.")
             return
         
-        # 데이터베이스에서 검색
-        result = self.df[self.df['주민등록번호'] == resident_number]
+        # 데이터베이스에서 검색 (색인 조회)
+        position = self.index.get(resident_number)
         
-        if result.empty:
+        if position is None:
             self.show_no_result()
             self.status_label.config(text=f"조회 결과: 0건")
         else:
-            self.show_result(result.iloc[0])
-            household_count = self.count_household_members(result.iloc[0])
+            row = self.df.iloc[position]
+            self.show_result(row)
+            household_count = self.count_household_members(row)
             self.status_label.config(text=f"조회 결과: {household_count}명")
     
     def count_household_members(self, row):
-        """세대원 수 계산"""
+        """세대원 수 계산 (로드 시 계산해 둔 값 사용)"""
+        if '세대원 수' in row:
+            return int(row['세대원 수'])
         count = 1  # 본인
         for i in range(1, 4):  # 세대원1, 세대원2, 세대원3
             col_name = f'세대원{i}'
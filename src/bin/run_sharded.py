@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+가상 디스플레이 여러 개에서 동시에 조회 (Linux + Xvfb)
+-> 입력 파일의 주민등록번호를 작업 N개에 나눠 조회하고, 입력 순서대로 결과 파일 작성
+
+사용법:
+    python src/bin/run_sharded.py data/test_input.csv 결과.xlsx [--workers 4] [--cache data/cache/results.sqlite3]
+
+대상 프로그램은 기본으로 mock_system/app.py이며, --app으로 다른 실행 명령을 지정할 수 있다.
+진행 중 결과는 출력 파일 옆 실행 기록(.journal.jsonl)에 남으며, --resume이면 완료된 번호를 건너뛴다.
+"""
+
+import os
+import sys
+import shlex
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.excel_service import ExcelService
+from src.services.run_journal import RunJournal
+from src.services.result_cache import DEFAULT_CACHE_PATH
+from src.services.sharded_executor import ShardedExecutor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가상 디스플레이 여러 개에서 동시에 조회")
+    parser.add_argument("input", help="입력 Excel/CSV 파일")
+    parser.add_argument("output", help="결과 파일 경로")
+    parser.add_argument("--workers", type=int, default=2, help="디스플레이/작업 프로세스 수 (기본 2)")
+    parser.add_argument("--app", default=None, help="디스플레이마다 실행할 대상 프로그램 명령")
+    parser.add_argument("--templates", default=None, help="UI 템플릿 디렉토리 (기본: OS 자동 탐지)")
+    parser.add_argument("--display-size", default="1280x800", help="가상 디스플레이 크기 (기본 1280x800)")
+    parser.add_argument("--cache", nargs='?', const=DEFAULT_CACHE_PATH, default=None,
+                        help=f"결과 캐시 사용 (경로 생략 시 {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--resume", action="store_true", help="실행 기록에서 완료된 번호는 건너뜀")
+    args = parser.parse_args()
+
+    records = ExcelService.read_residents(args.input)
+    journal = RunJournal.for_output(args.output)
+    # 입력 파일(경로, 수정 시각, 크기)이 저널과 다르면 이어서 실행하지 않고 새로 시작
+    resume = journal.start(resume=args.resume, input=args.input, workers=args.workers)
+    done = journal.completed(args.input) if resume else set()
+
+    pending = [(i, record) for i, record in enumerate(records, 1)
+               if str(record.get('주민등록번호', '')) not in done]
+    total = len(records)
+    if done:
+        print(f"이어서 실행: 완료 {total - len(pending)}건 건너뜀")
+
+    width, height = (int(v) for v in args.display_size.lower().split('x'))
+    executor = ShardedExecutor(
+        workers=args.workers,
+        app_command=shlex.split(args.app) if args.app else None,
+        display_size=(width, height),
+        cache_path=args.cache,
+        template_dir=args.templates
+    )
+
+    def on_result(index, count, result):
+        i, record = pending[index - 1]
+        journal.append({
+            '순번': record.get('순번', i),
+            '주민등록번호': record.get('주민등록번호', ''),
+            '이름': record.get('이름', ''),
+            '세대원 수': result['household_count'],
+            '상태': '완료' if result['status'] == 'success' else '오류',
+            '메시지': result['message'],
+            '캐시': 'Y' if result.get('cached') else ''
+        })
+        print(f"[{i}/{total}] {record.get('주민등록번호', '')}: {result['household_count']}명 ({result['status']})")
+
+    executor.run([record.get('주민등록번호', '') for _, record in pending], callback=on_result)
+
+    journal.close()
+    ExcelService.write_results(args.output, journal.results(records, args.input))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+실행 결과 보관소(data/runs) 관리
+-> 이전 결과 Excel/CSV 가져오기, 실행 목록 보기, 거른 결과를 Excel로 내보내기
+
+사용법:
+    python src/bin/run_store.py import 결과_1월.xlsx 결과_2월.xlsx
+    python src/bin/run_store.py list
+    python src/bin/run_store.py export 요약.xlsx [--since 2025-01-01] [--until 2025-04-01] [--status 완료] [--latest]
+
+pyarrow가 필요하다 (pip install pyarrow).
+"""
+
+import os
+import sys
+import argparse
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.run_store import RunStore, DEFAULT_STORE_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실행 결과 보관소 관리")
+    parser.add_argument("--store", default=DEFAULT_STORE_DIR, help=f"보관 디렉토리 (기본 {DEFAULT_STORE_DIR})")
+    parser.add_argument("--format", default="parquet", choices=("parquet", "feather"), help="파일 형식")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="결과 Excel/CSV 파일 가져오기")
+    import_parser.add_argument("files", nargs="+", help="결과 파일")
+
+    commands.add_parser("list", help="실행 목록")
+
+    export_parser = commands.add_parser("export", help="거른 결과를 Excel로 내보내기")
+    export_parser.add_argument("output", help="출력 Excel 파일")
+    export_parser.add_argument("--since", type=datetime.fromisoformat, help="이 날짜 이후 실행만 (YYYY-MM-DD)")
+    export_parser.add_argument("--until", type=datetime.fromisoformat, help="이 날짜 이전 실행만 (YYYY-MM-DD)")
+    export_parser.add_argument("--status", choices=("완료", "오류"), help="이 상태만")
+    export_parser.add_argument("--latest", action="store_true", help="주민등록번호마다 가장 최근 결과만")
+    args = parser.parse_args()
+
+    store = RunStore(args.store, args.format)
+
+    if args.command == "import":
+        for path in args.files:
+            store.import_file(path)
+
+    elif args.command == "list":
+        runs = store.runs()
+        if runs:
+            summary = store.load(columns=['run_id', 'run_at', '상태']).groupby(['run_id', 'run_at'])['상태']
+            for (run_id, run_at), status in summary:
+                counts = status.value_counts()
+                print(f"{run_id:<30} {run_at:%Y-%m-%d %H:%M}  {len(status):>7}건 "
+                      f"(완료 {counts.get('완료', 0)}, 오류 {counts.get('오류', 0)})")
+        print(f"실행 {len(runs)}건: {store.directory}")
+
+    else:
+        store.export_excel(args.output, since=args.since, until=args.until, status=args.status, latest=args.latest)
+
+
+if __name__ == "__main__":
+    main()
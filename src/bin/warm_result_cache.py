@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+이전 결과 파일로 조회 결과 캐시 채우기
+-> 결과 Excel/CSV의 '상태'가 '완료'인 행의 주민등록번호/세대원 수를 캐시에 저장
+   ('캐시'가 'Y'인 행은 캐시에서 가져온 예전 결과이므로 제외)
+
+사용법:
+    python src/bin/warm_result_cache.py 결과_1월.xlsx 결과_2월.xlsx [--cache data/cache/results.sqlite3]
+
+조회 시각은 결과 파일의 수정 시각으로 기록한다 (캐시에 더 최근 결과가 있으면 유지).
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pandas as pd
+
+from src.services.result_cache import ResultCache, DEFAULT_CACHE_PATH
+
+
+def read_rows(path):
+    """결과 파일에서 (주민등록번호, 세대원 수, 상태, 조회 시각) 행 읽기"""
+    if path.endswith('.csv'):
+        df = pd.read_csv(path, dtype={'주민등록번호': str}, encoding='utf-8-sig')
+    else:
+        df = pd.read_excel(path, dtype={'주민등록번호': str})
+
+    missing = [c for c in ('주민등록번호', '세대원 수', '상태') if c not in df.columns]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in {path}")
+
+    done = df[(df['상태'] == '완료') & df['세대원 수'].notna()]
+    if '캐시' in df.columns:
+        # 캐시에서 가져온 행에 결과 파일 시각을 붙이면 오래된 결과가 만료되지 않으므로 제외
+        done = done[done['캐시'].fillna('').astype(str).str.strip() != 'Y']
+    looked_up = os.path.getmtime(path)
+    return [(rrn, int(count), 'success', looked_up) for rrn, count in zip(done['주민등록번호'], done['세대원 수'])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이전 결과 파일로 조회 결과 캐시 채우기")
+    parser.add_argument("files", nargs="+", help="결과 Excel/CSV 파일")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="캐시 파일 경로")
+    parser.add_argument("--ttl-days", type=int, default=30, help="유효 기간 (일, 지난 결과는 정리)")
+    args = parser.parse_args()
+
+    cache = ResultCache(args.cache, ttl_days=args.ttl_days)
+
+    for path in args.files:
+        try:
+            count = cache.put_many(read_rows(path))
+            print(f"[OK] {path}: {count}건")
+        except Exception as e:
+            print(f"[FAIL] {path}: {e}")
+
+    removed = cache.evict()
+    print(f"캐시: {cache.path} (총 {len(cache)}건, 만료 정리 {removed}건)")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,22 +5,111 @@ import time
 import pyperclip
 
 
+# 기존 pyautogui.PAUSE 값 (절약된 대기 시간 계산 기준)
+LEGACY_PAUSE = 0.1
+
+
 class GUIAutomation:
     """GUI 자동화 유틸리티"""
     
-    def __init__(self, delay=0.5):
+    def __init__(self, delay=0.5, pause=LEGACY_PAUSE, poll_interval=0.01):
         """
         초기화
         
         Args:
-            delay: 동작 간 기본 지연 시간 (초)
+            delay: 동작 후 기본 지연 시간 (초) — until 조건이 있으면 조건 대기의 최대 시간
+            pause: pyautogui 호출마다 자동으로 쉬는 시간 (pyautogui.PAUSE)
+            poll_interval: until 조건 확인 간격 (초)
         """
         self.delay = delay
+        self.pause = pause
+        self.poll_interval = poll_interval
         
-        pyautogui.PAUSE = 0.1  # 각 동작 후 0.1초 대기
+        pyautogui.PAUSE = pause  # 각 동작 후 대기
         pyautogui.FAILSAFE = True  # 마우스를 화면 모서리로 이동 시 중단
+
+        self.reset_report()
+
+    def reset_report(self):
+        """대기 시간 집계 초기화 (실행 단위로 호출)"""
+        self.report = {
+            'actions': 0,           # 동작 수
+            'fixed_sleep': 0.0,     # 고정 지연으로 쉰 시간
+            'condition_wait': 0.0,  # until 조건을 기다린 시간
+            'conditions_met': 0,    # 제한 시간 안에 조건이 충족된 횟수
+            'timeouts': 0,          # 조건 대기 시간 초과 횟수
+            'saved': 0.0,           # 기존 고정 지연(legacy_delay)과 PAUSE 대비 줄어든 대기 시간
+        }
+
+    def format_report(self):
+        """
+        대기 시간 집계를 한 줄 요약으로
+
+        Returns:
+            str: 요약 문자열
+        """
+        r = self.report
+        return (f"동작 {r['actions']}회, 고정 대기 {r['fixed_sleep']:.1f}초, "
+                f"조건 대기 {r['condition_wait']:.1f}초 (충족 {r['conditions_met']}, 시간 초과 {r['timeouts']}), "
+                f"절약 {r['saved']:.1f}초")
+
+    def wait_until(self, condition, timeout, interval=None):
+        """
+        조건이 참이 될 때까지 대기
+
+        Args:
+            condition: 인자 없는 함수 (참이면 대기 종료)
+            timeout: 최대 대기 시간 (초)
+            interval: 확인 간격 (None이면 poll_interval)
+
+        Returns:
+            float or None: 충족까지 걸린 시간 (초), 시간 초과 시 None
+        """
+        interval = self.poll_interval if interval is None else interval
+        start = time.perf_counter()
+        while True:
+            if condition():
+                return time.perf_counter() - start
+            elapsed = time.perf_counter() - start
+            if elapsed >= timeout:
+                return None
+            time.sleep(min(interval, timeout - elapsed))
+
+    def _after(self, delay, until, timeout, legacy_delay=None):
+        """
+        동작 후 대기: until 조건이 있으면 조건 대기, 없으면 고정 지연
+
+        Args:
+            delay: 고정 지연 (None이면 self.delay) — until이 있으면 timeout 기본값
+            until: 사후 조건 함수 (예: ScreenCapture.change_condition)
+            timeout: 조건 대기 최대 시간 (None이면 delay)
+            legacy_delay: 이 대기가 대신하는 기존 고정 지연 (절약 시간 계산 기준, None이면 delay)
+
+        Returns:
+            bool or None: 조건 충족 여부 (until이 없으면 None)
+        """
+        fallback = self.delay if delay is None else delay
+        legacy = fallback if legacy_delay is None else legacy_delay
+        r = self.report
+        r['actions'] += 1
+        r['saved'] += LEGACY_PAUSE - self.pause
+
+        if until is None:
+            if fallback > 0:
+                time.sleep(fallback)
+            r['fixed_sleep'] += fallback
+            r['saved'] += legacy - fallback
+            return None
+
+        start = time.perf_counter()
+        met = self.wait_until(until, fallback if timeout is None else timeout) is not None
+        waited = time.perf_counter() - start
+        r['condition_wait'] += waited
+        r['saved'] += legacy - waited
+        r['conditions_met' if met else 'timeouts'] += 1
+        return met
     
-    def click(self, x, y, clicks=1, button='left', delay=None):
+    def click(self, x, y, clicks=1, button='left', delay=None, until=None, timeout=None, legacy_delay=None):
         """
         특정 위치 클릭
         
@@ -28,16 +117,23 @@ class GUIAutomation:
             x, y: 클릭 좌표
             clicks: 클릭 횟수
             button: 'left', 'right', 'middle'
-            delay: 클릭 후 대기 시간
+            delay: 클릭 후 대기 시간 (until이 있으면 조건 대기의 기본 최대 시간)
+            until: 클릭 후 충족되어야 하는 조건 함수 (예: 포커스/영역 변화)
+            timeout: until 조건 대기 최대 시간
+            legacy_delay: 이 대기가 대신하는 기존 고정 지연 (대기 시간 집계의 절약 시간 기준)
+
+        Returns:
+            bool or None: until 조건 충족 여부 (until이 없으면 None)
         """
         pyautogui.click(x, y, clicks=clicks, button=button)
-        time.sleep(delay if delay is not None else self.delay)
+        return self._after(delay, until, timeout, legacy_delay)
     
-    def double_click(self, x, y, delay=None):
-        self.click(x, y, clicks=2, delay=delay)
+    def double_click(self, x, y, delay=None, until=None, timeout=None, legacy_delay=None):
+        return self.click(x, y, clicks=2, delay=delay, until=until, timeout=timeout, legacy_delay=legacy_delay)
     
-    def right_click(self, x, y, delay=None):
-        self.click(x, y, button='right', delay=delay)
+    def right_click(self, x, y, delay=None, until=None, timeout=None, legacy_delay=None):
+        return self.click(x, y, button='right', delay=delay, until=until, timeout=timeout,
+                          legacy_delay=legacy_delay)
     
     def move_to(self, x, y, duration=0.5):
         """
@@ -49,25 +145,31 @@ class GUIAutomation:
         """
         pyautogui.moveTo(x, y, duration=duration)
     
-    def type_text(self, text, interval=0.05, delay=None):
+    def type_text(self, text, interval=0.05, delay=None, until=None, timeout=None, legacy_delay=None):
         """
         텍스트 입력 (타이핑)
         
         Args:
             text: 입력할 텍스트
             interval: 글자 간 간격
-            delay: 입력 후 대기 시간
+            delay: 입력 후 대기 시간 (until이 있으면 조건 대기의 기본 최대 시간)
+            until: 입력 후 충족되어야 하는 조건 함수
+            timeout: until 조건 대기 최대 시간
+            legacy_delay: 이 대기가 대신하는 기존 고정 지연 (대기 시간 집계의 절약 시간 기준)
         """
         pyautogui.write(text, interval=interval)
-        time.sleep(delay if delay is not None else self.delay)
+        return self._after(delay, until, timeout, legacy_delay)
     
-    def paste_text(self, text, delay=None):
+    def paste_text(self, text, delay=None, until=None, timeout=None, legacy_delay=None):
         """
         텍스트 붙여넣기
         
         Args:
             text: 붙여넣을 텍스트
-            delay: 붙여넣기 후 대기 시간
+            delay: 붙여넣기 후 대기 시간 (until이 있으면 조건 대기의 기본 최대 시간)
+            until: 붙여넣기 후 충족되어야 하는 조건 함수
+            timeout: until 조건 대기 최대 시간
+            legacy_delay: 이 대기가 대신하는 기존 고정 지연 (대기 시간 집계의 절약 시간 기준)
         """
         # 클립보드에 복사
         pyperclip.copy(text)
@@ -79,29 +181,35 @@ class GUIAutomation:
         else:  # Windows/Linux
             pyautogui.hotkey('ctrl', 'v')
         
-        time.sleep(delay if delay is not None else self.delay)
+        return self._after(delay, until, timeout, legacy_delay)
     
-    def press_key(self, key, delay=None):
+    def press_key(self, key, delay=None, until=None, timeout=None, legacy_delay=None):
         """
         키 입력
         
         Args:
             key: 키 이름 ('enter', 'tab', 'esc', etc.)
-            delay: 입력 후 대기 시간
+            delay: 입력 후 대기 시간 (until이 있으면 조건 대기의 기본 최대 시간)
+            until: 입력 후 충족되어야 하는 조건 함수
+            timeout: until 조건 대기 최대 시간
+            legacy_delay: 이 대기가 대신하는 기존 고정 지연 (대기 시간 집계의 절약 시간 기준)
         """
         pyautogui.press(key)
-        time.sleep(delay if delay is not None else self.delay)
+        return self._after(delay, until, timeout, legacy_delay)
     
-    def hotkey(self, *keys, delay=None):
+    def hotkey(self, *keys, delay=None, until=None, timeout=None, legacy_delay=None):
         """
         단축키 입력
         
         Args:
             *keys: 키 조합 (예: 'ctrl', 'c')
-            delay: 입력 후 대기 시간
+            delay: 입력 후 대기 시간 (until이 있으면 조건 대기의 기본 최대 시간)
+            until: 입력 후 충족되어야 하는 조건 함수
+            timeout: until 조건 대기 최대 시간
+            legacy_delay: 이 대기가 대신하는 기존 고정 지연 (대기 시간 집계의 절약 시간 기준)
         """
         pyautogui.hotkey(*keys)
-        time.sleep(delay if delay is not None else self.delay)
+        return self._after(delay, until, timeout, legacy_delay)
     
     def scroll(self, clicks, x=None, y=None):
         """
@@ -119,6 +227,7 @@ class GUIAutomation:
     def wait(self, seconds):
         """대기"""
         time.sleep(seconds)
+        self.report['fixed_sleep'] += seconds
     
     def get_mouse_position(self):
         """
@@ -146,22 +255,24 @@ class GUIAutomation:
 class SafeAutomation(GUIAutomation):
     """안전 모드 자동화 (확인 메시지 포함)"""
     
-    def __init__(self, delay=0.5, confirm=True):
+    def __init__(self, delay=0.5, confirm=True, pause=LEGACY_PAUSE):
         """
         Args:
             delay: 동작 간 기본 지연 시간
             confirm: 중요 동작 전 확인 여부
+            pause: pyautogui 호출마다 자동으로 쉬는 시간
         """
-        super().__init__(delay)
+        super().__init__(delay, pause=pause)
         self.confirm = confirm
     
-    def click(self, x, y, clicks=1, button='left', delay=None):
+    def click(self, x, y, clicks=1, button='left', delay=None, until=None, timeout=None, legacy_delay=None):
         """확인 후 클릭"""
-        super().click(x, y, clicks, button, delay)
+        return super().click(x, y, clicks=clicks, button=button, delay=delay, until=until, timeout=timeout,
+                             legacy_delay=legacy_delay)
     
-    def paste_text(self, text, delay=None):
+    def paste_text(self, text, delay=None, until=None, timeout=None, legacy_delay=None):
         """확인 후 텍스트 붙여넣기"""
-        super().paste_text(text, delay)
+        return super().paste_text(text, delay=delay, until=until, timeout=timeout, legacy_delay=legacy_delay)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,314 @@
+"""
+MARK:
+화면 캡처 백엔드 모듈
+pyautogui(기본) 외에 Linux X11 공유 메모리(XShm) 캡처를 지원한다.
+백엔드는 연결/버퍼를 유지한 채 여러 번 캡처하며, 결과를 재사용 가능한 NumPy 버퍼에 바로 쓴다.
+"""
+
+import os
+import ctypes
+import platform
+
+import cv2
+import numpy as np
+import pyautogui
+
+
+class CaptureBackend:
+    """캡처 백엔드 기본 클래스"""
+
+    name = 'base'
+
+    def grab(self, region=None, grayscale=False, out=None):
+        """
+        화면 캡처
+
+        Args:
+            region: (x, y, width, height) 캡처 영역 (None이면 전체 화면)
+            grayscale: True면 그레이스케일 (H, W), 아니면 BGR (H, W, 3)
+            out: 결과를 쓸 NumPy 버퍼 (shape/dtype가 맞으면 재사용, None이면 새로 할당)
+
+        Returns:
+            numpy.ndarray: 캡처된 프레임
+        """
+        raise NotImplementedError
+
+    def size(self):
+        """
+        화면 크기
+
+        Returns:
+            tuple: (width, height)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """연결/버퍼 해제"""
+
+    def clone(self):
+        """
+        같은 설정의 새 인스턴스 (다른 스레드에서 연결/버퍼를 따로 쓰기 위함)
+
+        Returns:
+            CaptureBackend
+        """
+        return type(self)()
+
+    @staticmethod
+    def _convert(pixels, code, out):
+        """색 공간 변환 (out 버퍼가 맞으면 그대로 사용)"""
+        if out is not None:
+            expected = pixels.shape[:2] if code in (cv2.COLOR_RGB2GRAY, cv2.COLOR_BGRA2GRAY) \
+                else pixels.shape[:2] + (3,)
+            if out.shape == expected and out.dtype == np.uint8:
+                return cv2.cvtColor(pixels, code, dst=out)
+        return cv2.cvtColor(pixels, code)
+
+
+class PyAutoGUIBackend(CaptureBackend):
+    """pyautogui 캡처 (모든 OS, 기본값)"""
+
+    name = 'pyautogui'
+
+    def grab(self, region=None, grayscale=False, out=None):
+        screenshot = pyautogui.screenshot(region=region)
+        rgb = np.asarray(screenshot.convert('RGB'))
+        return self._convert(rgb, cv2.COLOR_RGB2GRAY if grayscale else cv2.COLOR_RGB2BGR, out)
+
+    def size(self):
+        return tuple(pyautogui.size())
+
+
+class XShmBackend(CaptureBackend):
+    """
+    X11 공유 메모리 캡처 (Linux, Xvfb 포함)
+
+    X 서버 연결과 화면 크기의 공유 메모리 세그먼트를 한 번만 만들고 계속 재사용한다.
+    XShm을 쓸 수 없는 디스플레이(원격 X 등)에서는 XGetImage로 동작한다.
+    """
+
+    name = 'xshm'
+
+    def __init__(self, display=None):
+        """
+        Args:
+            display: X 디스플레이 이름 (None이면 DISPLAY 환경 변수)
+
+        Raises:
+            OSError: X 라이브러리가 없거나 디스플레이에 연결할 수 없을 때
+        """
+        from . import xlib
+        self._xlib = xlib
+        self._x11, self._xext, self._libc = xlib.load()
+
+        name = display or os.environ.get('DISPLAY')
+        self.display_name = name
+        self._display = self._x11.XOpenDisplay(name.encode() if name else None)
+        if not self._display:
+            raise OSError(f"Cannot open X display {name!r}")
+
+        screen = self._x11.XDefaultScreen(self._display)
+        self._root = self._x11.XDefaultRootWindow(self._display)
+        self._visual = self._x11.XDefaultVisual(self._display, screen)
+        self._depth = self._x11.XDefaultDepth(self._display, screen)
+        self._width = self._x11.XDisplayWidth(self._display, screen)
+        self._height = self._x11.XDisplayHeight(self._display, screen)
+
+        # (width, height) → XImage (같은 공유 메모리 세그먼트를 가리킴)
+        self._images = {}
+        self._shminfo = None
+        self.use_shm = bool(self._xext.XShmQueryExtension(self._display))
+        if self.use_shm:
+            try:
+                self._attach_shm()
+                self._verify_shm()
+            except OSError as e:
+                print(f"XShm 사용 불가, XGetImage로 캡처: {e}")
+                self._release_shm()
+                self.use_shm = False
+
+        if not self.use_shm:
+            try:
+                self._test_grab()
+            except OSError:
+                self.close()
+                raise
+
+    def _attach_shm(self):
+        """화면 전체 크기의 공유 메모리 세그먼트 생성 및 X 서버에 연결"""
+        xlib = self._xlib
+        size = self._width * self._height * 4
+
+        shminfo = xlib.XShmSegmentInfo()
+        shminfo.shmid = self._libc.shmget(xlib.IPC_PRIVATE, size, xlib.IPC_CREAT | 0o600)
+        if shminfo.shmid < 0:
+            raise OSError(ctypes.get_errno(), "shmget failed")
+
+        shminfo.shmaddr = self._libc.shmat(shminfo.shmid, None, 0)
+        if shminfo.shmaddr in (None, ctypes.c_void_p(-1).value):
+            self._libc.shmctl(shminfo.shmid, xlib.IPC_RMID, None)
+            raise OSError(ctypes.get_errno(), "shmat failed")
+        shminfo.readOnly = 0
+
+        # 원격 X 서버 등에서는 XShmAttach가 성공을 반환한 뒤 비동기 오류(BadAccess)가 온다
+        with xlib.trap_errors(self._display) as errors:
+            attached = self._xext.XShmAttach(self._display, ctypes.byref(shminfo))
+        if not attached or errors:
+            self._libc.shmdt(shminfo.shmaddr)
+            self._libc.shmctl(shminfo.shmid, xlib.IPC_RMID, None)
+            raise OSError(f"XShmAttach failed (X error {errors})" if errors else "XShmAttach failed")
+
+        # 연결 후 삭제 표시 → 프로세스가 비정상 종료해도 세그먼트가 남지 않음
+        self._libc.shmctl(shminfo.shmid, xlib.IPC_RMID, None)
+        self._shminfo = shminfo
+
+    def _verify_shm(self, attempts=3):
+        """
+        작은 영역을 XShm과 XGetImage로 각각 캡처해 같은 화면이 나오는지 확인
+
+        Raises:
+            OSError: X 오류가 나거나 결과가 계속 다를 때
+        """
+        region = (0, 0, min(64, self._width), min(64, self._height))
+        for _ in range(attempts):
+            with self._xlib.trap_errors(self._display) as errors:
+                shm = self._grab_shm(*region, cv2.COLOR_BGRA2BGR, None)
+                reference = self._grab_image(*region, cv2.COLOR_BGRA2BGR, None)
+            if errors:
+                raise OSError(f"X error {errors} during XShm test grab")
+            # 두 캡처 사이에 화면이 바뀌었을 수 있으므로 몇 번 다시 시도
+            if np.array_equal(shm, reference):
+                return
+        raise OSError("XShm test grab does not match XGetImage")
+
+    def _test_grab(self):
+        """
+        XGetImage로 작은 영역 캡처 시험
+
+        Raises:
+            OSError: X 오류가 나거나 지원하지 않는 화면 형식일 때
+        """
+        region = (0, 0, min(64, self._width), min(64, self._height))
+        with self._xlib.trap_errors(self._display) as errors:
+            self._grab_image(*region, cv2.COLOR_BGRA2BGR, None)
+        if errors:
+            raise OSError(f"X error {errors} during XGetImage test grab")
+
+    def _release_shm(self):
+        """공유 메모리 XImage/세그먼트 해제"""
+        for image in self._images.values():
+            # 데이터는 공유 메모리이므로 구조체만 해제
+            self._x11.XFree(image)
+        self._images.clear()
+        if self._shminfo is not None:
+            with self._xlib.trap_errors(self._display):
+                self._xext.XShmDetach(self._display, ctypes.byref(self._shminfo))
+            self._libc.shmdt(self._shminfo.shmaddr)
+            self._shminfo = None
+
+    def _shm_image(self, width, height):
+        """영역 크기별 XImage (공유 메모리 재사용)"""
+        image = self._images.get((width, height))
+        if image is None:
+            image = self._xext.XShmCreateImage(
+                self._display, self._visual, self._depth, self._xlib.ZPixmap,
+                self._shminfo.shmaddr, ctypes.byref(self._shminfo), width, height
+            )
+            if not image:
+                raise OSError("XShmCreateImage failed")
+            self._images[(width, height)] = image
+        return image
+
+    @staticmethod
+    def _pixels(image, width, height):
+        """XImage 데이터를 BGRA 배열 뷰로 (복사 없음)"""
+        contents = image.contents
+        if contents.bits_per_pixel != 32:
+            raise OSError(f"Unsupported X image format: {contents.bits_per_pixel} bpp")
+        stride = contents.bytes_per_line
+        buffer = (ctypes.c_uint8 * (stride * height)).from_address(contents.data)
+        return np.frombuffer(buffer, dtype=np.uint8).reshape(height, stride // 4, 4)[:, :width]
+
+    def grab(self, region=None, grayscale=False, out=None):
+        x, y, width, height = (int(v) for v in (region or (0, 0, self._width, self._height)))
+        # 화면과 겹치는 부분만 캡처 (결과 프레임의 좌상단은 화면 좌표 (max(0, x), max(0, y)))
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self._width, x + width), min(self._height, y + height)
+        x, y, width, height = x0, y0, x1 - x0, y1 - y0
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Capture region outside screen: {region}")
+
+        code = cv2.COLOR_BGRA2GRAY if grayscale else cv2.COLOR_BGRA2BGR
+        if self.use_shm:
+            return self._grab_shm(x, y, width, height, code, out)
+        return self._grab_image(x, y, width, height, code, out)
+
+    def _grab_shm(self, x, y, width, height, code, out):
+        """XShmGetImage로 캡처"""
+        image = self._shm_image(width, height)
+        if not self._xext.XShmGetImage(self._display, self._root, image, x, y, self._xlib.AllPlanes):
+            raise OSError("XShmGetImage failed")
+        return self._convert(self._pixels(image, width, height), code, out)
+
+    def _grab_image(self, x, y, width, height, code, out):
+        """XGetImage로 캡처 (XShm을 쓸 수 없을 때)"""
+        image = self._x11.XGetImage(self._display, self._root, x, y, width, height,
+                                    self._xlib.AllPlanes, self._xlib.ZPixmap)
+        if not image:
+            raise OSError("XGetImage failed")
+        try:
+            return self._convert(self._pixels(image, width, height), code, out)
+        finally:
+            self._x11.XDestroyImage(image)
+
+    def size(self):
+        return (self._width, self._height)
+
+    def clone(self):
+        return XShmBackend(self.display_name)
+
+    def close(self):
+        if not self._display:
+            return
+        self._release_shm()
+        self._x11.XCloseDisplay(self._display)
+        self._display = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+BACKENDS = {
+    'pyautogui': PyAutoGUIBackend,
+    'xshm': XShmBackend,
+}
+
+
+def create_backend(name='auto'):
+    """
+    캡처 백엔드 생성
+
+    Args:
+        name: 'auto' (Linux + DISPLAY면 시험 캡처에 성공한 경우에만 xshm, 아니면 pyautogui),
+              'pyautogui', 'xshm' 또는 CaptureBackend 인스턴스
+
+    Returns:
+        CaptureBackend
+    """
+    if isinstance(name, CaptureBackend):
+        return name
+
+    if name == 'auto':
+        if platform.system() == 'Linux' and os.environ.get('DISPLAY'):
+            try:
+                return XShmBackend()
+            except OSError as e:
+                print(f"XShm 캡처 백엔드 사용 불가, pyautogui 사용: {e}")
+        return PyAutoGUIBackend()
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown capture backend '{name}' (choose from {list(BACKENDS)})")
+    return BACKENDS[name]()
@@ -0,0 +1,187 @@
+"""
+MARK:
+상태바 숫자 인식 모듈
+"조회 결과: N명" 상태바에서 숫자 글리프 템플릿(0~9)만으로 N을 읽는다 (OCR 엔진 없음)
+글리프가 없으면 상태바와 같은 글꼴로 렌더링해 만든다 (create_digit_templates).
+"""
+
+import os
+import platform
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from .image_matcher import load_gray, non_max_suppression, ImageMatcher
+from .template_registry import TemplateRegistry
+
+
+DIGITS = '0123456789'
+
+# OS별 상태바 글꼴 및 픽셀 크기 (mock_system 상태바: 맑은 고딕 9pt)
+DEFAULT_FONTS = {
+    'Windows': ("C:/Windows/Fonts/malgun.ttf", 12),
+    'Darwin': ("/System/Library/Fonts/AppleSDGothicNeo.ttc", 18),
+}
+FALLBACK_FONT = ("DejaVuSans.ttf", 12)
+
+STATUS_BAR_BG = (224, 224, 224)  # mock_system 상태바 배경 #e0e0e0
+TEXT_COLOR = (0, 0, 0)
+
+
+def render_digits(font, padding=1):
+    """
+    0~9를 상태바 배경 위에 렌더링하고 글자 영역만 잘라내기
+
+    모든 숫자의 높이가 같도록 세로 범위는 전체 숫자의 잉크 범위를 공통으로 쓰고,
+    가로 범위는 숫자별 잉크 범위로 자른다.
+
+    Returns:
+        dict: {숫자: PIL.Image (RGB)}
+    """
+    size = font.size * 2
+    images = {}
+    for digit in DIGITS:
+        image = Image.new('RGB', (size, size), STATUS_BAR_BG)
+        ImageDraw.Draw(image).text((font.size // 2, font.size // 4), digit, font=font, fill=TEXT_COLOR)
+        images[digit] = image
+
+    inks = {digit: np.asarray(image.convert('L')) < 200 for digit, image in images.items()}
+    rows = np.flatnonzero(np.any([ink.any(axis=1) for ink in inks.values()], axis=0))
+    top, bottom = max(0, rows[0] - padding), min(size, rows[-1] + 1 + padding)
+
+    digits = {}
+    for digit, image in images.items():
+        cols = np.flatnonzero(inks[digit].any(axis=0))
+        digits[digit] = image.crop((
+            max(0, cols[0] - padding), top, min(size, cols[-1] + 1 + padding), bottom
+        ))
+    return digits
+
+
+def create_digit_templates(output_dir, font_path=None, font_size=None):
+    """
+    상태바 글꼴로 0~9 글리프를 렌더링해 output_dir/0.png ~ 9.png로 저장
+
+    Args:
+        output_dir: 저장 디렉토리 (<템플릿 디렉토리>/digits)
+        font_path: TrueType 글꼴 경로 (None이면 OS별 상태바 글꼴)
+        font_size: 글꼴 픽셀 크기 (None이면 OS별 값)
+
+    Returns:
+        list: 저장한 파일 경로
+
+    Raises:
+        OSError: 글꼴을 열 수 없을 때
+    """
+    default_path, default_size = DEFAULT_FONTS.get(platform.system(), FALLBACK_FONT)
+    font = ImageFont.truetype(font_path or default_path, font_size or default_size)
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for digit, image in render_digits(font).items():
+        path = os.path.join(output_dir, f"{digit}.png")
+        image.save(path)
+        paths.append(path)
+    return paths
+
+
+class DigitReader:
+    """숫자 글리프 템플릿 매칭으로 상태바 숫자 읽기"""
+
+    def __init__(self, digit_dir, confidence=0.8):
+        """
+        Args:
+            digit_dir: 숫자 템플릿 디렉토리 (0.png ~ 9.png)
+            confidence: 숫자 매칭 신뢰도 임계값
+        """
+        self.digit_dir = digit_dir
+        self.confidence = confidence
+        self.templates = TemplateRegistry.for_dir(digit_dir)
+
+    @classmethod
+    def for_template_dir(cls, template_dir, confidence=0.8, create=True):
+        """
+        UI 템플릿 디렉토리의 digits/ 하위 폴더를 사용하는 DigitReader
+
+        Args:
+            template_dir: UI 템플릿 디렉토리 (templates_window / templates_mac)
+            confidence: 숫자 매칭 신뢰도 임계값
+            create: 글리프가 없고 이 OS의 상태바 글꼴(DEFAULT_FONTS)이 있으면 렌더링해서 만듦
+
+        Returns:
+            DigitReader
+        """
+        reader = cls(os.path.join(template_dir, 'digits'), confidence=confidence)
+        if create and not reader.available and platform.system() in DEFAULT_FONTS:
+            try:
+                create_digit_templates(reader.digit_dir)
+                print(f"상태바 숫자 템플릿 생성: {reader.digit_dir}")
+            except OSError as e:
+                print(f"상태바 숫자 템플릿을 만들 수 없습니다 ({e}), 화면 위젯으로 세대원 수 계산")
+        return reader
+
+    @property
+    def available(self):
+        """숫자 템플릿 10개가 모두 있는지 여부"""
+        return all(self.templates.exists(d) for d in DIGITS)
+
+    def read(self, image, region=None):
+        """
+        영역 안의 숫자 읽기
+
+        여러 숫자 묶음이 있으면 가장 오른쪽 묶음("N명"의 N)을 사용한다.
+
+        Args:
+            image: 이미지 경로 또는 프레임 (그레이스케일/BGR)
+            region: (x, y, width, height) 상태바 영역 (None이면 전체)
+
+        Returns:
+            tuple: (숫자 또는 None, 신뢰도) — 읽지 못하면 (None, 0.0)
+        """
+        if not self.available:
+            return None, 0.0
+
+        gray = load_gray(image)
+        if gray is None:
+            raise ValueError("Failed to load image")
+        gray, _ = ImageMatcher._crop(gray, region)
+        if gray is None:
+            return None, 0.0
+
+        # 숫자별 매칭 → (x, 숫자, 점수, 너비)
+        hits = []
+        for digit in DIGITS:
+            template = self.templates.get(digit)
+            if gray.shape[0] < template.height or gray.shape[1] < template.width:
+                continue
+            result = cv2.matchTemplate(gray, template.gray, cv2.TM_CCOEFF_NORMED)
+            boxes, scores = non_max_suppression(result, self.confidence, template.width, template.height)
+            for (x, _, w, _), score in zip(boxes, scores):
+                hits.append((int(x), digit, float(score), int(w)))
+
+        if not hits:
+            return None, 0.0
+
+        # 서로 겹치는 후보 중 점수가 높은 숫자만 남김 (예: 8과 3, 6)
+        kept = []
+        for hit in sorted(hits, key=lambda h: -h[2]):
+            x, _, _, w = hit
+            if all(abs(x - k[0]) >= min(w, k[3]) * 0.6 for k in kept):
+                kept.append(hit)
+        kept.sort()
+
+        # 가까운 숫자끼리 묶기 → 가장 오른쪽 묶음
+        groups = [[kept[0]]]
+        for hit in kept[1:]:
+            prev = groups[-1][-1]
+            if hit[0] - (prev[0] + prev[3]) <= max(prev[3], hit[3]) * 0.8:
+                groups[-1].append(hit)
+            else:
+                groups.append([hit])
+        number = groups[-1]
+
+        value = int(''.join(h[1] for h in number))
+        confidence = min(h[2] for h in number)
+
+        return value, confidence
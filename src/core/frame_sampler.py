@@ -0,0 +1,284 @@
+"""
+MARK:
+백그라운드 프레임 샘플러 모듈
+감시 영역(결과 패널, 상태바 등)을 목표 FPS로 계속 캡처해 영역별 NumPy 링 버퍼에 담고,
+영역이 바뀌면 변경 이벤트를 발행한다. 호출 측은 폴링 대신 이벤트를 기다린다.
+"""
+
+import time
+import threading
+
+import numpy as np
+
+from .capture_backends import CaptureBackend, create_backend
+from .screen_capture import frame_signature, signature_diff
+
+
+class _Watch:
+    """감시 영역 하나의 링 버퍼와 상태"""
+
+    def __init__(self, name, region, buffer_size):
+        x, y, w, h = (int(v) for v in region)
+        self.name = name
+        self.region = (x, y, w, h)
+        self.frames = np.zeros((buffer_size, h, w), dtype=np.uint8)
+        self.times = np.zeros(buffer_size, dtype=np.float64)
+        self.index = -1          # 마지막으로 쓴 링 버퍼 위치
+        self.signature = None
+        self.version = 0         # 변경 이벤트마다 1씩 증가
+        self.changed_at = None
+        self.unchanged = 0       # 마지막 변경 이후 연속으로 같았던 샘플 수
+        self.samples = 0
+
+
+class FrameSampler:
+    """백그라운드 영역 캡처 + 변경 이벤트"""
+
+    def __init__(self, fps=30, buffer_size=8, cpu_budget=0.25, backend='auto',
+                 change_threshold=8, stable_threshold=2):
+        """
+        Args:
+            fps: 목표 샘플링 FPS
+            buffer_size: 영역별 링 버퍼 프레임 수
+            cpu_budget: 샘플러 스레드가 쓸 수 있는 시간 비율 (0~1, 넘으면 샘플링 주기를 늘림)
+            backend: 캡처 백엔드 이름 또는 인스턴스 (인스턴스를 넘기면 clone()으로 새로 만들어
+                메인 스레드와 연결/버퍼를 공유하지 않음)
+            change_threshold: 직전 샘플과의 서명 차이가 이 값을 넘으면 변경 이벤트
+            stable_threshold: 직전 샘플과의 서명 차이가 이 값 이하면 같은 화면
+        """
+        self.fps = fps
+        self.buffer_size = buffer_size
+        self.cpu_budget = cpu_budget
+        self.change_threshold = change_threshold
+        self.stable_threshold = stable_threshold
+        self.backend = backend.clone() if isinstance(backend, CaptureBackend) else create_backend(backend)
+
+        self._watches = {}
+        self._subscribers = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+        # 계측
+        self.frame_count = 0
+        self.dropped_count = 0
+        self.busy_time = 0.0
+        self._started_at = None
+
+    def watch(self, name, region):
+        """
+        감시 영역 등록 (같은 이름이면 교체, 영역이 같으면 그대로 유지)
+
+        Args:
+            name: 영역 이름 ('result_panel', 'status_bar' 등)
+            region: (x, y, width, height) 화면 좌표
+        """
+        region = tuple(int(v) for v in region)
+        with self._condition:
+            current = self._watches.get(name)
+            if current is None or current.region != region:
+                self._watches[name] = _Watch(name, region, self.buffer_size)
+
+    def unwatch(self, name):
+        """감시 영역 해제"""
+        with self._condition:
+            self._watches.pop(name, None)
+
+    def subscribe(self, callback):
+        """
+        변경 이벤트 구독
+
+        Args:
+            callback: callback(name, version, timestamp) — 샘플러 스레드에서 호출됨
+        """
+        self._subscribers.append(callback)
+
+    def start(self):
+        """샘플링 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="FrameSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """샘플링 스레드 종료 및 캡처 백엔드 해제"""
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._running = False
+        with self._condition:
+            self._condition.notify_all()
+        thread.join()
+        self.backend.close()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def versions(self):
+        """
+        영역별 현재 변경 버전 (클릭 전에 받아 두고 wait_for_change에 넘김)
+
+        Returns:
+            dict: {이름: 버전}
+        """
+        with self._condition:
+            return {name: watch.version for name, watch in self._watches.items()}
+
+    def latest(self, name):
+        """
+        영역의 가장 최근 샘플 (복사본)
+
+        Returns:
+            numpy.ndarray or None: 그레이스케일 프레임
+        """
+        with self._condition:
+            watch = self._watches.get(name)
+            if watch is None or watch.index < 0:
+                return None
+            return watch.frames[watch.index].copy()
+
+    def wait_for_change(self, names=None, baseline=None, timeout=3.0):
+        """
+        영역 중 하나에 변경 이벤트가 날 때까지 대기
+
+        Args:
+            names: 영역 이름 리스트 (None이면 전체)
+            baseline: versions() 결과 (None이면 호출 시점 버전)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            tuple or None: (변경된 영역 이름, 걸린 시간(초)), 시간 초과 시 None
+        """
+        start = time.perf_counter()
+        deadline = start + timeout
+        with self._condition:
+            names = list(names or self._watches)
+            if baseline is None:
+                baseline = {name: self._watches[name].version for name in names if name in self._watches}
+            while True:
+                for name in names:
+                    watch = self._watches.get(name)
+                    if watch is not None and watch.version > baseline.get(name, 0):
+                        return name, time.perf_counter() - start
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._running:
+                    return None
+                self._condition.wait(remaining)
+
+    def wait_for_stable(self, names=None, frames=2, timeout=3.0):
+        """
+        영역들이 연속 frames 샘플 동안 바뀌지 않을 때까지 대기
+
+        호출 이후에 새로 찍은 샘플만 센다. 클릭 전부터 바뀌지 않던 영역도 호출 시점(변경 감지 직후)부터
+        다시 frames 샘플을 확인해야 안정으로 본다.
+
+        Args:
+            names: 영역 이름 리스트 (None이면 전체)
+            frames: 연속으로 같아야 하는 샘플 수
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            float or None: 안정될 때까지 걸린 시간 (초), 시간 초과 시 None
+        """
+        start = time.perf_counter()
+        deadline = start + timeout
+        with self._condition:
+            names = list(names or self._watches)
+            since = {name: watch.samples for name, watch in self._watches.items()}
+            while True:
+                watches = [self._watches[name] for name in names if name in self._watches]
+                if all(min(watch.unchanged, watch.samples - since.get(watch.name, 0)) >= frames
+                       for watch in watches):
+                    return time.perf_counter() - start
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._running:
+                    return None
+                self._condition.wait(remaining)
+
+    def stats(self):
+        """
+        샘플링 계측값
+
+        Returns:
+            dict: {'fps': 실제 FPS, 'frames': 샘플 수, 'dropped': 놓친 틱 수,
+                   'cpu': 샘플러 스레드 사용 비율, 'changes': {이름: 변경 횟수}}
+        """
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        with self._condition:
+            changes = {name: watch.version for name, watch in self._watches.items()}
+        return {
+            'fps': self.frame_count / elapsed if elapsed > 0 else 0.0,
+            'frames': self.frame_count,
+            'dropped': self.dropped_count,
+            'cpu': self.busy_time / elapsed if elapsed > 0 else 0.0,
+            'changes': changes,
+        }
+
+    def _run(self):
+        period = 1.0 / self.fps
+        next_tick = time.perf_counter()
+
+        while self._running:
+            tick_start = time.perf_counter()
+            try:
+                self._sample_all()
+            except Exception as e:
+                print(f"프레임 샘플링 오류: {e}")
+            work = time.perf_counter() - tick_start
+            self.busy_time += work
+            self.frame_count += 1
+
+            # CPU 예산을 넘으면 주기를 늘림 (작업 시간 / 예산)
+            interval = max(period, work / self.cpu_budget) if self.cpu_budget > 0 else period
+            next_tick += interval
+            now = time.perf_counter()
+            if now > next_tick:
+                # 목표 시각을 놓친 틱은 건너뛰고 dropped로 기록
+                missed = int((now - next_tick) / interval) + 1
+                self.dropped_count += missed
+                next_tick += missed * interval
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+
+    def _sample_all(self):
+        with self._condition:
+            watches = list(self._watches.values())
+
+        events = []
+        for watch in watches:
+            index = (watch.index + 1) % self.buffer_size
+            buffer = watch.frames[index]
+            frame = self.backend.grab(watch.region, grayscale=True, out=buffer)
+            if frame.shape != buffer.shape:
+                # 화면 경계에서 잘린 영역은 링 버퍼에 맞춰 복사
+                h, w = frame.shape[:2]
+                buffer[:h, :w] = frame
+            elif frame is not buffer:
+                # out 버퍼에 쓰지 않는 백엔드
+                buffer[...] = frame
+            now = time.perf_counter()
+            signature = frame_signature(buffer)
+
+            with self._condition:
+                watch.index = index
+                watch.times[index] = now
+                watch.samples += 1
+                if watch.signature is not None:
+                    diff = signature_diff(signature, watch.signature)
+                    if diff > self.change_threshold:
+                        watch.version += 1
+                        watch.changed_at = now
+                        watch.unchanged = 0
+                        events.append((watch.name, watch.version, now))
+                    elif diff <= self.stable_threshold:
+                        watch.unchanged += 1
+                    else:
+                        watch.unchanged = 0
+                watch.signature = signature
+                self._condition.notify_all()
+
+        for event in events:
+            for callback in self._subscribers:
+                callback(*event)
@@ -0,0 +1,166 @@
+"""
+MARK:
+스크린샷 보관 정책 모듈
+최근 프레임만 메모리 링 버퍼에 두고, 오류가 났을 때나 샘플링 주기에만 디스크에 쓴다.
+PNG 인코딩/쓰기는 백그라운드 스레드에서 빠른 압축 수준으로 처리한다.
+"""
+
+import os
+import queue
+import threading
+import itertools
+from collections import deque
+from datetime import datetime
+
+import cv2
+
+
+class FrameStore:
+    """최근 프레임 링 버퍼 + 백그라운드 PNG 저장"""
+
+    def __init__(self, output_dir="tmp/screenshots", capacity=10, sample_every=0, compression=1):
+        """
+        Args:
+            output_dir: 저장 디렉토리
+            capacity: 메모리에 보관할 최근 프레임 수
+            sample_every: N 프레임마다 1장 저장 (0이면 오류 시에만 저장)
+            compression: PNG 압축 수준 (0~9, 낮을수록 빠름)
+        """
+        self.output_dir = output_dir
+        self.capacity = capacity
+        self.sample_every = sample_every
+        self.compression = compression
+
+        # (순번, 시각, 접두어, 프레임)
+        self.frames = deque(maxlen=capacity)
+        self._seq = itertools.count(1)
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+        self.saved_count = 0
+        self.failed_count = 0
+
+    def add(self, frame, prefix="fullscreen"):
+        """
+        프레임을 링 버퍼에 추가 (sample_every 주기에 해당하면 저장 예약)
+
+        프레임은 복사하지 않으므로, 재사용 버퍼(out=)로 캡처한 프레임은 복사해서 넘긴다.
+
+        Args:
+            frame: 프레임 (NumPy 배열)
+            prefix: 파일명 접두어
+
+        Returns:
+            str or None: 저장 예약된 경우 파일 경로
+        """
+        seq = next(self._seq)
+        entry = (seq, datetime.now(), prefix, frame)
+        self.frames.append(entry)
+
+        if self.sample_every and seq % self.sample_every == 0:
+            return self._enqueue(entry)
+        return None
+
+    def persist(self, count=None, reason=None):
+        """
+        링 버퍼의 최근 프레임을 디스크에 저장 (오류 발생 시 호출)
+
+        Args:
+            count: 저장할 최근 프레임 수 (None이면 전부)
+            reason: 로그에 남길 사유
+
+        Returns:
+            list: 저장 예약된 파일 경로
+        """
+        entries = list(self.frames)
+        if count is not None:
+            entries = entries[-count:] if count > 0 else []
+        self.frames.clear()
+
+        # 샘플링으로 이미 저장된 프레임은 제외
+        if self.sample_every:
+            entries = [entry for entry in entries if entry[0] % self.sample_every]
+
+        paths = [self._enqueue(entry) for entry in entries]
+        if paths:
+            print(f"   스크린샷 {len(paths)}장 저장" + (f" ({reason})" if reason else "") + f": {self.output_dir}")
+        return paths
+
+    def save(self, frame, prefix="fullscreen"):
+        """
+        주어진 프레임을 백그라운드에서 저장 (링 버퍼와 무관)
+
+        Returns:
+            str: 저장 예약된 파일 경로
+        """
+        return self._enqueue((next(self._seq), datetime.now(), prefix, frame))
+
+    def next_path(self, prefix="fullscreen"):
+        """
+        겹치지 않는 새 파일 경로 (같은 초에 여러 장이어도 순번으로 구분)
+
+        Returns:
+            str: 파일 경로
+        """
+        return self._path(next(self._seq), datetime.now(), prefix)
+
+    def write(self, frame, path):
+        """
+        프레임을 즉시 PNG로 저장 (호출 스레드에서 실행)
+
+        Returns:
+            bool: 성공 여부
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return cv2.imwrite(path, frame, [cv2.IMWRITE_PNG_COMPRESSION, self.compression])
+
+    def flush(self):
+        """예약된 저장이 모두 끝날 때까지 대기"""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self):
+        """예약된 저장을 마치고 저장 스레드 종료"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+    def _path(self, seq, timestamp, prefix):
+        name = f"{prefix}_{timestamp.strftime('%Y%m%d_%H%M%S')}_{seq:06d}.png"
+        return os.path.join(self.output_dir, name)
+
+    def _enqueue(self, entry):
+        seq, timestamp, prefix, frame = entry
+        path = self._path(seq, timestamp, prefix)
+        self._start_writer()
+        self._queue.put((frame, path))
+        return path
+
+    def _start_writer(self):
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer, name="FrameStoreWriter", daemon=True)
+                self._writer.start()
+
+    def _run_writer(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                frame, path = item
+                if self.write(frame, path):
+                    self.saved_count += 1
+                else:
+                    self.failed_count += 1
+                    print(f"스크린샷 저장 실패: {path}")
+            except Exception as e:
+                self.failed_count += 1
+                print(f"스크린샷 저장 실패: {e}")
+            finally:
+                self._queue.task_done()
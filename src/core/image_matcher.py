@@ -4,31 +4,242 @@ MARK:
 OpenCV를 사용한 템플릿 매칭으로 UI 요소 찾기
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
 from PIL import Image
 
+from .template_registry import Template, build_pyramid
+
+
+# 다중 배율 검색 시 기본 배율 (템플릿 캡처 배율 대비 100/125/150% 및 역방향)
+DPI_SCALES = (1.0, 1.25, 1.5, 0.8, 0.67)
+
+
+def load_gray(image):
+    """
+    이미지 경로 또는 프레임을 그레이스케일 배열로 변환
+
+    Args:
+        image: 이미지 경로(str), 프레임(numpy.ndarray, BGR/BGRA/그레이스케일) 또는 Template
+
+    Returns:
+        numpy.ndarray or None: 그레이스케일 이미지 (로드 실패 시 None)
+    """
+    if isinstance(image, Template):
+        return image.gray
+    if isinstance(image, str):
+        return cv2.imread(image, cv2.IMREAD_GRAYSCALE)
+    if image is None or image.ndim == 2:
+        return image
+    if image.shape[2] == 4:
+        return cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def load_color(image):
+    """
+    이미지 경로 또는 프레임을 BGR 컬러 배열로 변환
+
+    Args:
+        image: 이미지 경로(str), 프레임(numpy.ndarray) 또는 Template
+
+    Returns:
+        numpy.ndarray or None: BGR 이미지 (로드 실패 시 None)
+    """
+    if isinstance(image, Template):
+        return image.color
+    if isinstance(image, str):
+        return cv2.imread(image)
+    if image is None or (image.ndim == 3 and image.shape[2] == 3):
+        return image
+    if image.ndim == 2:
+        return cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+    return cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+
+
+def clip_region(region, shape):
+    """
+    영역을 이미지 경계 안으로 자르기
+
+    Args:
+        region: (x, y, width, height)
+        shape: 이미지 shape (height, width[, channels])
+
+    Returns:
+        tuple or None: 잘린 (x, y, width, height), 겹치는 부분이 없으면 None
+    """
+    x, y, w, h = region
+    x1, y1 = max(0, int(x)), max(0, int(y))
+    x2, y2 = min(shape[1], int(x + w)), min(shape[0], int(y + h))
+    if x2 <= x1 or y2 <= y1:
+        return None
+    return (x1, y1, x2 - x1, y2 - y1)
+
+
+def pad_region(x, y, width, height, padding):
+    """
+    영역을 사방으로 padding 만큼 확장
+
+    Returns:
+        tuple: (x, y, width, height)
+    """
+    return (x - padding, y - padding, width + 2 * padding, height + 2 * padding)
+
+
+def non_max_suppression(result, threshold, width, height, iou_threshold=0.3, max_candidates=500):
+    """
+    매칭 결과 맵에서 중복을 제거한 매칭 박스 추출
+
+    임계값 이상인 지역 최댓값(팽창 연산으로 판별)만 후보로 삼고, 점수 상위
+    max_candidates개로 제한한 뒤 벡터화된 IoU 억제를 수행한다.
+    최악의 경우에도 비용은 O(max_candidates^2)로 제한된다.
+
+    Args:
+        result: cv2.matchTemplate 결과 (float32, 클수록 일치)
+        threshold: 신뢰도 임계값
+        width, height: 템플릿 크기 (박스 크기)
+        iou_threshold: 이 값보다 많이 겹치면 중복으로 간주
+        max_candidates: 억제 단계에 넘길 최대 후보 수
+
+    Returns:
+        tuple: (boxes, scores)
+            boxes: (N, 4) int 배열 [x, y, width, height] (위→아래, 왼쪽→오른쪽 순)
+            scores: (N,) float 배열
+    """
+    # 지역 최댓값 마스크 (템플릿 절반 크기 이웃 안에서 최대인 점)
+    kernel = np.ones((max(3, height // 2 | 1), max(3, width // 2 | 1)), dtype=np.uint8)
+    peaks = (result >= threshold) & (result >= cv2.dilate(result, kernel))
+
+    ys, xs = np.nonzero(peaks)
+    scores = result[ys, xs]
+
+    # 후보 수 제한 (점수 상위 max_candidates개)
+    if len(scores) > max_candidates:
+        top = np.argpartition(-scores, max_candidates)[:max_candidates]
+        xs, ys, scores = xs[top], ys[top], scores[top]
+
+    order = np.argsort(-scores)
+    xs, ys, scores = xs[order], ys[order], scores[order]
+
+    # 크기가 같은 박스끼리의 IoU 억제
+    area = float(width * height)
+    keep = []
+    remaining = np.arange(len(scores))
+    while remaining.size:
+        i = remaining[0]
+        keep.append(i)
+        rest = remaining[1:]
+        overlap_w = np.clip(width - np.abs(xs[rest] - xs[i]), 0, None)
+        overlap_h = np.clip(height - np.abs(ys[rest] - ys[i]), 0, None)
+        inter = overlap_w * overlap_h
+        iou = inter / (2 * area - inter)
+        remaining = rest[iou <= iou_threshold]
+
+    keep = np.array(keep, dtype=int)
+    boxes = np.stack([
+        xs[keep], ys[keep],
+        np.full(len(keep), width), np.full(len(keep), height)
+    ], axis=1).astype(int) if len(keep) else np.zeros((0, 4), dtype=int)
+    scores = scores[keep].astype(float)
+
+    # 읽기 순서로 정렬
+    reading = np.lexsort((boxes[:, 0], boxes[:, 1]))
+    return boxes[reading], scores[reading]
+
+
+def union_region(*regions):
+    """
+    여러 영역을 모두 포함하는 최소 영역 (None은 무시)
+
+    Returns:
+        tuple or None: (x, y, width, height)
+    """
+    regions = [r for r in regions if r is not None]
+    if not regions:
+        return None
+    x1 = min(r[0] for r in regions)
+    y1 = min(r[1] for r in regions)
+    x2 = max(r[0] + r[2] for r in regions)
+    y2 = max(r[1] + r[3] for r in regions)
+    return (x1, y1, x2 - x1, y2 - y1)
+
 
 class ImageMatcher:
     """이미지 템플릿 매칭"""
     
-    def __init__(self, confidence=0.8):
+    def __init__(self, confidence=0.8, templates=None, max_workers=4):
         """
         초기화
         
         Args:
             confidence: 매칭 신뢰도 임계값 (0.0 ~ 1.0)
+            templates: TemplateRegistry (find_many에서 템플릿 이름 조회용)
+            max_workers: find_many 동시 매칭 스레드 수
         """
         self.confidence = confidence
+        self.templates = templates
+        self.max_workers = max_workers
+        self._executor = None
+    
+    def find_many(self, screenshot, names, regions=None, pyramid=False, scales=None):
+        """
+        한 프레임에서 여러 템플릿을 한 번에 찾기
+
+        OpenCV 매칭은 GIL을 해제하므로 템플릿별 매칭을 작은 스레드 풀에서 동시에 실행한다.
+
+        Args:
+            screenshot: 스크린샷 이미지 경로 또는 프레임 (numpy.ndarray)
+            names: 템플릿 이름 리스트 ('input_field', 'search_button', ...)
+            regions: {이름: (x, y, width, height)} 템플릿별 검색 영역 (없으면 전체 화면)
+            pyramid: True면 find_template_pyramid 사용
+            scales: pyramid 모드에서 시도할 템플릿 배율
+
+        Returns:
+            dict: {이름: find_template 결과 또는 None}
+
+        Raises:
+            ValueError: templates 레지스트리가 없거나 이미지를 읽을 수 없을 때
+            FileNotFoundError: 템플릿 파일이 없을 때
+        """
+        if self.templates is None:
+            raise ValueError("find_many requires a TemplateRegistry")
+
+        screenshot = load_gray(screenshot)
+        if screenshot is None:
+            raise ValueError("Failed to load images")
+
+        regions = regions or {}
+        templates = {name: self.templates.get(name) for name in names}
+
+        def match(name):
+            if pyramid:
+                return self.find_template_pyramid(
+                    screenshot, templates[name], scales=scales, region=regions.get(name)
+                )
+            return self.find_template(screenshot, templates[name], region=regions.get(name))
+
+        if len(templates) <= 1:
+            return {name: match(name) for name in templates}
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="matcher"
+            )
+
+        futures = {name: self._executor.submit(match, name) for name in templates}
+        return {name: future.result() for name, future in futures.items()}
     
-    def find_template(self, screenshot_path, template_path, method=cv2.TM_CCOEFF_NORMED):
+    def find_template(self, screenshot, template, method=cv2.TM_CCOEFF_NORMED, region=None):
         """
         스크린샷에서 템플릿 이미지 찾기
         
         Args:
-            screenshot_path: 스크린샷 이미지 경로
-            template_path: 템플릿 이미지 경로
+            screenshot: 스크린샷 이미지 경로 또는 프레임 (numpy.ndarray)
+            template: 템플릿 이미지 경로, 프레임 (numpy.ndarray) 또는 Template
             method: OpenCV 매칭 방법
+            region: (x, y, width, height) 검색 영역 (None이면 전체 화면)
             
         Returns:
             dict or None: {
@@ -41,9 +252,12 @@ class ImageMatcher:
                 'center_y': 중심 y
             }
         """
+        # 투명 영역이 있는 템플릿은 마스크 적용
+        mask = template.mask if isinstance(template, Template) and template.has_mask else None
+
         # 이미지 로드 (그레이스케일)
-        screenshot = cv2.imread(screenshot_path, cv2.IMREAD_GRAYSCALE)
-        template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
+        screenshot = load_gray(screenshot)
+        template = load_gray(template)
         
         if screenshot is None or template is None:
             raise ValueError("Failed to load images")
@@ -51,8 +265,14 @@ class ImageMatcher:
         # 템플릿 크기
         h, w = template.shape
         
+        # 검색 영역 제한 (ROI)
+        screenshot, (offset_x, offset_y) = self._crop(screenshot, region)
+        if screenshot is None or screenshot.shape[0] < h or screenshot.shape[1] < w:
+            print(f"     검색 영역이 템플릿보다 작습니다: {region}")
+            return None
+        
         # 템플릿 매칭
-        result = cv2.matchTemplate(screenshot, template, method)
+        result = cv2.matchTemplate(screenshot, template, method, mask=mask)
         min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
         
         # 매칭 방법에 따라 최적 위치 선택
@@ -70,8 +290,8 @@ class ImageMatcher:
             return None
         print(f"     매칭 성공!")
         
-        # 결과 반환
-        x, y = top_left
+        # 결과 반환 (검색 영역 기준 → 스크린샷 기준 좌표)
+        x, y = top_left[0] + offset_x, top_left[1] + offset_y
         center_x = x + w // 2
         center_y = y + h // 2
         
@@ -85,24 +305,203 @@ class ImageMatcher:
             'center_y': center_y
         }
     
-    def find_all_templates(self, screenshot_path, template_path, threshold=None):
+    def verify(self, screenshot, template, region, border=0):
+        """
+        알려진 위치의 화면 조각이 템플릿과 같은지 확인 (검색 없이 템플릿 크기 조각 1회 NCC)
+
+        Args:
+            screenshot: 스크린샷 이미지 경로 또는 프레임 (numpy.ndarray)
+            template: 템플릿 이미지 경로, 프레임 (numpy.ndarray) 또는 Template
+            region: (x, y, width, height) 확인할 위치 (템플릿과 크기가 다르면 템플릿을 맞춰 축소/확대)
+            border: 0보다 크면 가장자리 border 픽셀 띠만 비교 (입력 필드처럼 안쪽 내용이 바뀌는 요소)
+
+        Returns:
+            float: 정규화 상관계수 (영역이 화면 밖이거나 비교할 수 없으면 0.0)
+        """
+        mask = template.mask if isinstance(template, Template) and template.has_mask else None
+
+        screenshot = load_gray(screenshot)
+        template = load_gray(template)
+        if screenshot is None or template is None:
+            raise ValueError("Failed to load images")
+
+        x, y, w, h = (int(v) for v in region)
+        patch, _ = self._crop(screenshot, (x, y, w, h))
+        if patch is None or patch.shape != (h, w):
+            return 0.0
+
+        # pyramid 모드에서 다른 배율로 찾은 위치면 템플릿을 그 크기로 맞춤
+        if template.shape != (h, w):
+            template = cv2.resize(template, (w, h), interpolation=cv2.INTER_AREA)
+            if mask is not None:
+                mask = cv2.resize(mask, (w, h), interpolation=cv2.INTER_NEAREST)
+
+        selected = np.ones((h, w), dtype=bool) if mask is None else mask > 0
+        if border > 0 and h > 2 * border and w > 2 * border:
+            selected[border:h - border, border:w - border] = False
+
+        # 선택한 픽셀만으로 TM_CCOEFF_NORMED와 같은 값 계산
+        a = patch[selected].astype(np.float32)
+        b = template[selected].astype(np.float32)
+        a -= a.mean()
+        b -= b.mean()
+        denominator = float(np.sqrt((a * a).sum() * (b * b).sum()))
+        # 단색 조각 등 분산이 0이면 비교할 수 없음
+        return float((a * b).sum()) / denominator if denominator > 0 else 0.0
+
+    def find_template_pyramid(self, screenshot, template, levels=2, scales=None, region=None,
+                              candidates=3, refine_margin=4):
         """
-        스크린샷에서 템플릿의 모든 매칭 위치 찾기
+        피라미드(coarse-to-fine) 방식으로 템플릿 찾기
+
+        축소(1/2, 1/4) 화면에서 후보 위치를 찾은 뒤 원본 해상도의 작은 창에서만
+        다시 매칭한다. scales를 주면 여러 배율의 템플릿을 시도해 DPI 배율 차이에 대응한다.
+
+        Args:
+            screenshot: 스크린샷 이미지 경로 또는 프레임 (numpy.ndarray)
+            template: 템플릿 이미지 경로, 프레임 (numpy.ndarray) 또는 Template
+            levels: 축소 단계 수 (2 → 1/4 해상도에서 후보 탐색)
+            scales: 템플릿 배율 목록 (None이면 (1.0,), 예: DPI_SCALES)
+            region: (x, y, width, height) 검색 영역 (None이면 전체 화면)
+            candidates: 축소 화면에서 정밀 매칭할 후보 수
+            refine_margin: 원본 해상도 정밀 매칭 창의 추가 여백 (픽셀)
+
+        Returns:
+            dict or None: find_template 결과 + 'scale': 매칭된 템플릿 배율
+        """
+        screenshot = load_gray(screenshot)
+        template_gray = load_gray(template)
+
+        if screenshot is None or template_gray is None:
+            raise ValueError("Failed to load images")
+
+        # 검색 영역 제한 (ROI)
+        screenshot, (offset_x, offset_y) = self._crop(screenshot, region)
+        if screenshot is None:
+            print(f"     검색 영역이 비어 있습니다: {region}")
+            return None
+
+        frame_pyramid = build_pyramid(screenshot, levels)
+
+        best = None
+        for scale in (scales or (1.0,)):
+            if isinstance(template, Template):
+                template_pyramid = template.scaled_pyramid(scale)
+            else:
+                scaled = template_gray if scale == 1.0 else cv2.resize(
+                    template_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                template_pyramid = build_pyramid(scaled, levels)
+
+            match = self._match_coarse_to_fine(frame_pyramid, template_pyramid, candidates, refine_margin)
+            if match is not None and (best is None or match['confidence'] > best['confidence']):
+                match['scale'] = scale
+                best = match
+
+        if best is None:
+            print(f"     매칭 후보가 없습니다!")
+            return None
+
+        # 신뢰도 체크
+        print(f"     매칭 신뢰도: {best['confidence']:.2f} (임계값: {self.confidence:.2f}, 배율: {best['scale']})")
+        if best['confidence'] < self.confidence:
+            print(f"     신뢰도가 임계값보다 낮습니다!")
+            return None
+        print(f"     매칭 성공!")
+
+        x, y = best['x'] + offset_x, best['y'] + offset_y
+        w, h = best['width'], best['height']
+
+        return {
+            'x': x,
+            'y': y,
+            'width': w,
+            'height': h,
+            'confidence': best['confidence'],
+            'center_x': x + w // 2,
+            'center_y': y + h // 2,
+            'scale': best['scale']
+        }
+
+    @staticmethod
+    def _match_coarse_to_fine(frame_pyramid, template_pyramid, candidates, refine_margin):
+        """
+        축소 단계에서 후보를 찾고 원본 해상도에서 정밀 매칭
+
+        Returns:
+            dict or None: {'x', 'y', 'width', 'height', 'confidence'} (프레임 기준)
+        """
+        frame = frame_pyramid[0]
+        template = template_pyramid[0]
+        h, w = template.shape
+
+        if frame.shape[0] < h or frame.shape[1] < w:
+            return None
+
+        # 프레임/템플릿 모두 존재하고 템플릿이 프레임에 들어가는 가장 거친 단계
+        level = min(len(frame_pyramid), len(template_pyramid)) - 1
+        while level > 0 and (frame_pyramid[level].shape[0] < template_pyramid[level].shape[0] or
+                             frame_pyramid[level].shape[1] < template_pyramid[level].shape[1]):
+            level -= 1
+
+        if level == 0:
+            result = cv2.matchTemplate(frame, template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return {'x': max_loc[0], 'y': max_loc[1], 'width': w, 'height': h,
+                    'confidence': float(max_val)}
+
+        coarse_template = template_pyramid[level]
+        coarse = cv2.matchTemplate(frame_pyramid[level], coarse_template, cv2.TM_CCOEFF_NORMED)
+        factor = 2 ** level
+        margin = factor + refine_margin
+        th, tw = coarse_template.shape
+
+        best = None
+        for _ in range(candidates):
+            _, coarse_val, _, (cx, cy) = cv2.minMaxLoc(coarse)
+            if not np.isfinite(coarse_val) or coarse_val <= -1:
+                break
+
+            # 같은 후보가 다시 선택되지 않도록 주변 억제
+            coarse[max(0, cy - th // 2):cy + th // 2 + 1, max(0, cx - tw // 2):cx + tw // 2 + 1] = -1
+
+            # 원본 해상도의 작은 창에서 정밀 매칭
+            window = clip_region(
+                (cx * factor - margin, cy * factor - margin, w + 2 * margin, h + 2 * margin),
+                frame.shape
+            )
+            if window is None or window[2] < w or window[3] < h:
+                continue
+
+            wx, wy, ww, wh = window
+            fine = cv2.matchTemplate(frame[wy:wy + wh, wx:wx + ww], template, cv2.TM_CCOEFF_NORMED)
+            _, max_val, _, max_loc = cv2.minMaxLoc(fine)
+
+            if best is None or max_val > best['confidence']:
+                best = {'x': wx + max_loc[0], 'y': wy + max_loc[1], 'width': w, 'height': h,
+                        'confidence': float(max_val)}
+
+        return best
+    
+    def find_all_templates(self, screenshot, template, threshold=None, region=None, iou_threshold=0.3):
+        """
+        스크린샷에서 템플릿의 모든 매칭 위치 찾기 (중복 제거)
         
         Args:
-            screenshot_path: 스크린샷 이미지 경로
-            template_path: 템플릿 이미지 경로
+            screenshot: 스크린샷 이미지 경로 또는 프레임 (numpy.ndarray)
+            template: 템플릿 이미지 경로, 프레임 (numpy.ndarray) 또는 Template
             threshold: 신뢰도 임계값 (None이면 self.confidence 사용)
+            region: (x, y, width, height) 검색 영역 (None이면 전체 화면)
+            iou_threshold: 이 값보다 많이 겹치는 매칭은 하나로 간주
             
         Returns:
-            list: 매칭 결과 리스트
+            list: 매칭 결과 리스트 (위→아래, 왼쪽→오른쪽 순)
         """
         if threshold is None:
             threshold = self.confidence
         
         # 이미지 로드
-        screenshot = cv2.imread(screenshot_path, cv2.IMREAD_GRAYSCALE)
-        template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
+        screenshot = load_gray(screenshot)
+        template = load_gray(template)
         
         if screenshot is None or template is None:
             raise ValueError("Failed to load images")
@@ -110,16 +509,20 @@ class ImageMatcher:
         # 템플릿 크기
         h, w = template.shape
         
+        # 검색 영역 제한 (ROI)
+        screenshot, (offset_x, offset_y) = self._crop(screenshot, region)
+        if screenshot is None or screenshot.shape[0] < h or screenshot.shape[1] < w:
+            return []
+        
         # 템플릿 매칭
         result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
         
-        # 임계값 이상인 위치 찾기
-        locations = np.where(result >= threshold)
+        # 임계값 이상인 위치 찾기 + 중복 제거
+        boxes, scores = non_max_suppression(result, threshold, w, h, iou_threshold=iou_threshold)
         
         matches = []
-        for pt in zip(*locations[::-1]):
-            x, y = pt
-            confidence = result[y, x]
+        for (x, y, _, _), confidence in zip(boxes, scores):
+            x, y = int(x) + offset_x, int(y) + offset_y
             center_x = x + w // 2
             center_y = y + h // 2
             
@@ -135,17 +538,33 @@ class ImageMatcher:
         
         return matches
     
-    def draw_matches(self, screenshot_path, matches, output_path):
+    @staticmethod
+    def _crop(image, region):
+        """
+        검색 영역만 잘라내기 (복사 없이 뷰 반환)
+
+        Returns:
+            tuple: (잘린 이미지 또는 None, (offset_x, offset_y))
+        """
+        if region is None:
+            return image, (0, 0)
+        clipped = clip_region(region, image.shape)
+        if clipped is None:
+            return None, (0, 0)
+        x, y, w, h = clipped
+        return image[y:y + h, x:x + w], (x, y)
+    
+    def draw_matches(self, screenshot, matches, output_path):
         """
         매칭 결과를 이미지에 표시
         
         Args:
-            screenshot_path: 스크린샷 이미지 경로
+            screenshot: 스크린샷 이미지 경로 또는 프레임 (numpy.ndarray)
             matches: 매칭 결과 리스트
             output_path: 출력 이미지 경로
         """
-        # 이미지 로드 (컬러)
-        screenshot = cv2.imread(screenshot_path)
+        # 이미지 로드 (컬러, 원본 프레임은 변경하지 않음)
+        screenshot = load_color(screenshot).copy()
         
         # 매칭 위치에 사각형 그리기
         for match in matches:
@@ -171,12 +590,12 @@ class ColorMatcher:
     """색상 기반 매칭 (체크박스 등)"""
     
     @staticmethod
-    def find_by_color(image_path, lower_color, upper_color):
+    def find_by_color(image, lower_color, upper_color):
         """
         특정 색상 범위의 영역 찾기
         
         Args:
-            image_path: 이미지 경로
+            image: 이미지 경로 또는 BGR 프레임 (numpy.ndarray)
             lower_color: 하한 색상 (B, G, R)
             upper_color: 상한 색상 (B, G, R)
             
@@ -184,7 +603,11 @@ class ColorMatcher:
             list: 매칭된 영역 리스트 [(x, y, w, h), ...]
         """
         # 이미지 로드
-        image = cv2.imread(image_path)
+        if isinstance(image, np.ndarray) and image.ndim == 2:
+            raise ValueError("Color matching requires a BGR frame, got grayscale")
+        image = load_color(image)
+        if image is None:
+            raise ValueError("Failed to load image")
         
         # 색상 범위로 마스크 생성
         mask = cv2.inRange(image, np.array(lower_color), np.array(upper_color))
@@ -200,6 +623,164 @@ class ColorMatcher:
         
         return regions
 
+    @staticmethod
+    def find_panel(image, region=None, min_brightness=250, min_area=0.2):
+        """
+        흰색 결과 패널(캔버스) 영역 찾기
+
+        창 배경(#f0f0f0)보다 밝은 가장 큰 연결 영역을 결과 패널로 본다.
+
+        Args:
+            image: 이미지 경로 또는 프레임 (그레이스케일/BGR)
+            region: (x, y, width, height) 검색 영역 (None이면 전체)
+            min_brightness: 패널 배경으로 볼 최소 밝기
+            min_area: 검색 영역 대비 패널 최소 면적 비율
+
+        Returns:
+            tuple or None: 패널 (x, y, width, height) (프레임 기준)
+        """
+        gray, (offset_x, offset_y) = ColorMatcher._gray_roi(image, region)
+        if gray is None:
+            return None
+
+        bright = (gray >= min_brightness).astype(np.uint8)
+        n, _, stats, _ = cv2.connectedComponentsWithStats(bright, connectivity=4)
+        if n <= 1:
+            return None
+
+        # 0번은 배경(어두운 영역), 나머지 중 가장 큰 밝은 영역
+        largest = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        x, y, w, h, area = stats[largest]
+        if area < gray.size * min_area:
+            return None
+
+        return (int(x) + offset_x, int(y) + offset_y, int(w), int(h))
+
+    @staticmethod
+    def box_size_from_template(template, dark_threshold=160):
+        """
+        체크박스 템플릿에서 어두운 테두리의 크기 추정
+
+        Args:
+            template: 템플릿 이미지 경로, 프레임 또는 Template
+            dark_threshold: 이 밝기 미만을 잉크(테두리/글자)로 판단
+
+        Returns:
+            tuple or None: (width, height)
+        """
+        gray = load_gray(template)
+        if gray is None:
+            return None
+
+        dark = (gray < dark_threshold).astype(np.uint8)
+        n, _, stats, _ = cv2.connectedComponentsWithStats(dark, connectivity=8)
+        if n <= 1:
+            return None
+
+        largest = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        return (int(stats[largest, cv2.CC_STAT_WIDTH]), int(stats[largest, cv2.CC_STAT_HEIGHT]))
+
+    @staticmethod
+    def find_checkboxes(image, region=None, box_size=(14, 14), size_tolerance=0.25,
+                        dark_threshold=160, column_tolerance=3):
+        """
+        템플릿 매칭 없이 체크박스 찾기 (연결 요소 분석)
+
+        어두운 픽셀을 이진화한 뒤 체크박스 크기의 정사각형 연결 요소만 남기고,
+        세로로 정렬된 가장 큰 열(체크박스 열)을 고른다.
+
+        Args:
+            image: 이미지 경로 또는 프레임 (그레이스케일/BGR)
+            region: (x, y, width, height) 결과 패널 영역 (None이면 전체)
+            box_size: 체크박스 테두리 크기 (width, height), box_size_from_template로 추정 가능
+            size_tolerance: 크기 허용 오차 비율
+            dark_threshold: 이 밝기 미만을 잉크로 판단
+            column_tolerance: 같은 열로 볼 x 좌표 차이 (픽셀)
+
+        Returns:
+            list: 체크박스 영역 리스트 [(x, y, w, h), ...] (위→아래 순, 프레임 기준)
+        """
+        gray, (offset_x, offset_y) = ColorMatcher._gray_roi(image, region)
+        if gray is None:
+            return []
+
+        dark = (gray < dark_threshold).astype(np.uint8)
+        n, _, stats, _ = cv2.connectedComponentsWithStats(dark, connectivity=8)
+        if n <= 1:
+            return []
+
+        stats = stats[1:]
+        widths = stats[:, cv2.CC_STAT_WIDTH]
+        heights = stats[:, cv2.CC_STAT_HEIGHT]
+        box_w, box_h = box_size
+
+        # 체크박스 크기의 정사각형 요소만
+        candidates = stats[
+            (np.abs(widths - box_w) <= box_w * size_tolerance) &
+            (np.abs(heights - box_h) <= box_h * size_tolerance) &
+            (np.abs(widths - heights) <= np.maximum(widths, heights) * size_tolerance)
+        ]
+        if len(candidates) == 0:
+            return []
+
+        # x 좌표로 열 묶기 → 가장 많은 요소가 있는 열 (동률이면 더 정사각형에 가까운 열)
+        xs = candidates[:, cv2.CC_STAT_LEFT]
+        best = None
+        for x in np.unique(xs):
+            column = candidates[np.abs(xs - x) <= column_tolerance]
+            squareness = float(np.mean(np.abs(column[:, cv2.CC_STAT_WIDTH] - column[:, cv2.CC_STAT_HEIGHT])))
+            key = (len(column), -squareness)
+            if best is None or key > best[0]:
+                best = (key, column)
+
+        column = best[1]
+        column = column[np.argsort(column[:, cv2.CC_STAT_TOP])]
+
+        return [
+            (int(c[cv2.CC_STAT_LEFT]) + offset_x, int(c[cv2.CC_STAT_TOP]) + offset_y,
+             int(c[cv2.CC_STAT_WIDTH]), int(c[cv2.CC_STAT_HEIGHT]))
+            for c in column
+        ]
+
+    @staticmethod
+    def find_rows(image, region=None, dark_threshold=160, min_height=5, min_ink=2):
+        """
+        가로 투영(projection profile)으로 텍스트/항목 행 찾기
+
+        Args:
+            image: 이미지 경로 또는 프레임 (그레이스케일/BGR)
+            region: (x, y, width, height) 결과 패널 영역 (None이면 전체)
+            dark_threshold: 이 밝기 미만을 잉크로 판단
+            min_height: 이보다 낮은 행(구분선 등)은 무시 (픽셀)
+            min_ink: 행으로 볼 최소 잉크 픽셀 수
+
+        Returns:
+            list: 행 리스트 [(y, height), ...] (프레임 기준)
+        """
+        gray, (_, offset_y) = ColorMatcher._gray_roi(image, region)
+        if gray is None:
+            return []
+
+        # 행별 잉크 픽셀 수 → 잉크가 있는 연속 구간
+        profile = np.count_nonzero(gray < dark_threshold, axis=1) >= min_ink
+        edges = np.diff(np.concatenate(([0], profile.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        return [
+            (int(start) + offset_y, int(end - start))
+            for start, end in zip(starts, ends)
+            if end - start >= min_height
+        ]
+
+    @staticmethod
+    def _gray_roi(image, region):
+        """그레이스케일 변환 후 영역 자르기 → (이미지 또는 None, (offset_x, offset_y))"""
+        gray = load_gray(image)
+        if gray is None:
+            raise ValueError("Failed to load image")
+        return ImageMatcher._crop(gray, region)
+
 
 if __name__ == "__main__":
     # 테스트
@@ -0,0 +1,111 @@
+"""
+MARK:
+조회 간격 자동 조절 모듈 (AIMD)
+건마다 결과 표시 지연과 오류 여부를 받아, 정상이면 간격을 조금씩 줄이고
+오류/화면 변화 없음/급격한 지연 증가가 보이면 간격을 배로 늘린다.
+"""
+
+import time
+
+
+class PacingController:
+    """조회 간 대기 시간 제어 (가산 감소 / 승산 증가)"""
+
+    def __init__(self, initial_gap=0.2, min_gap=0.0, max_gap=2.0, step=0.02, backoff=2.0,
+                 slow_factor=2.0, smoothing=0.2):
+        """
+        Args:
+            initial_gap: 시작 간격 (초)
+            min_gap: 최소 간격 (초)
+            max_gap: 최대 간격 (초)
+            step: 정상 처리 1건마다 줄이는 간격 (초)
+            backoff: 오류 시 간격 배율
+            slow_factor: 표시 지연이 평균의 이 배수를 넘으면 느려진 것으로 보고 간격을 늘림
+            smoothing: 지연/오류율 지수 이동 평균 가중치
+        """
+        self.gap = initial_gap
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+        self.step = step
+        self.backoff = backoff
+        self.slow_factor = slow_factor
+        self.smoothing = smoothing
+
+        self.latency_avg = None
+        self.error_rate = 0.0
+        self.count = 0
+        self.backoffs = 0
+        self.slept = 0.0
+        # (순번, 다음 간격, 표시 지연, 성공 여부, 사유)
+        self.history = []
+
+    def wait(self):
+        """
+        다음 조회 전 현재 간격만큼 대기
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        if self.gap > 0:
+            time.sleep(self.gap)
+            self.slept += self.gap
+        return self.gap
+
+    def update(self, latency=None, ok=True, stale=False):
+        """
+        한 건의 결과로 간격 조절
+
+        Args:
+            latency: 결과 표시까지 걸린 시간 (초, 모르면 None)
+            ok: 조회 성공 여부
+            stale: 결과 화면이 바뀌지 않았는지 여부 (대기 시간 초과)
+
+        Returns:
+            float: 조절된 간격 (초)
+        """
+        self.count += 1
+        a = self.smoothing
+
+        slow = (latency is not None and self.latency_avg is not None
+                and latency > self.latency_avg * self.slow_factor)
+        if latency is not None:
+            self.latency_avg = latency if self.latency_avg is None else (1 - a) * self.latency_avg + a * latency
+        self.error_rate = (1 - a) * self.error_rate + a * (0.0 if ok else 1.0)
+
+        if not ok or stale or slow:
+            reason = 'error' if not ok else 'stale' if stale else 'slow'
+            self.gap = min(self.max_gap, max(self.gap, self.step) * self.backoff)
+            self.backoffs += 1
+        else:
+            reason = None
+            self.gap = max(self.min_gap, self.gap - self.step)
+
+        self.history.append((self.count, self.gap, latency, ok, reason))
+        return self.gap
+
+    def report(self, buckets=5):
+        """
+        구간별 간격/지연 변화 요약
+
+        Args:
+            buckets: 나눌 구간 수
+
+        Returns:
+            str: 여러 줄 요약
+        """
+        if not self.history:
+            return "조회 간격: 기록 없음"
+
+        lines = [f"조회 간격: {self.count}건, 현재 {self.gap * 1000:.0f}ms, 간격 증가 {self.backoffs}회, "
+                 f"총 대기 {self.slept:.1f}초, 오류율(EWMA) {self.error_rate * 100:.0f}%"]
+        size = max(1, -(-len(self.history) // buckets))
+        for i in range(0, len(self.history), size):
+            chunk = self.history[i:i + size]
+            gaps = [h[1] for h in chunk]
+            latencies = [h[2] for h in chunk if h[2] is not None]
+            errors = sum(1 for h in chunk if h[4])
+            latency = f"{sum(latencies) / len(latencies) * 1000:.0f}ms" if latencies else "-"
+            lines.append(f"  {chunk[0][0]:>5}~{chunk[-1][0]:<5} 간격 평균 {sum(gaps) / len(gaps) * 1000:4.0f}ms "
+                         f"(최소 {min(gaps) * 1000:.0f}, 최대 {max(gaps) * 1000:.0f}), "
+                         f"표시 지연 {latency}, 간격 증가 {errors}회")
+        return "\n".join(lines)
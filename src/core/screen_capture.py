@@ -4,52 +4,189 @@
 화면 캡처 모듈
 """
 
-import pyautogui
-from PIL import Image
-import os
-from datetime import datetime
-import subprocess
-import platform
+import cv2
+import numpy as np
+import time
+
+from .capture_backends import create_backend
+from .frame_store import FrameStore
+from .window_locator import WindowLocator
+
+
+# 화면 변화 판단용 축소 서명 크기 (가로 최대 픽셀)
+SIGNATURE_WIDTH = 128
+
+# 타겟 윈도우 위치 검증에 쓰는 윈도우 상단 줄 수 (제목 표시줄/헤더)
+WINDOW_CHECK_ROWS = 24
+WINDOW_CHECK_THRESHOLD = 8
+
+
+def frame_signature(frame):
+    """
+    프레임의 축소 서명 (화면 변화 비교용)
+
+    Args:
+        frame: 그레이스케일 또는 BGR 프레임
+
+    Returns:
+        numpy.ndarray: 가로 SIGNATURE_WIDTH 이하로 축소한 그레이스케일 (int16)
+    """
+    if frame.ndim == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    h, w = frame.shape
+    if w > SIGNATURE_WIDTH:
+        size = (SIGNATURE_WIDTH, max(1, h * SIGNATURE_WIDTH // w))
+        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    return frame.astype(np.int16)
+
+
+def signature_diff(a, b):
+    """
+    두 서명의 최대 절대 차이 (크기가 다르면 무한대)
+
+    작은 위젯(체크박스, 상태바 숫자) 변화도 놓치지 않도록 평균이 아닌 최댓값을 쓴다.
+
+    Returns:
+        float: 0이면 동일
+    """
+    if a.shape != b.shape:
+        return float('inf')
+    return float(np.abs(a - b).max())
 
 
 class ScreenCapture:
     """화면 캡처 유틸리티"""
     
-    def __init__(self, output_dir="tmp/screenshots", target_window=None):
+    def __init__(self, output_dir="tmp/screenshots", target_window=None, backend='auto',
+                 keep_frames=10, sample_every=0):
         """
         초기화
 
         Args:
             output_dir: 스크린샷 저장 디렉토리
             target_window: 타겟 윈도우 이름 (예: "행복e음 Mock System")
+            backend: 캡처 백엔드 ('auto', 'pyautogui', 'xshm' 또는 CaptureBackend 인스턴스)
+            keep_frames: capture_frame 결과를 메모리에 보관할 최근 프레임 수
+            sample_every: N 프레임마다 1장 디스크에 저장 (0이면 persist_recent 호출 시에만)
         """
         self.output_dir = output_dir
         self.target_window = target_window
-        os.makedirs(output_dir, exist_ok=True)
+        self.window = WindowLocator(target_window) if target_window else None
+        # 마지막 capture_frame 프레임의 화면 좌표 원점 (윈도우 영역 캡처 시 윈도우 좌상단)
+        self.origin = (0, 0)
+        self._window_reference = None
+        self.backend = create_backend(backend)
+        self.frames = FrameStore(output_dir, capacity=keep_frames, sample_every=sample_every)
+        # 폴링용 재사용 버퍼 ((height, width) → 그레이스케일 배열)
+        self._poll_buffers = {}
     
-    def capture_full_screen(self, save_path=None):
+    def grab(self, region=None, grayscale=False, out=None):
         """
-        전체 화면 캡처 (target_window가 설정되어 있으면 해당 윈도우만 캡처)
+        화면을 NumPy 배열(프레임)로 캡처 (디스크 저장 없음)
 
         Args:
+            region: (x, y, width, height) 캡처 영역 (None이면 전체 화면)
+            grayscale: True면 그레이스케일 프레임 반환
+            out: 결과를 쓸 버퍼 (shape가 맞으면 새로 할당하지 않고 재사용)
+
+        Returns:
+            numpy.ndarray: BGR (H, W, 3) 또는 그레이스케일 (H, W) 프레임
+        """
+        return self.backend.grab(region=region, grayscale=grayscale, out=out)
+
+    def capture_frame(self, grayscale=False, save=False, save_path=None):
+        """
+        전체 화면을 프레임으로 캡처 (target_window가 설정되어 있으면 해당 윈도우만 캡처)
+
+        윈도우 위치는 캐시해 두고, 프레임 상단(WINDOW_CHECK_ROWS줄)의 서명이 바뀌었을 때만 다시 찾는다.
+        프레임 좌표 (0, 0)은 화면 좌표 self.origin에 해당한다.
+        캡처한 프레임은 최근 프레임 링 버퍼에 보관된다 (오류 시 persist_recent로 저장).
+
+        Args:
+            grayscale: True면 그레이스케일 프레임 반환
+            save: True면 프레임을 파일로도 즉시 저장
             save_path: 저장 경로 (None이면 자동 생성)
 
+        Returns:
+            numpy.ndarray: 캡처된 프레임
+        """
+        region = self.window.region(self.get_screen_size()) if self.window else None
+        frame = self.grab(region=region, grayscale=grayscale)
+
+        if region is not None and not self._window_unchanged(region, frame):
+            print("타겟 윈도우 위치 변경 감지, 다시 찾기")
+            self.window.invalidate()
+            region = self.window.region(self.get_screen_size())
+            frame = self.grab(region=region, grayscale=grayscale)
+            if region is not None:
+                self._window_unchanged(region, frame)
+
+        self.origin = tuple(region[:2]) if region else (0, 0)
+
+        if save or save_path is not None:
+            self.save_frame(frame, save_path)
+        else:
+            self.frames.add(frame)
+
+        return frame
+
+    def _window_unchanged(self, region, frame):
+        """
+        윈도우 상단 서명이 캐시된 위치에서 처음 캡처했을 때와 같은지 확인
+
+        Returns:
+            bool: 같으면 True (위치가 바뀐 새 영역이면 기준 서명을 새로 저장하고 True)
+        """
+        signature = frame_signature(frame[:WINDOW_CHECK_ROWS])
+        if self._window_reference is None or self._window_reference[0] != region:
+            self._window_reference = (region, signature)
+            return True
+        return signature_diff(signature, self._window_reference[1]) <= WINDOW_CHECK_THRESHOLD
+
+    def persist_recent(self, count=None, reason=None):
+        """
+        링 버퍼의 최근 프레임을 백그라운드에서 파일로 저장 (오류 분석용)
+
+        Args:
+            count: 저장할 최근 프레임 수 (None이면 보관 중인 전부)
+            reason: 로그에 남길 사유
+
+        Returns:
+            list: 저장될 파일 경로
+        """
+        return self.frames.persist(count, reason)
+
+    def save_frame(self, frame, save_path=None, prefix="fullscreen"):
+        """
+        프레임을 PNG 파일로 즉시 저장 (빠른 압축 수준)
+
+        Args:
+            frame: 저장할 프레임 (NumPy 배열)
+            save_path: 저장 경로 (None이면 "{prefix}_날짜_시각_순번.png" 자동 생성)
+            prefix: 자동 생성 파일명 접두어
+
         Returns:
             str: 저장된 파일 경로
         """
         if save_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = os.path.join(self.output_dir, f"fullscreen_{timestamp}.png")
+            save_path = self.frames.next_path(prefix)
 
-        # 타겟 윈도우가 설정되어 있으면 해당 윈도우만 캡처
-        if self.target_window:
-            return self._capture_window_macos(self.target_window, save_path)
-
-        # 전체 화면 캡처
-        screenshot = pyautogui.screenshot()
-        screenshot.save(save_path)
+        self.frames.write(frame, save_path)
 
         return save_path
+
+    def capture_full_screen(self, save_path=None):
+        """
+        전체 화면 캡처 후 파일로 저장 (target_window가 설정되어 있으면 해당 윈도우만 캡처)
+
+        Args:
+            save_path: 저장 경로 (None이면 자동 생성)
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        frame = self.capture_frame()
+        return self.save_frame(frame, save_path)
     
     def capture_region(self, x, y, width, height, save_path=None):
         """
@@ -63,105 +200,144 @@ class ScreenCapture:
         Returns:
             str: 저장된 파일 경로
         """
-        if save_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = os.path.join(self.output_dir, f"region_{timestamp}.png")
-        
-        screenshot = pyautogui.screenshot(region=(x, y, width, height))
-        screenshot.save(save_path)
-        
-        return save_path
+        frame = self.grab(region=(x, y, width, height))
+        return self.save_frame(frame, save_path, prefix="region")
     
     def capture_window(self, window_title=None, save_path=None):
         """
-        특정 윈도우 캡처 (macOS/Windows 호환)
+        특정 윈도우 캡처 (macOS/Linux/Windows)
         
         Args:
-            window_title: 윈도우 제목 (None이면 활성 윈도우)
+            window_title: 윈도우 제목 (None이면 target_window)
             save_path: 저장 경로
             
         Returns:
             str: 저장된 파일 경로
         """
-        # 현재는 전체 화면 캡처로 대체
-        # 추가 라이브러리 필요 시 구현 확장
-        return self.capture_full_screen(save_path)
+        if window_title is None or window_title == self.target_window:
+            return self.capture_full_screen(save_path)
+
+        region = WindowLocator(window_title).region(self.get_screen_size())
+        frame = self.grab(region=region)
+        return self.save_frame(frame, save_path, prefix="window")
     
-    def get_screen_size(self):
+    def region_signature(self, region=None):
         """
-        화면 크기 반환
+        영역의 현재 서명 (wait_for_change의 기준값으로 사용)
+
+        Args:
+            region: (x, y, width, height) 영역 (None이면 전체 화면)
 
         Returns:
-            tuple: (width, height)
+            numpy.ndarray: 축소 서명
         """
-        return pyautogui.size()
+        key = tuple(region[2:]) if region else None
+        frame = self.grab(region=region, grayscale=True, out=self._poll_buffers.get(key))
+        self._poll_buffers[key] = frame
+        return frame_signature(frame)
 
-    def _capture_window_macos(self, window_name, save_path):
+    def change_condition(self, region=None, threshold=8, min_width=1):
         """
-        macOS에서 특정 윈도우 캡처 (AppleScript 사용)
+        영역 변화 조건 함수 (GUIAutomation 동작의 until 인자로 사용)
+
+        호출 시점의 화면을 기준으로 삼으므로 동작 전에 만들어야 한다.
 
         Args:
-            window_name: 윈도우 이름 (부분 일치)
-            save_path: 저장 경로
+            region: (x, y, width, height) 감시 영역 (None이면 전체 화면)
+            threshold: 축소 서명 밝기 차이가 이 값을 넘으면 변화로 판단
+            min_width: 바뀐 서명 열이 이 수 이상일 때만 변화로 판단 (깜빡이는 커서처럼 좁은 변화 무시)
 
         Returns:
-            str: 저장된 파일 경로
+            callable: 영역이 바뀌었으면 True를 반환하는 함수
+        """
+        baseline = self.region_signature(region)
+        if min_width <= 1:
+            return lambda: signature_diff(self.region_signature(region), baseline) > threshold
+
+        def changed():
+            current = self.region_signature(region)
+            if current.shape != baseline.shape:
+                return True
+            columns = (np.abs(current - baseline) > threshold).any(axis=0)
+            return int(columns.sum()) >= min_width
+
+        return changed
+
+    def wait_for_change(self, region=None, timeout=3.0, baseline=None, interval=0.02, threshold=8):
+        """
+        영역이 바뀔 때까지 대기 (고정 sleep 대신 사용)
+
+        클릭 전에 region_signature()로 기준 서명을 받아 두고, 클릭 후 이 함수를 호출한다.
+
+        Args:
+            region: (x, y, width, height) 감시 영역 (None이면 전체 화면)
+            timeout: 최대 대기 시간 (초)
+            baseline: 기준 서명 (None이면 호출 시점 화면을 기준으로 삼음)
+            interval: 폴링 간격 (초)
+            threshold: 축소 서명 밝기 차이가 이 값을 넘으면 변화로 판단
+
+        Returns:
+            float or None: 변화 감지까지 걸린 시간 (초), 시간 초과 시 None
+        """
+        start = time.perf_counter()
+        if baseline is None:
+            baseline = self.region_signature(region)
+
+        while True:
+            if signature_diff(self.region_signature(region), baseline) > threshold:
+                return time.perf_counter() - start
+
+            elapsed = time.perf_counter() - start
+            if elapsed >= timeout:
+                return None
+            time.sleep(min(interval, timeout - elapsed))
+
+    def wait_for_stable(self, region=None, frames=2, timeout=3.0, interval=0.02, threshold=2):
         """
-        if platform.system() != 'Darwin':
-            # macOS가 아니면 전체 화면 캡처
-            screenshot = pyautogui.screenshot()
-            screenshot.save(save_path)
-            return save_path
-
-        # AppleScript로 윈도우 찾기 및 활성화
-        applescript = f'''
-        tell application "System Events"
-            set targetApp to first application process whose name contains "{window_name}"
-            set frontmost of targetApp to true
-            delay 0.2
-
-            -- 윈도우 위치와 크기 가져오기
-            tell first window of targetApp
-                set {{x, y}} to position
-                set {{w, h}} to size
-            end tell
-
-            return {{x, y, w, h}}
-        end tell
-        '''
-
-        try:
-            # AppleScript 실행
-            result = subprocess.run(
-                ['osascript', '-e', applescript],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode != 0:
-                print(f"윈도우 '{window_name}' 찾기 실패, 전체 화면 캡처")
-                screenshot = pyautogui.screenshot()
-                screenshot.save(save_path)
-                return save_path
-
-            # 결과 파싱: "x, y, w, h"
-            coords = result.stdout.strip().split(', ')
-            x, y, w, h = map(int, coords)
-
-            print(f"윈도우 '{window_name}' 찾음: ({x}, {y}, {w}x{h})")
-
-            # 윈도우 영역만 캡처
-            screenshot = pyautogui.screenshot(region=(x, y, w, h))
-            screenshot.save(save_path)
-
-            return save_path
-
-        except Exception as e:
-            print(f"윈도우 캡처 실패: {e}, 전체 화면 캡처")
-            screenshot = pyautogui.screenshot()
-            screenshot.save(save_path)
-            return save_path
+        영역이 더 이상 바뀌지 않을 때까지 대기 (렌더링 완료 판단)
+
+        Args:
+            region: (x, y, width, height) 감시 영역 (None이면 전체 화면)
+            frames: 연속으로 같아야 하는 폴링 횟수
+            timeout: 최대 대기 시간 (초)
+            interval: 폴링 간격 (초)
+            threshold: 축소 서명 밝기 차이가 이 값 이하면 같은 화면으로 판단
+
+        Returns:
+            float or None: 안정될 때까지 걸린 시간 (초), 시간 초과 시 None
+        """
+        start = time.perf_counter()
+        previous = self.region_signature(region)
+        same = 0
+
+        while True:
+            elapsed = time.perf_counter() - start
+            if elapsed >= timeout:
+                return None
+            time.sleep(min(interval, timeout - elapsed))
+
+            current = self.region_signature(region)
+            if signature_diff(current, previous) <= threshold:
+                same += 1
+                if same >= frames:
+                    return time.perf_counter() - start
+            else:
+                same = 0
+            previous = current
+
+    def get_screen_size(self):
+        """
+        화면 크기 반환
+
+        Returns:
+            tuple: (width, height)
+        """
+        return self.backend.size()
+
+    def close(self):
+        """예약된 스크린샷 저장을 마치고 캡처 백엔드 해제"""
+        self.frames.close()
+        self.backend.close()
 
 
 if __name__ == "__main__":
@@ -171,7 +347,10 @@ if __name__ == "__main__":
     print("Screen Capture Test")
     print(f"Screen size: {capture.get_screen_size()}")
 
-    # 전체 화면 캡처
+    # 전체 화면 캡처 (메모리)
+    frame = capture.capture_frame(grayscale=True)
+    print(f"Frame captured: {frame.shape}")
+
+    # 전체 화면 캡처 (파일)
     path = capture.capture_full_screen()
     print(f"Full screen captured: {path}")
-
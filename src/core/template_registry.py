@@ -0,0 +1,223 @@
+"""
+MARK:
+템플릿 레지스트리 모듈
+템플릿 이미지를 한 번만 읽어 전처리(그레이스케일, 마스크, 피라미드)해 두고
+파일이 변경되면(mtime) 자동으로 다시 읽는다
+"""
+
+import os
+import threading
+
+import cv2
+import numpy as np
+
+
+def build_pyramid(gray, levels, min_size=8):
+    """
+    그레이스케일 이미지 피라미드 생성
+
+    Args:
+        gray: 그레이스케일 이미지
+        levels: 원본 외에 만들 단계 수 (2 → 1/2, 1/4)
+        min_size: 이보다 작아지면 중단 (픽셀)
+
+    Returns:
+        list: [원본, 1/2, 1/4, ...]
+    """
+    pyramid = [gray]
+    for _ in range(levels):
+        prev = pyramid[-1]
+        if min(prev.shape[:2]) < min_size:
+            break
+        pyramid.append(cv2.pyrDown(prev))
+    return pyramid
+
+
+class Template:
+    """전처리된 템플릿 이미지"""
+
+    def __init__(self, name, path, color, gray, mask, pyramid, mtime):
+        """
+        Args:
+            name: 템플릿 이름 (파일명에서 확장자 제외, 예: 'checkbox')
+            path: 템플릿 파일 경로
+            color: BGR 이미지
+            gray: 그레이스케일 이미지
+            mask: 알파 채널 기반 마스크 (uint8, 0 또는 255)
+            pyramid: 그레이스케일 피라미드 [원본, 1/2, 1/4, ...]
+            mtime: 파일 수정 시각 (재로드 판단용)
+        """
+        self.name = name
+        self.path = path
+        self.color = color
+        self.gray = gray
+        self.mask = mask
+        self.pyramid = pyramid
+        self.mtime = mtime
+
+        # 투명 영역이 있을 때만 매칭에 마스크를 사용
+        self.has_mask = bool((mask < 255).any())
+
+        # 배율별 피라미드 캐시 (DPI 배율 대응)
+        self._scaled = {1.0: pyramid}
+
+    @property
+    def width(self):
+        return self.gray.shape[1]
+
+    @property
+    def height(self):
+        return self.gray.shape[0]
+
+    def scaled_pyramid(self, scale):
+        """
+        배율을 적용한 그레이스케일 피라미드 (배율별로 한 번만 생성)
+
+        Args:
+            scale: 템플릿 배율 (1.25 → 125% 화면 배율)
+
+        Returns:
+            list: [원본, 1/2, 1/4, ...]
+        """
+        scale = round(scale, 3)
+        pyramid = self._scaled.get(scale)
+        if pyramid is None:
+            interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+            gray = cv2.resize(self.gray, None, fx=scale, fy=scale, interpolation=interpolation)
+            pyramid = build_pyramid(gray, len(self.pyramid) - 1)
+            self._scaled[scale] = pyramid
+        return pyramid
+
+    def __repr__(self):
+        return f"Template({self.name!r}, {self.width}x{self.height})"
+
+
+class TemplateRegistry:
+    """템플릿 디렉토리별 템플릿 캐시"""
+
+    # template_dir → TemplateRegistry (프로세스 전체 공유)
+    _registries = {}
+    _registries_lock = threading.Lock()
+
+    def __init__(self, template_dir, pyramid_levels=2):
+        """
+        Args:
+            template_dir: 템플릿 이미지 디렉토리 (templates_window / templates_mac)
+            pyramid_levels: 원본 외에 만들 피라미드 단계 수 (2 → 1/2, 1/4)
+        """
+        self.template_dir = template_dir
+        self.pyramid_levels = pyramid_levels
+        self._templates = {}
+        self._lock = threading.Lock()
+        self.load_count = 0
+
+    @classmethod
+    def for_dir(cls, template_dir):
+        """
+        디렉토리별 공유 레지스트리 반환 (없으면 생성)
+
+        Args:
+            template_dir: 템플릿 이미지 디렉토리
+
+        Returns:
+            TemplateRegistry: 공유 인스턴스
+        """
+        key = os.path.abspath(template_dir)
+        with cls._registries_lock:
+            registry = cls._registries.get(key)
+            if registry is None:
+                registry = cls(template_dir)
+                cls._registries[key] = registry
+            return registry
+
+    def path(self, name):
+        """템플릿 파일 경로"""
+        return os.path.join(self.template_dir, f"{name}.png")
+
+    def exists(self, name):
+        """템플릿 파일 존재 여부"""
+        return os.path.exists(self.path(name))
+
+    def get(self, name):
+        """
+        템플릿 가져오기 (최초 1회 로드, 파일이 바뀌면 재로드)
+
+        Args:
+            name: 템플릿 이름 ('input_field', 'search_button', 'checkbox' 등)
+
+        Returns:
+            Template: 전처리된 템플릿
+
+        Raises:
+            FileNotFoundError: 템플릿 파일이 없을 때
+            ValueError: 이미지를 읽을 수 없을 때
+        """
+        path = self.path(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {path}")
+
+        with self._lock:
+            template = self._templates.get(name)
+            if template is not None and template.mtime == mtime:
+                return template
+
+            if template is not None:
+                print(f"템플릿 변경 감지, 다시 로드: {path}")
+
+            template = self._load(name, path, mtime)
+            self._templates[name] = template
+            return template
+
+    def preload(self, names=None):
+        """
+        템플릿 미리 로드
+
+        Args:
+            names: 템플릿 이름 리스트 (None이면 디렉토리의 모든 PNG)
+
+        Returns:
+            list: 로드된 템플릿 이름 리스트
+        """
+        if names is None:
+            names = sorted(
+                os.path.splitext(f)[0]
+                for f in os.listdir(self.template_dir)
+                if f.lower().endswith('.png')
+            )
+
+        for name in names:
+            self.get(name)
+
+        return list(names)
+
+    def clear(self):
+        """캐시된 템플릿 모두 제거"""
+        with self._lock:
+            self._templates.clear()
+
+    def _load(self, name, path, mtime):
+        """템플릿 파일을 읽어 전처리"""
+        image = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        if image is None:
+            raise ValueError(f"Failed to load template: {path}")
+
+        if image.ndim == 2:
+            color = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+            mask = np.full(image.shape, 255, dtype=np.uint8)
+        elif image.shape[2] == 4:
+            color = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+            mask = np.where(image[:, :, 3] > 0, 255, 0).astype(np.uint8)
+        else:
+            color = image
+            mask = np.full(image.shape[:2], 255, dtype=np.uint8)
+
+        gray = cv2.cvtColor(color, cv2.COLOR_BGR2GRAY)
+
+        # 그레이스케일 피라미드 (너무 작아지면 중단)
+        pyramid = build_pyramid(gray, self.pyramid_levels)
+
+        self.load_count += 1
+
+        return Template(name, path, color, gray, mask, pyramid, mtime)
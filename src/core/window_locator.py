@@ -0,0 +1,258 @@
+"""
+MARK:
+타겟 윈도우 위치 찾기 모듈
+윈도우 위치(x, y, w, h)를 한 번만 조회해 캐시하고, invalidate() 후에만 다시 조회한다.
+(ScreenCapture가 캡처한 프레임 상단의 픽셀 서명이 달라지면 invalidate를 호출)
+
+OS별 조회 방법:
+    macOS    AppleScript (osascript) — 조회 시 1회만 실행
+    Linux    X11 윈도우 트리 (_NET_WM_NAME / WM_NAME)
+    Windows  user32 EnumWindows / GetWindowRect
+"""
+
+import ctypes
+import platform
+import subprocess
+import time
+
+
+class WindowChangedError(OSError):
+    """윈도우 트리를 조회하는 중에 윈도우가 사라짐 (X11 BadWindow)"""
+
+
+class WindowLocator:
+    """타겟 윈도우 위치 캐시"""
+
+    def __init__(self, window_name, retry_interval=5.0):
+        """
+        Args:
+            window_name: 윈도우 이름 (부분 일치)
+            retry_interval: 윈도우를 찾지 못했을 때 다시 조회하기까지의 시간 (초)
+        """
+        self.window_name = window_name
+        self.retry_interval = retry_interval
+        self.geometry = None
+        self.locate_count = 0
+        self._located_at = None
+
+    def region(self, screen_size=None):
+        """
+        윈도우 영역 (캐시가 없을 때만 조회)
+
+        Args:
+            screen_size: (width, height) 주어지면 화면 경계로 자름
+
+        Returns:
+            tuple or None: (x, y, w, h), 찾지 못하면 None (전체 화면 캡처)
+        """
+        if self.geometry is None and (
+            self._located_at is None or time.monotonic() - self._located_at >= self.retry_interval
+        ):
+            self._located_at = time.monotonic()
+            self.geometry = self.locate()
+
+        geometry = self.geometry
+        if geometry is None or screen_size is None:
+            return geometry
+
+        x, y, w, h = geometry
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(screen_size[0], x + w), min(screen_size[1], y + h)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    def invalidate(self):
+        """캐시된 위치 삭제 (다음 region 호출 시 다시 조회)"""
+        self.geometry = None
+        self._located_at = None
+
+    def locate(self):
+        """
+        OS별 방법으로 윈도우 위치 조회 (캐시 없이)
+
+        Returns:
+            tuple or None: (x, y, w, h), 찾지 못하면 None
+        """
+        self.locate_count += 1
+        system = platform.system()
+        try:
+            if system == 'Darwin':
+                geometry = _locate_macos(self.window_name)
+            elif system == 'Windows':
+                geometry = _locate_windows(self.window_name)
+            else:
+                geometry = _locate_x11(self.window_name)
+        except WindowChangedError as e:
+            # 조회 결과를 믿을 수 없으므로 캐시하지 않고 다음 region 호출에서 바로 다시 조회
+            print(f"윈도우 찾기 실패: {e}, 전체 화면 캡처")
+            self.invalidate()
+            return None
+        except Exception as e:
+            print(f"윈도우 찾기 실패: {e}, 전체 화면 캡처")
+            return None
+
+        if geometry is None:
+            print(f"윈도우 '{self.window_name}' 찾기 실패, 전체 화면 캡처")
+        else:
+            x, y, w, h = geometry
+            print(f"윈도우 '{self.window_name}' 찾음: ({x}, {y}, {w}x{h})")
+        return geometry
+
+
+def _locate_macos(window_name):
+    """macOS: AppleScript로 윈도우를 앞으로 가져오고 위치/크기 조회"""
+    applescript = f'''
+    tell application "System Events"
+        set targetApp to first application process whose name contains "{window_name}"
+        set frontmost of targetApp to true
+        delay 0.2
+
+        -- 윈도우 위치와 크기 가져오기
+        tell first window of targetApp
+            set {{x, y}} to position
+            set {{w, h}} to size
+        end tell
+
+        return {{x, y, w, h}}
+    end tell
+    '''
+
+    result = subprocess.run(
+        ['osascript', '-e', applescript],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+    if result.returncode != 0:
+        return None
+
+    # 결과 파싱: "x, y, w, h"
+    x, y, w, h = map(int, result.stdout.strip().split(', '))
+    return (x, y, w, h)
+
+
+def _locate_x11(window_name):
+    """
+    Linux: X11 윈도우 트리에서 제목이 일치하는 보이는 윈도우 찾기
+
+    Raises:
+        WindowChangedError: 조회 중에 윈도우가 사라졌을 때 (BadWindow)
+        OSError: 디스플레이에 연결할 수 없거나 다른 X 오류가 났을 때
+    """
+    from . import xlib
+    x11, _, _ = xlib.load()
+
+    display = x11.XOpenDisplay(None)
+    if not display:
+        raise OSError("Cannot open X display")
+
+    try:
+        # 조회 중 윈도우가 닫혀도 프로세스가 종료되지 않도록 이 연결의 X 오류만 기록
+        with xlib.trap_errors(display) as errors:
+            geometry = _x11_find(x11, display, window_name)
+    finally:
+        x11.XCloseDisplay(display)
+
+    if xlib.BadWindow in errors:
+        raise WindowChangedError("window closed during lookup (BadWindow)")
+    if errors:
+        raise OSError(f"X error {errors} during window lookup")
+    return geometry
+
+
+def _x11_find(x11, display, window_name):
+    """X11 윈도우 트리 너비 우선 탐색"""
+    from . import xlib
+
+    root = x11.XDefaultRootWindow(display)
+    net_wm_name = x11.XInternAtom(display, b'_NET_WM_NAME', 0)
+    utf8_string = x11.XInternAtom(display, b'UTF8_STRING', 0)
+
+    # 너비 우선 탐색 (최상위 윈도우부터)
+    pending = _x11_children(x11, display, root)
+    while pending:
+        window = pending.pop(0)
+        title = _x11_title(x11, display, window, net_wm_name, utf8_string)
+        if title and window_name in title:
+            attributes = xlib.XWindowAttributes()
+            if x11.XGetWindowAttributes(display, window, ctypes.byref(attributes)) \
+                    and attributes.map_state == xlib.IsViewable:
+                x, y = ctypes.c_int(), ctypes.c_int()
+                child = ctypes.c_ulong()
+                x11.XTranslateCoordinates(display, window, root, 0, 0,
+                                          ctypes.byref(x), ctypes.byref(y), ctypes.byref(child))
+                return (x.value, y.value, attributes.width, attributes.height)
+        pending.extend(_x11_children(x11, display, window))
+    return None
+
+
+def _x11_children(x11, display, window):
+    """X11 자식 윈도우 목록"""
+    root, parent = ctypes.c_ulong(), ctypes.c_ulong()
+    children = ctypes.POINTER(ctypes.c_ulong)()
+    count = ctypes.c_uint()
+    if not x11.XQueryTree(display, window, ctypes.byref(root), ctypes.byref(parent),
+                          ctypes.byref(children), ctypes.byref(count)):
+        return []
+    windows = [children[i] for i in range(count.value)]
+    if children:
+        x11.XFree(children)
+    return windows
+
+
+def _x11_title(x11, display, window, net_wm_name, utf8_string):
+    """X11 윈도우 제목 (_NET_WM_NAME 우선, 없으면 WM_NAME)"""
+    actual_type, actual_format = ctypes.c_ulong(), ctypes.c_int()
+    items, remaining = ctypes.c_ulong(), ctypes.c_ulong()
+    data = ctypes.c_void_p()
+    status = x11.XGetWindowProperty(display, window, net_wm_name, 0, 1024, 0, utf8_string,
+                                    ctypes.byref(actual_type), ctypes.byref(actual_format),
+                                    ctypes.byref(items), ctypes.byref(remaining), ctypes.byref(data))
+    if status == 0 and data.value:
+        try:
+            if items.value:
+                return ctypes.string_at(data.value, items.value).decode('utf-8', errors='replace')
+        finally:
+            x11.XFree(data)
+
+    name = ctypes.c_void_p()
+    if x11.XFetchName(display, window, ctypes.byref(name)) and name.value:
+        try:
+            return ctypes.string_at(name.value).decode('latin-1')
+        finally:
+            x11.XFree(name)
+    return None
+
+
+def _locate_windows(window_name):
+    """Windows: 제목이 일치하는 보이는 최상위 윈도우를 앞으로 가져오고 위치 조회"""
+    from ctypes import wintypes
+    user32 = ctypes.windll.user32
+
+    found = []
+
+    @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    def callback(hwnd, _):
+        if not user32.IsWindowVisible(hwnd):
+            return True
+        length = user32.GetWindowTextLengthW(hwnd)
+        if length == 0:
+            return True
+        buffer = ctypes.create_unicode_buffer(length + 1)
+        user32.GetWindowTextW(hwnd, buffer, length + 1)
+        if window_name in buffer.value:
+            found.append(hwnd)
+            return False
+        return True
+
+    user32.EnumWindows(callback, 0)
+    if not found:
+        return None
+
+    hwnd = found[0]
+    user32.SetForegroundWindow(hwnd)
+    rect = wintypes.RECT()
+    if not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+        return None
+    return (rect.left, rect.top, rect.right - rect.left, rect.bottom - rect.top)
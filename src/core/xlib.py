@@ -0,0 +1,235 @@
+"""
+MARK:
+Xlib/XShm ctypes 바인딩 (Linux X11 전용)
+외부 패키지 없이 libX11/libXext를 직접 호출한다. 필요한 함수만 선언한다.
+"""
+
+import ctypes
+import ctypes.util
+import threading
+from contextlib import contextmanager
+
+
+ZPixmap = 2
+AllPlanes = ctypes.c_ulong(-1).value
+
+IsViewable = 2
+BadWindow = 3
+AnyPropertyType = 0
+
+IPC_PRIVATE = 0
+IPC_CREAT = 0o1000
+IPC_RMID = 0
+
+
+class XImage(ctypes.Structure):
+    """XImage 구조체 (앞부분 필드만 사용)"""
+    _fields_ = [
+        ('width', ctypes.c_int),
+        ('height', ctypes.c_int),
+        ('xoffset', ctypes.c_int),
+        ('format', ctypes.c_int),
+        ('data', ctypes.c_void_p),
+        ('byte_order', ctypes.c_int),
+        ('bitmap_unit', ctypes.c_int),
+        ('bitmap_bit_order', ctypes.c_int),
+        ('bitmap_pad', ctypes.c_int),
+        ('depth', ctypes.c_int),
+        ('bytes_per_line', ctypes.c_int),
+        ('bits_per_pixel', ctypes.c_int),
+        ('red_mask', ctypes.c_ulong),
+        ('green_mask', ctypes.c_ulong),
+        ('blue_mask', ctypes.c_ulong),
+    ]
+
+
+class XShmSegmentInfo(ctypes.Structure):
+    """XShmSegmentInfo 구조체"""
+    _fields_ = [
+        ('shmseg', ctypes.c_ulong),
+        ('shmid', ctypes.c_int),
+        ('shmaddr', ctypes.c_void_p),
+        ('readOnly', ctypes.c_int),
+    ]
+
+
+class XWindowAttributes(ctypes.Structure):
+    """XWindowAttributes 구조체"""
+    _fields_ = [
+        ('x', ctypes.c_int),
+        ('y', ctypes.c_int),
+        ('width', ctypes.c_int),
+        ('height', ctypes.c_int),
+        ('border_width', ctypes.c_int),
+        ('depth', ctypes.c_int),
+        ('visual', ctypes.c_void_p),
+        ('root', ctypes.c_ulong),
+        ('class_', ctypes.c_int),
+        ('bit_gravity', ctypes.c_int),
+        ('win_gravity', ctypes.c_int),
+        ('backing_store', ctypes.c_int),
+        ('backing_planes', ctypes.c_ulong),
+        ('backing_pixel', ctypes.c_ulong),
+        ('save_under', ctypes.c_int),
+        ('colormap', ctypes.c_ulong),
+        ('map_installed', ctypes.c_int),
+        ('map_state', ctypes.c_int),
+        ('all_event_masks', ctypes.c_long),
+        ('your_event_mask', ctypes.c_long),
+        ('do_not_propagate_mask', ctypes.c_long),
+        ('override_redirect', ctypes.c_int),
+        ('screen', ctypes.c_void_p),
+    ]
+
+
+class XErrorEvent(ctypes.Structure):
+    """XErrorEvent 구조체"""
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('resourceid', ctypes.c_ulong),
+        ('serial', ctypes.c_ulong),
+        ('error_code', ctypes.c_ubyte),
+        ('request_code', ctypes.c_ubyte),
+        ('minor_code', ctypes.c_ubyte),
+    ]
+
+
+def _declare(lib, name, restype, *argtypes):
+    func = getattr(lib, name)
+    func.restype = restype
+    func.argtypes = list(argtypes)
+
+
+XErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(XErrorEvent))
+
+_libs = None
+
+# trap_errors 블록 상태: (display, 오류 코드 리스트, 이전 핸들러)
+_trap = None
+_trap_lock = threading.Lock()
+
+
+def _handle_error(display, event):
+    """trap_errors 중인 연결의 오류는 기록만 하고, 다른 연결(Tk 등)의 오류는 이전 핸들러로 넘김"""
+    trap = _trap
+    if trap is not None and display == trap[0]:
+        trap[1].append(event.contents.error_code)
+        return 0
+    if trap is not None and trap[2]:
+        return XErrorHandler(trap[2])(display, event)
+    return 0
+
+
+_error_handler = XErrorHandler(_handle_error)
+
+
+def load():
+    """
+    libX11, libXext, libc 로드 (최초 1회)
+
+    Returns:
+        tuple: (x11, xext, libc)
+
+    Raises:
+        OSError: 라이브러리를 찾을 수 없을 때
+    """
+    global _libs
+    if _libs is not None:
+        return _libs
+
+    x11_path = ctypes.util.find_library('X11')
+    xext_path = ctypes.util.find_library('Xext')
+    if not x11_path or not xext_path:
+        raise OSError("libX11/libXext not found")
+
+    x11 = ctypes.CDLL(x11_path)
+    xext = ctypes.CDLL(xext_path)
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+
+    p = ctypes.c_void_p
+    _declare(x11, 'XInitThreads', ctypes.c_int)
+    _declare(x11, 'XOpenDisplay', p, ctypes.c_char_p)
+    _declare(x11, 'XCloseDisplay', ctypes.c_int, p)
+    _declare(x11, 'XDefaultScreen', ctypes.c_int, p)
+    _declare(x11, 'XDefaultRootWindow', ctypes.c_ulong, p)
+    _declare(x11, 'XDefaultVisual', p, p, ctypes.c_int)
+    _declare(x11, 'XDefaultDepth', ctypes.c_int, p, ctypes.c_int)
+    _declare(x11, 'XDisplayWidth', ctypes.c_int, p, ctypes.c_int)
+    _declare(x11, 'XDisplayHeight', ctypes.c_int, p, ctypes.c_int)
+    _declare(x11, 'XSync', ctypes.c_int, p, ctypes.c_int)
+    _declare(x11, 'XFree', ctypes.c_int, p)
+    _declare(x11, 'XGetImage', ctypes.POINTER(XImage), p, ctypes.c_ulong,
+             ctypes.c_int, ctypes.c_int, ctypes.c_uint, ctypes.c_uint, ctypes.c_ulong, ctypes.c_int)
+    _declare(x11, 'XDestroyImage', ctypes.c_int, ctypes.POINTER(XImage))
+
+    window = ctypes.c_ulong
+    _declare(x11, 'XSetErrorHandler', ctypes.c_void_p, ctypes.c_void_p)
+    _declare(x11, 'XInternAtom', ctypes.c_ulong, p, ctypes.c_char_p, ctypes.c_int)
+    _declare(x11, 'XQueryTree', ctypes.c_int, p, window, ctypes.POINTER(window), ctypes.POINTER(window),
+             ctypes.POINTER(ctypes.POINTER(window)), ctypes.POINTER(ctypes.c_uint))
+    _declare(x11, 'XFetchName', ctypes.c_int, p, window, ctypes.POINTER(ctypes.c_void_p))
+    _declare(x11, 'XGetWindowProperty', ctypes.c_int, p, window, ctypes.c_ulong, ctypes.c_long, ctypes.c_long,
+             ctypes.c_int, ctypes.c_ulong, ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_int),
+             ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_ulong), ctypes.POINTER(ctypes.c_void_p))
+    _declare(x11, 'XGetWindowAttributes', ctypes.c_int, p, window, ctypes.POINTER(XWindowAttributes))
+    _declare(x11, 'XTranslateCoordinates', ctypes.c_int, p, window, window, ctypes.c_int, ctypes.c_int,
+             ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int), ctypes.POINTER(window))
+
+    _declare(xext, 'XShmQueryExtension', ctypes.c_int, p)
+    _declare(xext, 'XShmCreateImage', ctypes.POINTER(XImage), p, p, ctypes.c_uint, ctypes.c_int,
+             p, ctypes.POINTER(XShmSegmentInfo), ctypes.c_uint, ctypes.c_uint)
+    _declare(xext, 'XShmAttach', ctypes.c_int, p, ctypes.POINTER(XShmSegmentInfo))
+    _declare(xext, 'XShmDetach', ctypes.c_int, p, ctypes.POINTER(XShmSegmentInfo))
+    _declare(xext, 'XShmGetImage', ctypes.c_int, p, ctypes.c_ulong, ctypes.POINTER(XImage),
+             ctypes.c_int, ctypes.c_int, ctypes.c_ulong)
+
+    _declare(libc, 'shmget', ctypes.c_int, ctypes.c_int, ctypes.c_size_t, ctypes.c_int)
+    _declare(libc, 'shmat', p, ctypes.c_int, p, ctypes.c_int)
+    _declare(libc, 'shmdt', ctypes.c_int, p)
+    _declare(libc, 'shmctl', ctypes.c_int, ctypes.c_int, ctypes.c_int, p)
+
+    _libs = (x11, xext, libc)
+    return _libs
+
+
+def init_threads():
+    """
+    Xlib 멀티스레드 지원 켜기 (XInitThreads)
+
+    다른 모든 Xlib 호출보다 먼저 불러야 하므로 Tk 창을 만들기 전, 프로그램 시작 시점에 호출한다.
+    X11이 없는 환경에서는 아무것도 하지 않는다.
+    """
+    try:
+        x11, _, _ = load()
+    except OSError:
+        return
+    x11.XInitThreads()
+
+
+@contextmanager
+def trap_errors(display):
+    """
+    블록 안에서 display 연결에 발생한 X 오류를 프로세스 종료 없이 기록
+
+    Xlib 오류 핸들러는 프로세스 전체에 하나이므로 블록 동안만 바꾸고, 끝나면 이전 핸들러(Tk 등)를 되돌린다.
+    X 오류는 비동기로 도착하므로 블록을 나가기 전에 XSync로 모두 받는다.
+
+    Args:
+        display: X 디스플레이 연결
+
+    Yields:
+        list: 발생한 오류 코드 (BadWindow 등). 블록을 나간 뒤에 확정된다.
+    """
+    global _trap
+    x11, _, _ = load()
+    with _trap_lock:
+        errors = []
+        previous = x11.XSetErrorHandler(ctypes.cast(_error_handler, ctypes.c_void_p))
+        _trap = (display, errors, previous)
+        try:
+            yield errors
+        finally:
+            x11.XSync(display, 0)
+            x11.XSetErrorHandler(previous)
+            _trap = None
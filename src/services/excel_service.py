@@ -4,19 +4,126 @@ Excel 처리 서비스
 
 import pandas as pd
 import os
+import csv
+import threading
+from collections.abc import Mapping
+from openpyxl import Workbook, load_workbook
+
+
+# 조회에 쓰는 입력 컬럼 (주민등록번호 컬럼은 항상 포함)
+RESIDENT_COLUMNS = ('순번', '주민등록번호', '이름')
+
+# 결과 파일 컬럼 (열 형식 저장 시 스키마 순서)
+RESULT_COLUMNS = ('순번', '주민등록번호', '이름', '세대원 수', '상태', '메시지', '캐시')
+
+# 열 형식(Parquet/Feather) 확장자 → pyarrow.dataset 형식 이름
+COLUMNAR_FORMATS = {'.parquet': 'parquet', '.feather': 'feather', '.arrow': 'feather'}
+
+
+def _require_pyarrow():
+    """pyarrow 가져오기 (열 형식 저장에만 필요한 선택 의존성)"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet/Feather support requires pyarrow (pip install pyarrow)") from None
+    return pyarrow
+
+
+def _to_int(value):
+    """정수 컬럼 값 변환 (빈 칸/숫자가 아닌 값은 None)"""
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _cell_text(value):
+    """셀 값을 문자열로 (숫자로 저장된 주민등록번호의 '.0' 제거)"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _cell_value(value):
+    """numpy 숫자 등을 openpyxl이 쓸 수 있는 값으로 (NaN은 빈 칸)"""
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+def _iter_rows(file_path):
+    """
+    파일의 행을 값 리스트로 하나씩 읽기 (첫 행은 헤더)
+
+    .xls 등 openpyxl이 읽지 못하는 형식은 pandas로 한 번에 읽는다.
+    """
+    if file_path.endswith('.csv'):
+        with open(file_path, encoding='utf-8-sig', newline='') as f:
+            yield from csv.reader(f)
+        return
+
+    if not file_path.endswith(('.xlsx', '.xlsm')):
+        df = pd.read_excel(file_path, dtype=object)
+        yield list(df.columns)
+        yield from df.itertuples(index=False, name=None)
+        return
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _write_rows(file_path, rows):
+    """
+    행을 하나씩 파일에 쓰기 (임시 파일에 다 쓴 뒤 바꿔치기 — 입력과 같은 파일이어도 됨)
+
+    Args:
+        file_path: 출력 경로 (.csv면 CSV, 그 외는 .xlsx)
+        rows: 값 리스트 iterable (첫 행은 헤더)
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    base, ext = os.path.splitext(file_path)
+    temp_path = f"{base}.tmp{ext}"
+
+    try:
+        if file_path.endswith('.csv'):
+            with open(temp_path, 'w', encoding='utf-8-sig', newline='') as f:
+                csv.writer(f).writerows(rows)
+        else:
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet()
+            for row in rows:
+                sheet.append(row)
+            workbook.save(temp_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, file_path)
 
 
 class ExcelService:
     """Excel 파일 읽기/쓰기"""
     
     @staticmethod
-    def read_residents(file_path, column_name='주민등록번호'):
+    def read_residents(file_path, column_name='주민등록번호', columns=None):
         """
-        Excel 파일에서 주민등록번호 목록 읽기
+        Excel 파일에서 주민등록번호 목록 읽기 (iter_residents 결과를 리스트로)
         
         Args:
             file_path: Excel 파일 경로
             column_name: 주민등록번호 컬럼 이름
+            columns: 읽을 컬럼 (None이면 RESIDENT_COLUMNS 중 파일에 있는 것)
             
         Returns:
             list: [
@@ -24,74 +131,342 @@ class ExcelService:
                 ...
             ]
         """
-        # 파일 확장자에 따라 읽기
+        return list(ExcelService.iter_residents(file_path, column_name, columns))
+
+    @staticmethod
+    def iter_residents(file_path, column_name='주민등록번호', columns=None, chunk_size=10000):
+        """
+        입력 파일의 행을 한 건씩 읽기 (필요한 컬럼만, 파일 전체를 메모리에 올리지 않음)
+
+        .xlsx는 openpyxl 읽기 전용 모드로 행을 하나씩, .csv는 chunk_size 행씩 읽는다.
+        주민등록번호는 숫자로 바뀌지 않도록 항상 문자열로 읽는다.
+
+        Args:
+            file_path: Excel/CSV 파일 경로
+            column_name: 주민등록번호 컬럼 이름
+            columns: 읽을 컬럼 (None이면 RESIDENT_COLUMNS 중 파일에 있는 것)
+            chunk_size: CSV를 한 번에 읽는 행 수
+
+        Yields:
+            dict: {'순번': 1, '주민등록번호': '900101-1234567', '이름': '홍길동'}
+
+        Raises:
+            ValueError: 주민등록번호 컬럼이 없을 때
+        """
+        wanted = list(columns or RESIDENT_COLUMNS)
+        if column_name not in wanted:
+            wanted.append(column_name)
+
         if file_path.endswith('.csv'):
-            df = pd.read_csv(file_path, encoding='utf-8')
-        else:
-            df = pd.read_excel(file_path)
-        
-        # 주민등록번호 컬럼 확인
-        if column_name not in df.columns:
-            raise ValueError(f"Column '{column_name}' not found in file")
-        
-        # 딕셔너리 리스트로 변환
-        records = df.to_dict('records')
-        
-        return records
+            # utf-8-sig: 엑셀에서 저장한 CSV의 BOM이 첫 컬럼 이름에 붙지 않도록
+            header = pd.read_csv(file_path, encoding='utf-8-sig', nrows=0).columns
+            if column_name not in header:
+                raise ValueError(f"Column '{column_name}' not found in file")
+            reader = pd.read_csv(
+                file_path, encoding='utf-8-sig', usecols=[c for c in header if c in wanted],
+                dtype={column_name: str}, keep_default_na=False, chunksize=chunk_size
+            )
+            for chunk in reader:
+                yield from chunk.to_dict('records')
+            return
+
+        if not file_path.endswith(('.xlsx', '.xlsm')):
+            # .xls 등 openpyxl이 읽지 못하는 형식은 pandas로 한 번에 읽음
+            df = pd.read_excel(file_path, dtype={column_name: str})
+            if column_name not in df.columns:
+                raise ValueError(f"Column '{column_name}' not found in file")
+            yield from df[[c for c in df.columns if c in wanted]].to_dict('records')
+            return
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, ())
+            if column_name not in header:
+                raise ValueError(f"Column '{column_name}' not found in file")
+            indices = [(name, i) for i, name in enumerate(header) if name in wanted]
+
+            for row in rows:
+                if row is None or all(value is None for value in row):
+                    continue
+                record = {name: row[i] if i < len(row) else None for name, i in indices}
+                record[column_name] = _cell_text(record[column_name])
+                yield record
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def count_residents(file_path):
+        """
+        입력 파일의 데이터 행 수 (진행률 표시용, 내용은 해석하지 않음)
+
+        Args:
+            file_path: Excel/CSV 파일 경로
+
+        Returns:
+            int: 헤더를 뺀 행 수
+        """
+        if file_path.endswith('.csv'):
+            lines = 0
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    lines += block.count(b'\n')
+                # 마지막 줄에 줄바꿈이 없는 경우
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        lines += 1
+            return max(0, lines - 1)
+
+        if not file_path.endswith(('.xlsx', '.xlsm')):
+            return len(pd.read_excel(file_path, usecols=[0]))
+
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            sheet = workbook.worksheets[0]
+            if sheet.max_row is not None:
+                return max(0, sheet.max_row - 1)
+            # 크기 정보가 없는 파일은 행을 세어 봄
+            return max(0, sum(1 for _ in sheet.iter_rows(values_only=True)) - 1)
+        finally:
+            workbook.close()
     
     @staticmethod
     def write_results(file_path, results):
         """
-        결과를 Excel 파일에 쓰기
+        결과를 Excel 파일에 쓰기 (openpyxl 쓰기 전용 모드로 한 행씩, 메모리에 모으지 않음)
+
+        임시 파일에 다 쓴 뒤 바꿔치기하므로, 도중에 중단되어도 기존 결과 파일은 그대로 남는다.
         
         Args:
             file_path: 출력 파일 경로
-            results: 결과 리스트 [
+            results: 결과 iterable [
                 {'순번': 1, '주민등록번호': '...', '이름': '...', '세대원 수': 4, '상태': '완료', '메시지': '...'},
                 ...
-            ]
+            ] (컬럼은 첫 행 기준)
+
+        Returns:
+            int: 쓴 행 수
         """
-        df = pd.DataFrame(results)
-        
-        # 기본 경로
-        base_path = os.path.splitext(file_path)[0]
+        # Excel 저장 (실패하면 임시 파일은 지움)
+        excel_path = os.path.splitext(file_path)[0] + '.xlsx'
+        count = 0
+
+        def rows():
+            nonlocal count
+            columns = None
+            for row in results:
+                if columns is None:
+                    columns = list(row)
+                    yield columns
+                yield [_cell_value(row.get(column)) for column in columns]
+                count += 1
+
+        _write_rows(excel_path, rows())
+        print(f"Excel 저장: {excel_path} ({count}건)")
+        return count
+
+    @staticmethod
+    def write_results_in_background(file_path, results, callback=None):
+        """
+        write_results를 백그라운드 스레드에서 실행
 
-        # Excel 저장
-        excel_path = base_path + '.xlsx'
-        df.to_excel(excel_path, index=False, engine='openpyxl')
-        print(f"Excel 저장: {excel_path}")
+        Args:
+            file_path: 출력 파일 경로
+            results: 결과 iterable (저장 스레드에서 순회)
+            callback: 끝나면 저장 스레드에서 호출 callback(count, error) — 성공 시 error는 None
+
+        Returns:
+            threading.Thread: 저장 스레드 (join()으로 완료 대기)
+        """
+        def run():
+            try:
+                count = ExcelService.write_results(file_path, results)
+            except Exception as e:
+                print(f"Excel 저장 실패: {e}")
+                if callback:
+                    callback(0, e)
+                return
+            if callback:
+                callback(count, None)
+
+        thread = threading.Thread(target=run, name="ExcelWriter", daemon=False)
+        thread.start()
+        return thread
     
     @staticmethod
-    def append_column(file_path, column_name, values, output_path=None):
+    def write_columnar(file_path, results, extra=None, batch_size=10000):
+        """
+        결과를 열 형식 파일(Parquet/Feather)로 쓰기 (batch_size 행씩 묶어서, 메모리에 모으지 않음)
+
+        Args:
+            file_path: 출력 경로 (.parquet, .feather/.arrow)
+            results: 결과 iterable (write_results와 같은 행, RESULT_COLUMNS 외 키는 무시)
+            extra: 모든 행에 같은 값으로 붙일 컬럼 {'run_id': '...', 'run_at': datetime, ...}
+            batch_size: 한 번에 변환하는 행 수
+
+        Returns:
+            int: 쓴 행 수
+
+        Raises:
+            ImportError: pyarrow가 없을 때
+            ValueError: 지원하지 않는 확장자
+        """
+        pa = _require_pyarrow()
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format '{ext}' (choose from {list(COLUMNAR_FORMATS)})")
+
+        extra = extra or {}
+        fields = [
+            pa.field('순번', pa.int64()),
+            pa.field('주민등록번호', pa.string()),
+            pa.field('이름', pa.string()),
+            pa.field('세대원 수', pa.int64()),
+            pa.field('상태', pa.string()),
+            pa.field('메시지', pa.string()),
+            pa.field('캐시', pa.string()),
+        ]
+        constants = {name: pa.scalar(value) for name, value in extra.items()}
+        schema = pa.schema(fields + [pa.field(name, scalar.type) for name, scalar in constants.items()])
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{os.path.splitext(file_path)[0]}.tmp{ext}"
+
+        if COLUMNAR_FORMATS[ext] == 'parquet':
+            import pyarrow.parquet as pq
+            writer = pq.ParquetWriter(temp_path, schema, compression='zstd')
+        else:
+            import pyarrow.feather  # noqa: F401  (pa.ipc 사용 전 초기화)
+            writer = pa.ipc.new_file(temp_path, schema, options=pa.ipc.IpcWriteOptions(compression='zstd'))
+
+        def flush(batch):
+            columns = {name: [] for name in RESULT_COLUMNS}
+            for row in batch:
+                for name in RESULT_COLUMNS:
+                    value = _cell_value(row.get(name))
+                    if name in ('순번', '세대원 수'):
+                        value = _to_int(value)
+                    elif value is not None:
+                        value = str(value)
+                    columns[name].append(value)
+            arrays = [pa.array(columns[field.name], type=field.type) for field in fields]
+            arrays += [pa.array([scalar.as_py()] * len(batch), type=scalar.type) for scalar in constants.values()]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+
+        count = 0
+        batch = []
+        try:
+            for row in results:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    flush(batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                flush(batch)
+                count += len(batch)
+            writer.close()
+        except BaseException:
+            writer.close()
+            os.remove(temp_path)
+            raise
+        os.replace(temp_path, file_path)
+        print(f"열 형식 저장: {file_path} ({count}건)")
+        return count
+
+    @staticmethod
+    def read_columnar(paths, columns=None, filter=None):
+        """
+        열 형식 결과 파일 여러 개를 한 번에 읽기 (필요한 컬럼/행만, 파일 간 컬럼 차이는 null로 맞춤)
+
+        Args:
+            paths: 파일 경로 또는 경로 리스트 (같은 형식, Parquet 또는 Feather)
+            columns: 읽을 컬럼 (None이면 전체)
+            filter: pyarrow.dataset 식 (예: ds.field('상태') == '완료')
+
+        Returns:
+            pandas.DataFrame
+
+        Raises:
+            ImportError: pyarrow가 없을 때
+        """
+        pa = _require_pyarrow()
+        import pyarrow.dataset as ds
+
+        if isinstance(paths, str):
+            paths = [paths]
+        if not paths:
+            return pd.DataFrame(columns=list(columns or RESULT_COLUMNS))
+
+        formats = {COLUMNAR_FORMATS.get(os.path.splitext(path)[1].lower()) for path in paths}
+        if len(formats) != 1 or None in formats:
+            raise ValueError(f"Expected files of one columnar format, got {sorted(map(str, formats))}")
+
+        # 파일마다 붙은 컬럼(run_id 등)이 달라도 합친 스키마로 읽음 (없는 컬럼은 null)
+        file_format = formats.pop()
+        schema = pa.unify_schemas([ds.dataset(path, format=file_format).schema for path in paths])
+        dataset = ds.dataset(paths, format=file_format, schema=schema)
+        return dataset.to_table(columns=columns, filter=filter).to_pandas()
+
+    @staticmethod
+    def append_column(file_path, column_name, values, output_path=None, key_column='주민등록번호'):
         """
-        기존 Excel 파일에 컬럼 추가
+        기존 Excel 파일에 컬럼 추가 (행을 하나씩 복사하며 값을 끼워 넣음, 파일 전체를 메모리에 올리지 않음)
+
+        .xlsx는 openpyxl 읽기 전용 → 쓰기 전용 모드로, .csv는 한 줄씩 처리한다.
+        같은 이름의 컬럼이 이미 있으면 그 컬럼 값을 바꾼다.
         
         Args:
             file_path: 입력 파일 경로
             column_name: 추가할 컬럼 이름
-            values: 컬럼 값 리스트
+            values: 컬럼 값 — 행 순서대로의 iterable(리스트, 제너레이터 등, 모자라면 빈 칸)
+                또는 {주민등록번호: 값} 매핑 (key_column 값으로 찾음, 없으면 빈 칸)
             output_path: 출력 파일 경로 (None이면 원본 덮어쓰기)
+            key_column: values가 매핑일 때 찾을 컬럼 이름
+
+        Returns:
+            int: 처리한 데이터 행 수
         """
-        # 파일 읽기
-        if file_path.endswith('.csv'):
-            df = pd.read_csv(file_path, encoding='utf-8')
-        else:
-            df = pd.read_excel(file_path)
-        
-        # 컬럼 추가
-        df[column_name] = values
-        
-        # 저장
         if output_path is None:
             output_path = file_path
-        
-        if output_path.endswith('.csv'):
-            df.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+        rows = _iter_rows(file_path)
+        header = list(next(rows, []))
+        if column_name in header:
+            index = header.index(column_name)
         else:
-            df.to_excel(output_path, index=False)
-        
-        print(f" Column '{column_name}' added to: {output_path}")
+            index = len(header)
+            header.append(column_name)
+
+        if isinstance(values, Mapping):
+            if key_column not in header:
+                raise ValueError(f"Column '{key_column}' not found in file")
+            key = header.index(key_column)
+            value_of = lambda row: values.get(_cell_text(row[key]) if key < len(row) else '')
+        else:
+            iterator = iter(values)
+            value_of = lambda row: next(iterator, None)
+
+        count = 0
+
+        def merged():
+            nonlocal count
+            yield header
+            for row in rows:
+                row = list(row)
+                value = value_of(row)
+                if len(row) <= index:
+                    row.extend([None] * (index + 1 - len(row)))
+                row[index] = _cell_value(value)
+                count += 1
+                yield row
 
+        _write_rows(output_path, merged())
+        print(f" Column '{column_name}' added to: {output_path} ({count} rows)")
+        return count
 
 if __name__ == "__main__":
     # 테스트
@@ -0,0 +1,136 @@
+"""
+조회 결과 캐시 서비스
+주민등록번호별 세대원 수를 SQLite에 보관해, 유효 기간(TTL) 안에 다시 나온 번호는 GUI 조회를 건너뛴다.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+
+DEFAULT_CACHE_PATH = os.path.join("data", "cache", "results.sqlite3")
+
+
+class ResultCache:
+    """주민등록번호 → 조회 결과 캐시 (SQLite)"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_days=30, max_entries=200000):
+        """
+        Args:
+            path: SQLite 파일 경로
+            ttl_days: 결과 유효 기간 (일, 지나면 다시 조회)
+            max_entries: 최대 보관 건수 (넘으면 오래된 것부터 삭제)
+        """
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 분석 스레드 등 다른 스레드에서도 쓸 수 있도록 연결 하나를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " rrn TEXT PRIMARY KEY,"
+                " household_count INTEGER NOT NULL,"
+                " status TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_updated_at ON results (updated_at)")
+
+    def get(self, resident_number):
+        """
+        유효 기간 안의 성공 결과 조회
+
+        Args:
+            resident_number: 주민등록번호
+
+        Returns:
+            dict or None: {'household_count', 'status', 'updated_at'}, 없거나 만료되면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT household_count, status, updated_at FROM results"
+                " WHERE rrn = ? AND status = 'success' AND updated_at >= ?",
+                (str(resident_number), time.time() - self.ttl)
+            ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return {'household_count': row[0], 'status': row[1], 'updated_at': row[2]}
+
+    def put(self, resident_number, household_count, status='success', updated_at=None):
+        """
+        결과 저장 (같은 번호는 더 최근 결과로만 덮어씀)
+
+        Args:
+            resident_number: 주민등록번호
+            household_count: 세대원 수
+            status: 'success' 또는 'error'
+            updated_at: 조회 시각 (epoch 초, None이면 현재)
+        """
+        self.put_many([(resident_number, household_count, status, updated_at)])
+
+    def put_many(self, rows):
+        """
+        여러 결과 저장
+
+        Args:
+            rows: (주민등록번호, 세대원 수, 상태, 조회 시각 또는 None) iterable
+
+        Returns:
+            int: 저장 시도한 건수
+        """
+        now = time.time()
+        values = [
+            (str(rrn), int(count), status, now if updated_at is None else float(updated_at))
+            for rrn, count, status, updated_at in rows
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO results (rrn, household_count, status, updated_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(rrn) DO UPDATE SET"
+                " household_count = excluded.household_count, status = excluded.status,"
+                " updated_at = excluded.updated_at"
+                " WHERE excluded.updated_at >= results.updated_at",
+                values
+            )
+        return len(values)
+
+    def evict(self):
+        """
+        만료된 결과 삭제, 최대 건수를 넘으면 오래된 것부터 삭제
+
+        Returns:
+            int: 삭제된 건수
+        """
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM results WHERE updated_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if count > self.max_entries:
+                removed += self._conn.execute(
+                    "DELETE FROM results WHERE rrn IN"
+                    " (SELECT rrn FROM results ORDER BY updated_at LIMIT ?)",
+                    (count - self.max_entries,)
+                ).rowcount
+        return removed
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,332 @@
+"""
+실행 기록(저널) 서비스
+조회가 끝날 때마다 결과를 출력 파일 옆 JSONL 파일에 한 줄씩 추가한다.
+JSON 변환/쓰기는 백그라운드 스레드에서 하고, fsync는 여러 건을 모아서 한다.
+중단/오류 후에는 저널에서 완료된 주민등록번호를 건너뛰고 이어서 실행하며,
+최종 결과 파일은 저널로부터 만든다.
+"""
+
+import os
+import json
+import time
+import queue
+import threading
+from datetime import datetime
+
+
+def _json_default(value):
+    """numpy 숫자 등 JSON 기본 타입이 아닌 값 변환"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def _input_fingerprint(input_path):
+    """
+    입력 파일 식별 정보 (같은 경로에 다른 달의 파일을 덮어쓴 경우를 구분)
+
+    Returns:
+        dict: {'input', 'input_mtime', 'input_size'} (파일이 없으면 경로만)
+    """
+    fingerprint = {'input': os.path.abspath(input_path)}
+    if os.path.exists(input_path):
+        stat = os.stat(input_path)
+        fingerprint.update(input_mtime=stat.st_mtime, input_size=stat.st_size)
+    return fingerprint
+
+
+def _same_input(event, input_path):
+    """실행 시작 기록(event)의 입력 파일이 지금의 input_path와 같은지"""
+    current = _input_fingerprint(input_path)
+    if event is None or 'input_size' not in current:
+        return False
+    return all(event.get(key) == value for key, value in current.items())
+
+
+# 기록 스레드에 즉시 fsync를 요청하는 표식
+_SYNC = object()
+
+
+class RunJournal:
+    """추가 전용 JSONL 실행 기록"""
+
+    SUFFIX = '.journal.jsonl'
+
+    def __init__(self, path, sync_every=50, sync_interval=1.0):
+        """
+        Args:
+            path: 저널 파일 경로
+            sync_every: 이 건수만큼 쓰면 fsync
+            sync_interval: 마지막 fsync 후 이 시간(초)이 지나면 fsync (비정상 종료 시 최대 손실 구간)
+        """
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+        self.written_count = 0
+        self.sync_count = 0
+        # 기록 스레드에서 난 첫 쓰기/fsync 오류 (append/flush에서 다시 발생)
+        self.error = None
+
+    @classmethod
+    def for_output(cls, output_path):
+        """
+        출력 파일 옆의 저널 (결과.xlsx → 결과.journal.jsonl)
+
+        Args:
+            output_path: 결과 파일 경로
+
+        Returns:
+            RunJournal
+        """
+        return cls(os.path.splitext(output_path)[0] + cls.SUFFIX)
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def matches(self, input_path):
+        """
+        저널의 마지막 실행 시작 기록이 같은 입력 파일(경로, 수정 시각, 크기)인지
+
+        Args:
+            input_path: 입력 파일 경로
+
+        Returns:
+            bool: 같으면 True (저널이 없거나 입력 정보가 없는 이전 형식이면 False)
+        """
+        return _same_input(self._last_start(), input_path)
+
+    def start(self, resume=False, input=None, **info):
+        """
+        실행 시작 기록
+
+        resume이 아니거나 저널의 입력 파일이 input과 다르면 기존 저널은 "<저널>.<시각>.bak"으로 옮겨 두고
+        새로 시작한다.
+
+        Args:
+            resume: True면 기존 저널에 이어서 기록
+            input: 입력 파일 경로 (경로, 수정 시각, 크기를 함께 기록)
+            **info: 함께 남길 정보
+
+        Returns:
+            bool: 기존 저널에 이어서 기록하면 True
+        """
+        if resume and input is not None and self.exists() and not self.matches(input):
+            print("입력 파일이 실행 기록과 달라 처음부터 실행합니다")
+            resume = False
+        if input is not None:
+            info.update(_input_fingerprint(input))
+
+        if not resume and self.exists():
+            backup = f"{self.path}.{datetime.now().strftime('%Y%m%d_%H%M%S')}.bak"
+            os.replace(self.path, backup)
+            print(f"이전 실행 기록 보관: {backup}")
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 비정상 종료로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈 보충
+        if self.exists() and os.path.getsize(self.path) > 0:
+            with open(self.path, 'rb+') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+
+        self._write({'_event': 'resume' if resume else 'start',
+                     'time': datetime.now().isoformat(timespec='seconds'), **info})
+        return resume
+
+    def append(self, record):
+        """
+        조회 결과 1건 기록 예약 (호출 스레드는 기다리지 않음)
+
+        Args:
+            record: 결과 행 {'순번', '주민등록번호', '이름', '세대원 수', '상태', '메시지'}
+                (넘긴 뒤에는 수정하지 않음)
+
+        Raises:
+            OSError: 앞선 기록을 쓰거나 fsync하지 못했을 때
+        """
+        self._raise_error()
+        self._start_writer()
+        self._queue.put(record)
+
+    def flush(self):
+        """
+        예약된 기록을 모두 쓰고 fsync할 때까지 대기
+
+        Raises:
+            OSError: 기록을 쓰거나 fsync하지 못했을 때
+        """
+        if self._writer is not None:
+            self._queue.put(_SYNC)
+            self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """예약된 기록을 마치고 기록 스레드 종료"""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+
+    def load(self, input_path=None):
+        """
+        기록된 결과 행 (같은 주민등록번호는 마지막 기록 우선)
+
+        비정상 종료로 마지막 줄이 잘렸으면 그 줄은 무시한다.
+
+        Args:
+            input_path: 주어지면 저널의 입력 파일이 이 파일과 같을 때만 사용 (다르면 빈 결과)
+
+        Returns:
+            dict: {주민등록번호: 결과 행}
+        """
+        self.flush()
+        rows, last_start = self._read()
+        if input_path is not None and not _same_input(last_start, input_path):
+            return {}
+        return rows
+
+    def completed(self, input_path=None):
+        """
+        완료된 주민등록번호 (오류로 끝난 건은 이어서 실행할 때 다시 조회)
+
+        Args:
+            input_path: 주어지면 저널의 입력 파일이 이 파일과 같을 때만 사용
+
+        Returns:
+            set: 주민등록번호
+        """
+        return {rrn for rrn, row in self.load(input_path).items() if row.get('상태') == '완료'}
+
+    def results(self, records, input_path=None):
+        """
+        입력 순서대로 결과 행 내보내기 (기록이 없는 행은 제외)
+
+        Args:
+            records: 입력 행 iterable (ExcelService.iter_residents 등, 한 번만 순회)
+            input_path: 주어지면 저널의 입력 파일이 이 파일과 같을 때만 사용
+
+        Yields:
+            dict: 결과 행 (ExcelService.write_results 입력)
+        """
+        rows = self.load(input_path)
+        for record in records:
+            row = rows.get(str(record.get('주민등록번호', '')))
+            if row is not None:
+                yield row
+
+    def _read(self):
+        """
+        저널 파일 읽기
+
+        Returns:
+            tuple: ({주민등록번호: 결과 행}, 마지막 start/resume 기록 또는 None)
+        """
+        rows = {}
+        last_start = None
+        if not self.exists():
+            return rows, last_start
+
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if '_event' in row:
+                    if row['_event'] in ('start', 'resume'):
+                        last_start = row
+                    continue
+                rows[str(row.get('주민등록번호', ''))] = row
+        return rows, last_start
+
+    def _last_start(self):
+        self.flush()
+        return self._read()[1]
+
+    def _write(self, row):
+        line = json.dumps(row, ensure_ascii=False, default=_json_default)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def _fail(self, error):
+        """기록 스레드 오류 보관 (첫 오류만)"""
+        print(f"실행 기록 쓰기 실패: {error}")
+        if self.error is None:
+            self.error = error
+
+    def _start_writer(self):
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer, name="RunJournalWriter", daemon=True)
+                self._writer.start()
+
+    def _run_writer(self):
+        try:
+            self._write_queued()
+        except Exception as e:
+            self._fail(e)
+            # 파일을 열지 못하는 등 기록 스레드가 멈춰도 flush/close가 영원히 기다리지 않도록
+            # 남은 요청은 처리한 것으로 표시
+            while True:
+                item = self._queue.get()
+                self._queue.task_done()
+                if item is None:
+                    return
+
+    def _write_queued(self):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            unsynced = 0
+            last_sync = time.monotonic()
+
+            def sync():
+                # 실패해도 기록 스레드는 계속 돌고, 오류는 append/flush에서 알림
+                nonlocal unsynced, last_sync
+                try:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    self.sync_count += 1
+                except OSError as e:
+                    self._fail(e)
+                finally:
+                    unsynced = 0
+                    last_sync = time.monotonic()
+
+            while True:
+                # 쓰고 아직 fsync하지 않은 기록이 있으면 sync_interval 안에 깨어남
+                timeout = max(0.0, last_sync + self.sync_interval - time.monotonic()) if unsynced else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    sync()
+                    continue
+                try:
+                    if item is None or item is _SYNC:
+                        if unsynced:
+                            sync()
+                        if item is None:
+                            return
+                        continue
+                    f.write(json.dumps(item, ensure_ascii=False, default=_json_default) + '\n')
+                    self.written_count += 1
+                    unsynced += 1
+                    if unsynced >= self.sync_every or time.monotonic() - last_sync >= self.sync_interval:
+                        sync()
+                except Exception as e:
+                    self._fail(e)
+                finally:
+                    self._queue.task_done()
@@ -0,0 +1,149 @@
+"""
+실행 결과 보관소 (열 형식)
+실행마다 결과를 Parquet(또는 Feather) 파일 하나로 남겨, 여러 달의 실행을 빠르게 합쳐 읽고 거른다.
+직원용 Excel 파일은 거른 결과에서 다시 만든다. pyarrow가 있어야 한다.
+"""
+
+import os
+from datetime import datetime
+
+from .excel_service import ExcelService, RESULT_COLUMNS, COLUMNAR_FORMATS
+
+
+DEFAULT_STORE_DIR = os.path.join("data", "runs")
+
+
+class RunStore:
+    """실행별 결과 파일 디렉토리"""
+
+    def __init__(self, directory=DEFAULT_STORE_DIR, file_format='parquet'):
+        """
+        Args:
+            directory: 결과 파일 디렉토리
+            file_format: 'parquet' 또는 'feather'
+        """
+        if file_format not in ('parquet', 'feather'):
+            raise ValueError(f"Unknown format '{file_format}' (choose 'parquet' or 'feather')")
+        self.directory = directory
+        self.extension = '.' + file_format
+
+    @staticmethod
+    def available():
+        """pyarrow 설치 여부"""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def write_run(self, results, run_id=None, source='', run_at=None):
+        """
+        실행 결과 1건 저장
+
+        Args:
+            results: 결과 행 iterable (RunJournal.results 등)
+            run_id: 실행 이름 (None이면 실행 시각 'YYYYmmdd_HHMMSS')
+            source: 입력 파일 경로 등 출처
+            run_at: 실행 시각 (None이면 현재)
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        run_at = run_at or datetime.now()
+        run_id = run_id or run_at.strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(self.directory, run_id + self.extension)
+        ExcelService.write_columnar(
+            path, results, extra={'run_id': run_id, 'run_at': run_at, 'source': source or ''}
+        )
+        return path
+
+    def import_file(self, path, run_id=None):
+        """
+        기존 결과 Excel/CSV 파일을 실행 결과로 가져오기 (실행 시각은 파일 수정 시각)
+
+        Args:
+            path: 결과 파일 경로 (write_results 형식)
+            run_id: 실행 이름 (None이면 파일 이름)
+
+        Returns:
+            str: 저장한 파일 경로
+        """
+        run_at = datetime.fromtimestamp(os.path.getmtime(path))
+        run_id = run_id or os.path.splitext(os.path.basename(path))[0]
+        return self.write_run(
+            ExcelService.iter_residents(path, columns=RESULT_COLUMNS), run_id=run_id, source=path, run_at=run_at
+        )
+
+    def runs(self):
+        """
+        저장된 실행 파일 경로 (이름순)
+
+        Returns:
+            list: 파일 경로
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            os.path.join(self.directory, name) for name in os.listdir(self.directory)
+            if name.endswith(self.extension) and '.tmp.' not in name
+        )
+
+    def load(self, runs=None, columns=None, status=None, resident_numbers=None, since=None, until=None,
+             latest=False):
+        """
+        여러 실행 결과를 합쳐 읽기 (조건은 파일을 읽을 때 적용)
+
+        Args:
+            runs: 실행 이름 또는 파일 경로 리스트 (None이면 전체)
+            columns: 읽을 컬럼 (None이면 전체)
+            status: '완료' 또는 '오류'만
+            resident_numbers: 이 주민등록번호들만
+            since: 이 시각 이후 실행만 (datetime)
+            until: 이 시각 이전 실행만 (datetime)
+            latest: True면 주민등록번호마다 가장 최근 실행의 결과 1건만
+
+        Returns:
+            pandas.DataFrame
+        """
+        import pyarrow.dataset as ds
+
+        paths = self.runs() if runs is None else [
+            run if run.endswith(tuple(COLUMNAR_FORMATS)) else os.path.join(self.directory, run + self.extension)
+            for run in runs
+        ]
+
+        conditions = []
+        if status is not None:
+            conditions.append(ds.field('상태') == status)
+        if resident_numbers is not None:
+            conditions.append(ds.field('주민등록번호').isin([str(rrn) for rrn in resident_numbers]))
+        if since is not None:
+            conditions.append(ds.field('run_at') >= since)
+        if until is not None:
+            conditions.append(ds.field('run_at') < until)
+
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        if latest and columns is not None:
+            columns = list(dict.fromkeys(list(columns) + ['주민등록번호', 'run_at']))
+
+        df = ExcelService.read_columnar(paths, columns=columns, filter=expression)
+        if latest and len(df):
+            df = df.sort_values('run_at', kind='stable').drop_duplicates('주민등록번호', keep='last')
+        return df
+
+    def export_excel(self, output_path, **conditions):
+        """
+        거른 결과를 직원용 Excel 파일로 내보내기
+
+        Args:
+            output_path: 출력 파일 경로
+            **conditions: load 인자 (status, since, latest 등)
+
+        Returns:
+            int: 쓴 행 수
+        """
+        df = self.load(**conditions)
+        return ExcelService.write_results(output_path, df.to_dict('records'))
@@ -5,12 +5,53 @@ MARK:
 """
 
 import time
-import pyautogui
-import os
 import platform
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from ..core.automation import GUIAutomation
 from ..core.screen_capture import ScreenCapture
-from ..core.image_matcher import ImageMatcher
+from ..core.frame_sampler import FrameSampler
+from ..core.pacing import PacingController
+from ..core.image_matcher import ImageMatcher, ColorMatcher, load_gray, clip_region, pad_region, union_region
+from ..core.template_registry import TemplateRegistry
+from ..core.digit_reader import DigitReader
+
+
+# 행복e음 화면 레이아웃: 입력 필드 템플릿 좌상단 기준 상대 영역 (dx, dy, width, height)
+# mock_system/app.py (800x600, 100% 배율, templates_window 기준)에서 측정한 값에 여유를 둔 것.
+# 입력 필드 템플릿 높이에 비례해 배율을 보정하며, 실제 시스템 화면이 다르면 layout 인자로 덮어쓴다.
+SCREEN_LAYOUT = {
+    'result_panel': (-160, 40, 850, 440),
+    'status_bar': (-160, 440, 420, 70),
+}
+LAYOUT_REFERENCE_HEIGHT = 45  # templates_window/input_field.png 높이
+
+# 백그라운드 샘플러(sampler_fps > 0)가 감시하는 레이아웃 영역
+WATCHED_REGIONS = ('result_panel', 'status_bar')
+
+# 입력 필드 전체 선택 단축키 (Linux의 Tk Entry는 Ctrl+A가 줄 처음으로 이동, 전체 선택은 Ctrl+/)
+SELECT_ALL_HOTKEY = ('ctrl', '/') if platform.system() == 'Linux' else ('ctrl', 'a')
+
+# 입력 필드 변화로 볼 최소 너비 (축소 서명 열 수). 깜빡이는 커서는 1~2열이라 무시된다.
+FIELD_CHANGE_WIDTH = 4
+
+# 조건 대기로 바뀐 기존 고정 지연 (초): 클릭 후 GUIAutomation 기본 지연 0.5 + sleep 0.1, 삭제/입력 후 sleep 0.1
+LEGACY_DELAYS = {'click': 0.6, 'clear': 0.1, 'type': 0.1}
+
+# 캐시된 UI 위치 확인 시 가장자리 띠만 비교할 요소 (입력한 번호 등 안쪽 내용이 바뀜) {이름: 띠 두께}
+VERIFY_BORDER = {'input_field': 8}
+
+# 마지막으로 알려진 위치 주변 검색 여백 (픽셀)
+ROI_PADDING = 48
+
+# 세대원 수 계산 방식
+#   template: 체크박스 템플릿 매칭
+#   components: 연결 요소 분석으로 체크박스 모양 세기 (템플릿 매칭 없음)
+#   projection: 결과 패널의 가로 투영으로 항목 행 세기
+COUNTERS = ('template', 'components', 'projection')
+
+# projection 방식에서 항목이 아닌 행 수 (결과 패널 제목 "세대원 정보 (이름)")
+PROJECTION_HEADER_ROWS = 1
 
 
 def get_template_dir():
@@ -35,73 +76,266 @@ def get_template_dir():
 class SearchAutomationService:
     """검색 자동화 서비스"""
     
-    def __init__(self, template_dir=None, target_window=None):
+    def __init__(self, template_dir=None, target_window=None, save_screenshots=False, layout=None,
+                 match_mode='template', scales=None, render_timeout=3.0, stable_frames=2,
+                 counter='template', cross_check_every=20, digit_trust=0.9, capture_backend='auto',
+                 sampler_fps=0, pacing=True, cache=None):
         """
         Args:
             template_dir: UI 템플릿 이미지 디렉토리 (None이면 OS 자동 탐지)
             target_window: 타겟 윈도우 이름 (None이면 전체 화면)
+            save_screenshots: True면 캡처한 화면을 모두, 정수 N이면 N장마다 1장 tmp/screenshots에 저장
+                (False여도 오류가 난 조회의 최근 화면은 저장)
+            layout: 화면 레이아웃 덮어쓰기 {'result_panel': (dx, dy, w, h), ...}
+            match_mode: UI 요소 매칭 방식 ('template': 원본 해상도, 'pyramid': 축소 후 정밀 매칭)
+            scales: pyramid 모드에서 시도할 템플릿 배율 (예: DPI_SCALES, None이면 1.0만)
+            render_timeout: '조회' 클릭 후 결과 화면 변화를 기다리는 최대 시간 (초)
+            stable_frames: 결과 화면이 연속으로 같아야 하는 폴링 횟수
+            counter: 세대원 수 계산 방식 ('template', 'components', 'projection')
+            cross_check_every: 상태바 숫자를 읽을 때 N건마다 화면 위젯 개수와 대조 (0이면 대조 안 함)
+                대조하지 않는 건은 상태바 숫자만 믿으므로, 신뢰도가 digit_trust 이상인 잘못 읽은 숫자는
+                잡아내지 못한다 (속도와 검증의 맞교환 — 모든 건을 대조하려면 1)
+            digit_trust: 상태바 숫자 신뢰도가 이 값보다 낮으면 cross_check_every와 무관하게 대조
+            capture_backend: 화면 캡처 백엔드 ('auto', 'pyautogui', 'xshm')
+            sampler_fps: 0보다 크면 결과 패널/상태바를 이 FPS로 백그라운드 캡처하고
+                결과 대기 시 폴링 대신 변경 이벤트를 기다림
+            pacing: True면 조회 간 간격을 결과 표시 지연/오류에 따라 자동 조절 (AIMD)
+            cache: ResultCache — 주어지면 유효 기간 안의 번호는 GUI 조회 없이 캐시 결과를 사용
         """
+        if counter not in COUNTERS:
+            raise ValueError(f"Unknown counter '{counter}' (choose from {COUNTERS})")
+
         # template_dir이 지정되지 않으면 OS에 따라 자동 설정
         if template_dir is None:
             template_dir = get_template_dir()
         
-        self.automation = GUIAutomation(delay=0.5)
-        self.capture = ScreenCapture(target_window=target_window)
-        self.matcher = ImageMatcher(confidence=0.7)  # 템플릿 매칭 신뢰도
+        # 동작마다 사후 조건을 기다리므로 pyautogui 자동 대기(PAUSE)는 끔
+        self.automation = GUIAutomation(delay=0.5, pause=0.0)
+        self.capture = ScreenCapture(
+            target_window=target_window, backend=capture_backend,
+            sample_every=1 if save_screenshots is True else int(save_screenshots or 0)
+        )
         self.template_dir = template_dir
+        self.save_screenshots = save_screenshots
+        self.match_mode = match_mode
+        self.scales = scales
+        self.render_timeout = render_timeout
+        self.stable_frames = stable_frames
+        self.counter = counter
+        self.cross_check_every = cross_check_every
+        self.digit_trust = digit_trust
+        self.lookup_count = 0
+
+        # 주민등록번호 결과 캐시 (None이면 사용 안 함)
+        self.cache = cache
+
+        # 조회 간격 제어 (정상이면 줄이고, 오류/화면 변화 없음/지연 급증 시 늘림)
+        self.pacer = PacingController() if pacing else None
+
+        # 백그라운드 프레임 샘플러 (결과 영역을 알게 된 뒤 시작)
+        self.sampler = FrameSampler(fps=sampler_fps, backend=capture_backend) if sampler_fps > 0 else None
+
+        # 템플릿은 디렉토리별로 한 번만 로드 (파일 변경 시 자동 재로드)
+        self.templates = TemplateRegistry.for_dir(template_dir)
+        self.matcher = ImageMatcher(confidence=0.7, templates=self.templates)  # 템플릿 매칭 신뢰도
+
+        # 상태바 숫자 인식 (템플릿 디렉토리/digits/0~9.png가 있을 때만 사용)
+        self.digits = DigitReader.for_template_dir(template_dir)
         
         # 사용 중인 템플릿 디렉토리 출력
         print(f"템플릿 디렉토리: {self.template_dir} (OS: {platform.system()})")
 
+        self.layout = dict(SCREEN_LAYOUT)
+        if layout:
+            self.layout.update(layout)
+
         # UI 요소 위치 캐시
         self.ui_cache = {}
+
+        # 마지막으로 찾은 위치 (clear_cache 후에도 ROI 검색 힌트로 유지)
+        self.last_known = {}
+
+        # UI 위치 캐시 계측 (확인 횟수, 통과, 불일치, 재검색, 확인에 쓴 시간)
+        self.ui_stats = {'validations': 0, 'hits': 0, 'mismatches': 0, 'researches': 0, 'validation_time': 0.0}
     
-    def find_ui_element(self, element_name, screenshot_path=None):
+    def find_ui_element(self, element_name, screenshot=None):
         """
         UI 요소 찾기 (OpenCV 템플릿 매칭)
 
         Args:
             element_name: 요소 이름 ('input_field', 'search_button', etc.)
-            screenshot_path: 스크린샷 경로 (None이면 새로 캡처)
+            screenshot: 스크린샷 경로 또는 프레임 (None이면 새로 캡처)
 
         Returns:
             dict: {'x', 'y', 'width', 'height', 'center_x', 'center_y'}
         """
-        # 캐시 확인
+        # 캐시 확인 (캐시된 위치의 화면이 아직 템플릿과 같은지 확인 후 사용)
         if element_name in self.ui_cache:
-            print(f"Using cached position for '{element_name}'")
-            return self.ui_cache[element_name]
+            if self._verify_cached(element_name, screenshot):
+                return self.ui_cache[element_name]
+            # 창이 움직였거나 화면이 바뀜 → 이 요소만 무효화하고 마지막 위치 주변부터 다시 검색
+            print(f"Cached position for '{element_name}' no longer matches, searching again")
+            del self.ui_cache[element_name]
+            self.ui_stats['researches'] += 1
 
-        # 스크린샷 캡처
-        if screenshot_path is None:
-            print(f"Capturing screen for '{element_name}'...")
-            screenshot_path = self.capture.capture_full_screen()
-            print(f"Screenshot saved: {screenshot_path}")
+        return self.locate_ui_elements([element_name], screenshot)[element_name]
 
-        # 템플릿 경로
-        template_path = os.path.join(self.template_dir, f"{element_name}.png")
+    def _verify_cached(self, element_name, screenshot=None):
+        """
+        캐시된 위치의 템플릿 크기 화면 조각을 템플릿과 비교 (NCC 1회, VERIFY_BORDER 요소는 가장자리만)
 
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"Template not found: {template_path}")
+        Args:
+            element_name: 요소 이름
+            screenshot: 스크린샷 경로 또는 capture_screen 프레임 (None이면 그 조각만 화면에서 캡처)
 
-        print(f"Searching for '{element_name}' using template matching...")
+        Returns:
+            bool: 신뢰도 임계값 이상이면 True
+        """
+        cached = self.ui_cache[element_name]
+        region = (cached['x'], cached['y'], cached['width'], cached['height'])
+
+        template = self.templates.get(element_name)
+        border = VERIFY_BORDER.get(element_name, 0)
+
+        start = time.perf_counter()
+        if screenshot is None:
+            patch = self.capture.grab(region, grayscale=True)
+            score = self.matcher.verify(patch, template, (0, 0) + region[2:], border=border)
+        else:
+            # 프레임 좌표로 변환 (경로로 받은 스크린샷은 전체 화면)
+            ox, oy = (0, 0) if isinstance(screenshot, str) else self.capture.origin
+            score = self.matcher.verify(
+                screenshot, template, (region[0] - ox, region[1] - oy) + region[2:], border=border
+            )
+        self.ui_stats['validations'] += 1
+        self.ui_stats['validation_time'] += time.perf_counter() - start
 
-        # OpenCV 템플릿 매칭
-        result = self.matcher.find_template(screenshot_path, template_path)
+        if score < self.matcher.confidence:
+            self.ui_stats['mismatches'] += 1
+            return False
+        self.ui_stats['hits'] += 1
+        return True
 
-        if result is None:
-            raise ValueError(f"UI element '{element_name}' not found")
+    def ui_cache_report(self):
+        """
+        UI 위치 캐시 확인 요약
 
-        print(f"Found '{element_name}' at ({result['center_x']}, {result['center_y']})")
+        Returns:
+            str: 한 줄 요약
+        """
+        stats = self.ui_stats
+        average = stats['validation_time'] / stats['validations'] * 1000 if stats['validations'] else 0.0
+        return (f"UI 위치 캐시: 확인 {stats['validations']}회 (평균 {average:.1f}ms), "
+                f"사용 {stats['hits']}회, 불일치 {stats['mismatches']}회, 재검색 {stats['researches']}회")
 
-        # 캐시 저장
-        self.ui_cache[element_name] = result
+    def locate_ui_elements(self, names, screenshot=None):
+        """
+        캐시에 없는 UI 요소들을 한 장의 스크린샷에서 한 번에 찾기
 
-        return result
+        Args:
+            names: 요소 이름 리스트 ('input_field', 'search_button', ...)
+            screenshot: 스크린샷 경로 (전체 화면) 또는 capture_screen 프레임 (None이면 새로 1회 캡처)
+
+        Returns:
+            dict: {이름: {'x', 'y', 'width', 'height', 'center_x', 'center_y'}} (화면 좌표)
+
+        Raises:
+            ValueError: 찾지 못한 요소가 있을 때
+        """
+        missing = [name for name in names if name not in self.ui_cache]
+
+        if missing:
+            origin = self.capture.origin
+            if screenshot is None:
+                print(f"Capturing screen for {missing}...")
+                screenshot = self.capture_screen()
+                origin = self.capture.origin
+            elif isinstance(screenshot, str):
+                screenshot = load_gray(screenshot)
+                origin = (0, 0)
+            ox, oy = origin
+
+            pyramid = self.match_mode == 'pyramid'
+
+            # 1차: 마지막으로 알려진 위치 주변만 검색
+            regions = {
+                name: pad_region(last['x'] - ox, last['y'] - oy, last['width'], last['height'], ROI_PADDING)
+                for name, last in self.last_known.items() if name in missing
+            }
+            found = {}
+            if regions:
+                print(f"Searching for {list(regions)} near last known positions...")
+                found = self.matcher.find_many(
+                    screenshot, list(regions), regions=regions, pyramid=pyramid, scales=self.scales
+                )
+
+            # 2차: 나머지는 전체 화면 검색
+            rest = [name for name in missing if found.get(name) is None]
+            if rest:
+                print(f"Searching for {rest} using template matching...")
+                found.update(self.matcher.find_many(
+                    screenshot, rest, pyramid=pyramid, scales=self.scales
+                ))
+
+            not_found = [name for name in missing if found.get(name) is None]
+            if not_found:
+                raise ValueError(f"UI element '{', '.join(not_found)}' not found")
+
+            for name in missing:
+                # 프레임 좌표 → 화면 좌표 (윈도우 영역 캡처 시)
+                result = dict(found[name])
+                for key in ('x', 'center_x'):
+                    result[key] += ox
+                for key in ('y', 'center_y'):
+                    result[key] += oy
+                print(f"Found '{name}' at ({result['center_x']}, {result['center_y']})")
+                self.ui_cache[name] = result
+                self.last_known[name] = result
+
+        return {name: self.ui_cache[name] for name in names}
+
+    def layout_region(self, name, shape=None):
+        """
+        입력 필드 위치를 기준으로 화면 영역 계산
+
+        Args:
+            name: SCREEN_LAYOUT 영역 이름 ('result_panel' 등)
+            shape: 프레임 shape (주어지면 마지막 capture_screen 프레임 좌표로 바꾸고 프레임 경계로 자름)
+
+        Returns:
+            tuple or None: (x, y, width, height), 입력 필드 위치를 모르면 None
+        """
+        anchor = self.ui_cache.get('input_field') or self.last_known.get('input_field')
+        if anchor is None or name not in self.layout:
+            return None
+
+        scale = anchor['height'] / LAYOUT_REFERENCE_HEIGHT
+        dx, dy, w, h = self.layout[name]
+        region = (
+            anchor['x'] + int(dx * scale),
+            anchor['y'] + int(dy * scale),
+            int(w * scale),
+            int(h * scale)
+        )
+
+        if shape is not None:
+            ox, oy = self.capture.origin
+            region = clip_region((region[0] - ox, region[1] - oy, region[2], region[3]), shape)
+
+        return region
     
+    def capture_screen(self):
+        """
+        검색용 화면 캡처 (그레이스케일 프레임, 최근 프레임 링 버퍼에 보관)
+
+        Returns:
+            numpy.ndarray: 그레이스케일 프레임
+        """
+        return self.capture.capture_frame(grayscale=True)
+
     def search_resident(self, resident_number):
         """
-        주민등록번호 검색
+        주민등록번호 검색 (캐시에 유효한 결과가 있으면 GUI 조회 생략)
 
         Args:
             resident_number: 주민등록번호
@@ -111,114 +345,424 @@ class SearchAutomationService:
                 'resident_number': 주민등록번호,
                 'household_count': 세대원 수,
                 'status': 'success' or 'error',
-                'message': 메시지
+                'message': 메시지,
+                'render_latency': 결과 표시까지 걸린 시간 (초, 화면 변화가 없었으면 None),
+                'cached': 캐시 결과 여부
             }
         """
-        try:            
-            input_field = self.find_ui_element('input_field')
-            
-            self.automation.click(
-                input_field['center_x'],
-                input_field['center_y']
-            )
-            time.sleep(0.1)
-            pyautogui.hotkey('ctrl','a')
-            pyautogui.press('delete')
-            time.sleep(0.1)
-            # 주민등록번호 입력 (타이핑 방식)
-            pyautogui.write(resident_number, interval=0.01)
-            time.sleep(0.1)
-            # 검색 버튼 찾기
-            search_button = self.find_ui_element('search_button')
-            
-            # 검색 버튼 클릭
-            self.automation.click(
-                search_button['center_x'],
-                search_button['center_y']
-            )
-            
-            time.sleep(0.1)
-            # 결과 영역 캡처
-            result_screenshot = self.capture.capture_full_screen()
-            # 세대원 수 추출 (이미지 매칭 방식)
-            print("Counting checkboxes with image matching...")
-            household_count = self._count_checkboxes_by_image(result_screenshot)
-            print(f"   Found {household_count} household members (Image Matching)")
-            
-            return {
-                'resident_number': resident_number,
-                'household_count': household_count,
-                'status': 'success',
-                'message': f'Found {household_count} members'
-            }
-            
+        cached = self._cached_result(resident_number)
+        if cached is not None:
+            return cached
+        return self._lookup(resident_number)
+
+    def _lookup(self, resident_number):
+        """GUI 조회 1건 (캐시 확인 없음, 성공하면 캐시에 저장)"""
+        try:
+            lookup = self._drive_lookup(resident_number)
+            result = self._analyze_lookup(resident_number, lookup)
         except Exception as e:
             print(f"Error: {e}")
-            return {
-                'resident_number': resident_number,
-                'household_count': 0,
-                'status': 'error',
-                'message': str(e)
-            }
+            result = self._error_result(resident_number, str(e))
+
+        if result['status'] != 'success':
+            self.capture.persist_recent(reason="조회 오류")
+        self._store_result(result)
+        return result
+
+    def _cached_result(self, resident_number):
+        """
+        캐시에 있는 유효한 결과 (캐시를 쓰지 않거나 없으면 None)
+
+        Returns:
+            dict or None: search_resident 결과 형식
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.get(resident_number)
+        if entry is None:
+            return None
+
+        looked_up = time.strftime('%Y-%m-%d', time.localtime(entry['updated_at']))
+        print(f"   캐시 결과 사용: {entry['household_count']}명 ({looked_up} 조회)")
+        return {
+            'resident_number': resident_number,
+            'household_count': entry['household_count'],
+            'status': 'success',
+            'message': f"Cached result ({looked_up})",
+            'render_latency': None,
+            'cached': True
+        }
+
+    def _store_result(self, result):
+        """GUI 조회에 성공한 결과를 캐시에 저장"""
+        if self.cache is not None and result['status'] == 'success' and not result.get('cached'):
+            self.cache.put(result['resident_number'], result['household_count'])
+
+    def _drive_lookup(self, resident_number):
+        """
+        GUI 조작 단계: 번호 입력 → '조회' 클릭 → 결과 대기 → 결과 화면 캡처
+
+        분석에 필요한 영역은 이 시점의 프레임 좌표로 계산해 두므로,
+        분석 단계는 다른 스레드에서 다음 조회와 동시에 실행할 수 있다.
+
+        Args:
+            resident_number: 주민등록번호
+
+        Returns:
+            dict: {'frame', 'latency', 'result_panel', 'status_bar', 'cross_check'}
+        """
+        # 콜드 스타트 시 입력 필드/검색 버튼을 한 장의 스크린샷에서 함께 찾기
+        self.locate_ui_elements(['input_field', 'search_button'])
+
+        input_field = self.find_ui_element('input_field')
+        # 입력 필드 + 포커스 테두리 (클릭/입력 후 변화 확인용)
+        field_region = pad_region(
+            input_field['x'], input_field['y'], input_field['width'], input_field['height'], 4
+        )
+
+        # 클릭 → 포커스 테두리 변화 (이미 포커스가 있으면 바뀌는 것이 없으므로 최대 0.1초)
+        self.automation.click(
+            input_field['center_x'],
+            input_field['center_y'],
+            delay=0.1,
+            until=self.capture.change_condition(field_region, min_width=FIELD_CHANGE_WIDTH),
+            legacy_delay=LEGACY_DELAYS['click']
+        )
+        # 전체 선택 + 삭제 → 이전 번호가 지워짐 (첫 조회처럼 비어 있으면 0.1초 후 진행)
+        cleared = self.capture.change_condition(field_region, min_width=FIELD_CHANGE_WIDTH)
+        self.automation.hotkey(*SELECT_ALL_HOTKEY, delay=0)
+        self.automation.press_key('delete', delay=0.1, until=cleared, legacy_delay=LEGACY_DELAYS['clear'])
+        # 주민등록번호 입력 (타이핑 방식) → 입력 필드에 번호가 그려짐
+        self.automation.type_text(
+            resident_number, interval=0.01, delay=0.1,
+            until=self.capture.change_condition(field_region, min_width=FIELD_CHANGE_WIDTH),
+            legacy_delay=LEGACY_DELAYS['type']
+        )
+        # 검색 버튼 찾기
+        search_button = self.find_ui_element('search_button')
+
+        # 결과 패널 + 상태바 ("조회 결과: N명") 기준 서명
+        watch_region = union_region(
+            self.layout_region('result_panel'), self.layout_region('status_bar')
+        )
+        if self.sampler:
+            self._watch_result_regions()
+            baseline = self.sampler.versions()
+        else:
+            baseline = self.capture.region_signature(watch_region)
+
+        # 검색 버튼 클릭 (고정 대기 없이 화면 변화로 판단). 결과 대기 시간은 render_latency로 따로 집계하므로
+        # 기존 고정 지연(0.6초)을 절약 시간에 넣지 않는다.
+        self.automation.click(
+            search_button['center_x'],
+            search_button['center_y'],
+            delay=0
+        )
+
+        # 새 결과가 그려지고 안정될 때까지 대기
+        latency = self._wait_for_result(watch_region, baseline)
+
+        # 결과 영역 캡처 (메모리 프레임)
+        frame = self.capture_screen()
+
+        # 주기적으로 화면 위젯 개수와 대조 (첫 건 포함)
+        self.lookup_count += 1
+        cross_check = bool(self.cross_check_every) and (self.lookup_count - 1) % self.cross_check_every == 0
+
+        return {
+            'frame': frame,
+            'latency': latency,
+            'result_panel': self.layout_region('result_panel', frame.shape),
+            'status_bar': self.layout_region('status_bar', frame.shape),
+            'cross_check': cross_check,
+        }
+
+    def _analyze_lookup(self, resident_number, lookup):
+        """
+        분석 단계: 캡처한 결과 화면에서 세대원 수 읽기 (GUI 조작 없음)
+
+        Args:
+            resident_number: 주민등록번호
+            lookup: _drive_lookup 결과
+
+        Returns:
+            dict: search_resident 결과
+        """
+        # 세대원 수 추출 (상태바 숫자 우선, 없으면 counter 설정에 따라)
+        household_count, mismatch = self._read_household_count(
+            lookup['frame'], lookup['result_panel'], lookup['status_bar'], lookup['cross_check']
+        )
+
+        if mismatch:
+            print(f"   {mismatch}")
+            return self._error_result(resident_number, mismatch, household_count, lookup['latency'])
+
+        return {
+            'resident_number': resident_number,
+            'household_count': household_count,
+            'status': 'success',
+            'message': f'Found {household_count} members',
+            'render_latency': lookup['latency'],
+            'cached': False
+        }
+
+    @staticmethod
+    def _error_result(resident_number, message, household_count=0, latency=None):
+        """오류 결과 dict"""
+        return {
+            'resident_number': resident_number,
+            'household_count': household_count,
+            'status': 'error',
+            'message': message,
+            'render_latency': latency,
+            'cached': False
+        }
     
-    def _count_checkboxes_by_image(self, screenshot_path):
+    def _wait_for_result(self, region, baseline):
         """
-        이미지 매칭으로 체크박스 개수 세기
+        '조회' 클릭 후 결과 영역이 바뀌고 안정될 때까지 대기
+
+        Args:
+            region: 감시 영역 (결과 패널 + 상태바)
+            baseline: 클릭 전 서명 (샘플러 사용 시 sampler.versions())
+
+        Returns:
+            float or None: 결과 표시까지 걸린 시간 (초), 변화가 없으면 (시간 초과) None
+        """
+        if self.sampler:
+            return self._wait_for_result_events(baseline)
+
+        changed = self.capture.wait_for_change(region, timeout=self.render_timeout, baseline=baseline)
+        if changed is None:
+            # 같은 결과가 연속으로 나오는 경우 등: 시간 초과 후 현재 화면으로 진행
+            print(f"   결과 화면 변화 없음 ({self.render_timeout:.1f}초 초과), 현재 화면으로 진행")
+            return None
+
+        stable = self.capture.wait_for_stable(
+            region, frames=self.stable_frames, timeout=self.render_timeout
+        )
+        print(f"   결과 표시: {changed * 1000:.0f}ms"
+              + (f", 안정화: {stable * 1000:.0f}ms" if stable is not None else ", 안정화 시간 초과"))
+        return changed
+
+    def pace(self, result):
+        """
+        조회 결과로 다음 조회 전 간격 조절 (pacing이 꺼져 있으면 무시)
 
         Args:
-            screenshot_path: 스크린샷 파일 경로
+            result: search_resident 결과
+
+        Returns:
+            float: 조절된 간격 (초)
+        """
+        if self.pacer is None:
+            return 0.0
+        latency = result.get('render_latency')
+        return self.pacer.update(latency, ok=result['status'] == 'success', stale=latency is None)
+
+    def pacing_report(self):
+        """
+        조회 간격 변화 요약 (pacing이 꺼져 있으면 None)
+
+        Returns:
+            str or None: PacingController.report()
+        """
+        return self.pacer.report() if self.pacer else None
+
+    def _watch_result_regions(self):
+        """샘플러에 결과 패널/상태바 영역 등록 (위치가 바뀌면 교체) 후 시작"""
+        width, height = self.capture.get_screen_size()
+        for name in WATCHED_REGIONS:
+            region = self.layout_region(name)
+            region = clip_region(region, (height, width)) if region else None
+            if region:
+                self.sampler.watch(name, region)
+        self.sampler.start()
+
+    def _wait_for_result_events(self, baseline):
+        """
+        샘플러 변경 이벤트로 결과 대기 ("결과 패널 변경" 또는 "상태바 변경")
+
+        Args:
+            baseline: 클릭 전 sampler.versions()
+
+        Returns:
+            float or None: 결과 표시까지 걸린 시간 (초), 변화가 없으면 None
+        """
+        event = self.sampler.wait_for_change(WATCHED_REGIONS, baseline, timeout=self.render_timeout)
+        if event is None:
+            print(f"   결과 화면 변화 없음 ({self.render_timeout:.1f}초 초과), 현재 화면으로 진행")
+            return None
+
+        name, changed = event
+        stable = self.sampler.wait_for_stable(
+            WATCHED_REGIONS, frames=self.stable_frames, timeout=self.render_timeout
+        )
+        print(f"   결과 표시 ({name}): {changed * 1000:.0f}ms"
+              + (f", 안정화: {stable * 1000:.0f}ms" if stable is not None else ", 안정화 시간 초과"))
+        return changed
+
+    def sampler_stats(self):
+        """
+        백그라운드 샘플러 계측값 (샘플러를 쓰지 않으면 None)
+
+        Returns:
+            dict or None: FrameSampler.stats()
+        """
+        return self.sampler.stats() if self.sampler else None
+
+    def close(self):
+        """백그라운드 샘플러 종료 및 캡처 자원 해제"""
+        if self.sampler:
+            self.sampler.stop()
+        self.capture.close()
+
+    def _read_household_count(self, screenshot, result_panel, status_bar, cross_check=False):
+        """
+        세대원 수 읽기: 상태바 "조회 결과: N명" 숫자를 우선 사용
+
+        상태바를 읽지 못하면 결과 패널 위젯 개수를 세고,
+        cross_check이거나 숫자 신뢰도가 digit_trust보다 낮으면 두 값을 대조한다.
+
+        Args:
+            screenshot: 결과 화면 프레임
+            result_panel: 프레임 좌표의 결과 패널 영역
+            status_bar: 프레임 좌표의 상태바 영역
+            cross_check: True면 상태바 숫자를 화면 위젯 개수와 대조
+
+        Returns:
+            tuple: (세대원 수, 불일치 메시지 또는 None)
+        """
+        status_count = None
+        if self.digits.available:
+            status_count, confidence = self.digits.read(screenshot, status_bar)
+            if status_count is None:
+                print("   상태바 숫자를 읽지 못했습니다, 화면 위젯으로 계산")
+            else:
+                print(f"   상태바: {status_count}명 (신뢰도 {confidence:.2f})")
+
+        if status_count is None:
+            return self.count_household(screenshot, region=result_panel), None
+
+        # 정기 대조 대상이 아니어도 숫자 매칭이 애매하면 대조
+        if cross_check or confidence < self.digit_trust:
+            widget_count = self.count_household(screenshot, region=result_panel)
+            if widget_count != status_count:
+                return status_count, f"세대원 수 불일치: 상태바 {status_count}명, 화면 {widget_count}명"
+
+        return status_count, None
+
+    def count_household(self, screenshot, region=None):
+        """
+        counter 설정에 따라 세대원 수 계산
+
+        Args:
+            screenshot: 스크린샷 파일 경로 또는 프레임 (numpy.ndarray)
+            region: (x, y, width, height) 결과 패널 영역 (None이면 전체 화면)
+
+        Returns:
+            int: 세대원 수
+        """
+        if self.counter == 'components':
+            print("Counting checkboxes with connected components...")
+            count = self._count_checkboxes_by_components(screenshot, region)
+            label = 'Connected Components'
+        elif self.counter == 'projection':
+            print("Counting rows with projection profile...")
+            count = self._count_rows_by_projection(screenshot, region)
+            label = 'Projection Profile'
+        else:
+            print("Counting checkboxes with image matching...")
+            count = self._count_checkboxes_by_image(screenshot, region=region)
+            label = 'Image Matching'
+
+        print(f"   Found {count} household members ({label})")
+        return count
+
+    def _count_checkboxes_by_components(self, screenshot, region=None):
+        """
+        연결 요소 분석으로 체크박스 개수 세기 (템플릿 매칭 없음)
+
+        Args:
+            screenshot: 스크린샷 파일 경로 또는 프레임
+            region: 결과 패널 영역 (None이면 전체 화면)
 
         Returns:
             int: 체크박스 개수
         """
         try:
-            # 체크박스 템플릿 경로
-            checkbox_template = os.path.join(self.template_dir, 'checkbox.png')
+            # 흰색 결과 패널 안쪽으로 한정
+            panel = ColorMatcher.find_panel(screenshot, region) or region
 
-            if not os.path.exists(checkbox_template):
-                print(f"체크박스 템플릿이 없습니다: {checkbox_template}")
-                print(f"템플릿 생성 도구를 실행하세요: ./venv/bin/python tools/create_templates.py")
-                return 0
+            # 체크박스 크기는 템플릿에서 추정 (없으면 기본값)
+            box_size = None
+            if self.templates.exists('checkbox'):
+                box_size = ColorMatcher.box_size_from_template(self.templates.get('checkbox'))
 
-            # 템플릿 매칭으로 모든 체크박스 찾기
-            import cv2
-            import numpy as np
+            boxes = ColorMatcher.find_checkboxes(screenshot, panel, box_size=box_size or (14, 14))
+            print(f"체크박스 모양 요소: {len(boxes)}개 (크기: {box_size or (14, 14)})")
 
-            # 이미지 로드
-            screenshot = cv2.imread(screenshot_path)
-            template = cv2.imread(checkbox_template)
+            return len(boxes)
 
-            if screenshot is None or template is None:
-                print(f"이미지 로드 실패")
+        except Exception as e:
+            print(f"체크박스 카운팅 오류: {e}")
+            return 0
+
+    def _count_rows_by_projection(self, screenshot, region=None):
+        """
+        결과 패널의 가로 투영으로 세대원 행 개수 세기
+
+        Args:
+            screenshot: 스크린샷 파일 경로 또는 프레임
+            region: 결과 패널 영역 (None이면 전체 화면)
+
+        Returns:
+            int: 세대원 행 개수 (제목 행 제외)
+        """
+        try:
+            panel = ColorMatcher.find_panel(screenshot, region) or region
+            rows = ColorMatcher.find_rows(screenshot, panel)
+            print(f"결과 패널 행: {len(rows)}개 (제목 {PROJECTION_HEADER_ROWS}행 제외)")
+
+            return max(0, len(rows) - PROJECTION_HEADER_ROWS)
+
+        except Exception as e:
+            print(f"행 카운팅 오류: {e}")
+            return 0
+
+    def _count_checkboxes_by_image(self, screenshot, region=None):
+        """
+        이미지 매칭으로 체크박스 개수 세기
+
+        Args:
+            screenshot: 스크린샷 파일 경로 또는 프레임 (numpy.ndarray)
+            region: (x, y, width, height) 결과 패널 영역 (None이면 전체 화면)
+
+        Returns:
+            int: 체크박스 개수
+        """
+        try:
+            # 체크박스 템플릿 (레지스트리 캐시)
+            if not self.templates.exists('checkbox'):
+                print(f"체크박스 템플릿이 없습니다: {self.templates.path('checkbox')}")
+                print(f"템플릿 생성 도구를 실행하세요: ./venv/bin/python tools/create_templates.py")
                 return 0
 
-            # 그레이스케일 변환
-            screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+            # 이미지 로드 (프레임은 그대로, 경로는 읽어서 그레이스케일 변환)
+            screenshot_gray = load_gray(screenshot)
+            template_gray = self.templates.get('checkbox').gray
 
-            # 템플릿 매칭
-            result = cv2.matchTemplate(screenshot_gray, template_gray, cv2.TM_CCOEFF_NORMED)
+            if screenshot_gray is None or template_gray is None:
+                print(f"이미지 로드 실패")
+                return 0
 
-            # 임계값 이상인 위치 찾기
+            # 템플릿 매칭 (결과 패널 영역만) + 중복 제거 (NMS)
             threshold = 0.7  # 70% 이상 일치
-            locations = np.where(result >= threshold)
-
             print(f"체크박스 매칭 시도 (임계값: {threshold})")
-            print(f"매칭 후보: {len(locations[0])}개")
-
-            # 중복 제거 (가까운 위치는 하나로 간주)
-            matches = []
-            for pt in zip(*locations[::-1]):
-                # 기존 매치와 너무 가까우면 스킵
-                is_duplicate = False
-                for existing_pt in matches:
-                    distance = np.sqrt((pt[0] - existing_pt[0])**2 + (pt[1] - existing_pt[1])**2)
-                    if distance < 20:  # 20픽셀 이내면 중복
-                        is_duplicate = True
-                        break
-
-                if not is_duplicate:
-                    matches.append(pt)
+
+            matches = self.matcher.find_all_templates(
+                screenshot_gray, template_gray, threshold=threshold, region=region
+            )
 
             count = len(matches)
             print(f"매칭된 체크박스: {count}개 (임계값: {threshold})")
@@ -231,39 +775,141 @@ class SearchAutomationService:
             traceback.print_exc()
             return 0
 
-    def batch_search(self, resident_numbers, callback=None):
+    def iter_search(self, resident_numbers, pipeline=False):
+        """
+        순서대로 검색하며 결과를 입력 순서대로 내보내는 제너레이터
+
+        pipeline=True면 N번째 결과 화면 분석(OpenCV)을 작업 스레드에서 실행하고,
+        그동안 GUI 조작은 N+1번째 번호 입력을 진행한다. GUI 조작 스레드는 분석을 기다리지 않으며,
+        완료된 결과만 입력 순서대로 꺼낸다. 중간에 반복을 멈추면 진행 중인 분석까지만 마친다.
+
+        Args:
+            resident_numbers: 주민등록번호 iterable
+            pipeline: True면 GUI 조작과 화면 분석을 겹쳐서 실행
+
+        Yields:
+            tuple: (입력 순번 0부터, search_resident 결과)
+        """
+        if not pipeline:
+            driven = False
+            for i, resident_number in enumerate(resident_numbers):
+                result = self._cached_result(resident_number)
+                if result is None:
+                    # 간격 대기/조절은 GUI로 조회한 건 사이에서만
+                    if driven and self.pacer:
+                        self.pacer.wait()
+                    driven = True
+                    result = self._lookup(resident_number)
+                    self.pace(result)
+                yield i, result
+            return
+
+        # OpenCV는 연산 중 GIL을 놓으므로 스레드 1개로 GUI 조작과 겹쳐 실행됨
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LookupAnalysis")
+        pending = deque()
+        driven = False
+        try:
+            for i, resident_number in enumerate(resident_numbers):
+                cached = self._cached_result(resident_number)
+                if cached is not None:
+                    future = Future()
+                    future.set_result(cached)
+                    pending.append((i, future))
+                    continue
+
+                if driven and self.pacer:
+                    self.pacer.wait()
+                driven = True
+
+                try:
+                    lookup = self._drive_lookup(resident_number)
+                    future = executor.submit(self._analyze_in_background, resident_number, lookup)
+                except Exception as e:
+                    print(f"Error: {e}")
+                    self.capture.persist_recent(reason="조회 오류")
+                    future = Future()
+                    future.set_result(self._error_result(resident_number, str(e)))
+                pending.append((i, future))
+
+                # 이미 끝난 분석만 순서대로 꺼냄 (기다리지 않음)
+                while pending and pending[0][1].done():
+                    index, done = pending.popleft()
+                    yield index, self._finish_pipelined(done.result())
+
+            while pending:
+                index, future = pending.popleft()
+                yield index, self._finish_pipelined(future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _finish_pipelined(self, result):
+        """파이프라인 결과 후처리 (간격 조절, 캐시 저장 — 캐시 결과는 제외)"""
+        if not result.get('cached'):
+            self.pace(result)
+            self._store_result(result)
+        return result
+
+    def _analyze_in_background(self, resident_number, lookup):
+        """작업 스레드용 분석 (예외와 오류 화면 저장까지 처리)"""
+        try:
+            result = self._analyze_lookup(resident_number, lookup)
+        except Exception as e:
+            print(f"Error: {e}")
+            result = self._error_result(resident_number, str(e), latency=lookup['latency'])
+        if result['status'] != 'success':
+            # 링 버퍼는 이미 다음 조회 화면을 담고 있으므로 분석한 프레임을 저장
+            self.capture.frames.save(lookup['frame'], prefix="error")
+        return result
+
+    def batch_search(self, resident_numbers, callback=None, pipeline=False):
         """
         일괄 검색
         
         Args:
             resident_numbers: 주민등록번호 리스트
             callback: 진행 상황 콜백 함수 (index, total, result)
+            pipeline: True면 결과 화면 분석을 다음 번호 입력과 겹쳐서 실행
             
         Returns:
-            list: 검색 결과 리스트
+            list: 검색 결과 리스트 (입력 순서)
         """
         results = []
         total = len(resident_numbers)
+        self.automation.reset_report()
         
-        for i, resident_number in enumerate(resident_numbers, 1):
+        for i, result in self.iter_search(resident_numbers, pipeline=pipeline):
             print(f"\n{'='*60}")
-            print(f"Progress: {i}/{total}")
+            print(f"Progress: {i + 1}/{total}")
             print(f"{'='*60}")
-            
-            result = self.search_resident(resident_number)
+
             results.append(result)
             
             if callback:
-                callback(i, total, result)
-            
-            # 다음 검색 전 대기
-            if i < total:
-                time.sleep(0.2)
+                callback(i + 1, total, result)
+
+        self.print_run_report()
         
         return results
+
+    def print_run_report(self):
+        """실행 요약 출력 (대기 시간, UI 위치 캐시, 조회 간격, 샘플러) 및 스크린샷 저장 완료 대기"""
+        self.capture.frames.flush()
+
+        print(f"대기 시간: {self.automation.format_report()}")
+        print(self.ui_cache_report())
+        if self.pacer:
+            print(self.pacing_report())
+
+        if self.cache is not None:
+            print(f"결과 캐시: 사용 {self.cache.hits}건, 조회 {self.cache.misses}건")
+
+        stats = self.sampler_stats()
+        if stats:
+            print(f"샘플러: {stats['fps']:.1f} fps, {stats['frames']}프레임, "
+                  f"놓친 프레임 {stats['dropped']}, CPU {stats['cpu'] * 100:.0f}%")
     
     def clear_cache(self):
-        """UI 위치 캐시 초기화"""
+        """UI 위치 캐시 초기화 (마지막 위치는 ROI 검색 힌트로 유지)"""
         self.ui_cache.clear()
 
 
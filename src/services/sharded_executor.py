@@ -0,0 +1,243 @@
+"""
+병렬 조회 실행기 (Linux 전용)
+Xvfb 가상 디스플레이마다 대상 프로그램(기본: mock_system/app.py)을 하나씩 띄우고,
+디스플레이별 작업 프로세스(SearchAutomationService)가 공용 작업 큐에서 번호를 가져가 조회한다.
+결과는 입력 순서대로 합친다.
+"""
+
+import os
+import sys
+import time
+import queue
+import subprocess
+import multiprocessing
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_APP = os.path.join(PROJECT_ROOT, "mock_system", "app.py")
+
+
+class XvfbDisplay:
+    """Xvfb 가상 디스플레이 하나"""
+
+    def __init__(self, number=None, size=(1280, 800), depth=24):
+        """
+        Args:
+            number: 디스플레이 번호 (None이면 비어 있는 번호 자동 선택)
+            size: (width, height)
+            depth: 색 깊이
+        """
+        self.number = number
+        self.size = size
+        self.depth = depth
+        self.process = None
+
+    @property
+    def name(self):
+        return f":{self.number}"
+
+    @staticmethod
+    def free_number(start=90):
+        """사용 중이 아닌 디스플레이 번호"""
+        number = start
+        while (os.path.exists(f"/tmp/.X{number}-lock")
+               or os.path.exists(f"/tmp/.X11-unix/X{number}")):
+            number += 1
+        return number
+
+    def start(self, timeout=10.0):
+        """
+        Xvfb 시작 후 접속 가능해질 때까지 대기
+
+        Raises:
+            RuntimeError: 시간 안에 시작되지 않을 때
+        """
+        if self.number is None:
+            self.number = self.free_number()
+        width, height = self.size
+        self.process = subprocess.Popen(
+            ['Xvfb', self.name, '-screen', '0', f'{width}x{height}x{self.depth}', '-nolisten', 'tcp'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        socket = f"/tmp/.X11-unix/X{self.number}"
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(socket):
+            if self.process.poll() is not None or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError(f"Xvfb {self.name} failed to start")
+            time.sleep(0.05)
+        return self
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+
+def _worker(display, tasks, results, options):
+    """
+    작업 프로세스: 지정한 디스플레이에 묶인 SearchAutomationService로 조회
+
+    pyautogui는 import 시점의 DISPLAY에 연결하므로, DISPLAY를 먼저 바꾼 뒤 서비스를 import한다.
+    """
+    os.environ['DISPLAY'] = display
+    sys.path.insert(0, PROJECT_ROOT)
+
+    from src.core import xlib
+    xlib.init_threads()
+
+    from src.services.search_service import SearchAutomationService
+    from src.services.result_cache import ResultCache
+
+    cache_path = options.pop('cache_path', None)
+    startup_timeout = options.pop('startup_timeout', 30.0)
+    cache = ResultCache(cache_path) if cache_path else None
+
+    service = None
+    try:
+        service = SearchAutomationService(cache=cache, **options)
+
+        # 대상 프로그램 창이 뜰 때까지 대기
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                service.locate_ui_elements(['input_field', 'search_button'])
+                break
+            except ValueError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.5)
+
+        def numbers():
+            while True:
+                task = tasks.get()
+                if task is None:
+                    return
+                indices.append(task[0])
+                yield task[1]
+
+        indices = []
+        for position, result in service.iter_search(numbers()):
+            results.put((indices[position], result))
+    except Exception as e:
+        results.put((None, f"{display}: {e}"))
+    finally:
+        if service is not None:
+            service.print_run_report()
+            service.close()
+        if cache is not None:
+            cache.close()
+        results.put((None, None))
+
+
+class ShardedExecutor:
+    """가상 디스플레이 N개에서 동시에 조회"""
+
+    def __init__(self, workers=2, app_command=None, display_size=(1280, 800), startup_timeout=30.0,
+                 cache_path=None, **service_options):
+        """
+        Args:
+            workers: 디스플레이/작업 프로세스 수
+            app_command: 디스플레이마다 실행할 대상 프로그램 명령 (None이면 mock_system/app.py)
+            display_size: 가상 디스플레이 크기 (width, height)
+            startup_timeout: 대상 프로그램 창이 뜰 때까지 기다리는 최대 시간 (초)
+            cache_path: ResultCache 파일 경로 (None이면 캐시 사용 안 함)
+            **service_options: SearchAutomationService 인자 (template_dir, counter 등)
+        """
+        self.workers = workers
+        self.app_command = app_command or [sys.executable, DEFAULT_APP]
+        self.display_size = display_size
+        self.options = dict(service_options, startup_timeout=startup_timeout, cache_path=cache_path)
+
+    def run(self, resident_numbers, callback=None):
+        """
+        번호를 작업 프로세스들에 나눠 조회하고 입력 순서대로 합치기
+
+        Args:
+            resident_numbers: 주민등록번호 리스트
+            callback: 진행 상황 콜백 함수 (index, total, result) — 입력 순서대로 호출
+
+        Returns:
+            list: 검색 결과 리스트 (입력 순서)
+        """
+        total = len(resident_numbers)
+        # spawn: 작업 프로세스가 부모의 pyautogui/X 연결을 물려받지 않도록
+        context = multiprocessing.get_context('spawn')
+        tasks = context.Queue()
+        results = context.Queue()
+
+        for task in enumerate(resident_numbers):
+            tasks.put(task)
+        for _ in range(self.workers):
+            tasks.put(None)
+
+        displays, apps, processes = [], [], []
+        merged = {}
+        ordered = []
+        try:
+            for _ in range(self.workers):
+                display = XvfbDisplay(size=self.display_size).start()
+                displays.append(display)
+                apps.append(subprocess.Popen(
+                    self.app_command, env=dict(os.environ, DISPLAY=display.name), cwd=PROJECT_ROOT
+                ))
+                process = context.Process(
+                    target=_worker, args=(display.name, tasks, results, dict(self.options)), daemon=True
+                )
+                process.start()
+                processes.append(process)
+                print(f"작업 {len(processes)}: 디스플레이 {display.name}")
+
+            running = self.workers
+            while running:
+                try:
+                    index, result = results.get(timeout=1.0)
+                except queue.Empty:
+                    if not any(p.is_alive() for p in processes):
+                        break
+                    continue
+
+                if index is None:
+                    if result is None:
+                        running -= 1
+                    else:
+                        print(f"작업 프로세스 오류: {result}")
+                    continue
+
+                merged[index] = result
+                # 앞에서부터 연속으로 도착한 결과만 순서대로 내보냄
+                while len(ordered) in merged:
+                    i = len(ordered)
+                    ordered.append(merged.pop(i))
+                    if callback:
+                        callback(i + 1, total, ordered[-1])
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            for app in apps:
+                app.terminate()
+            for display in displays:
+                display.stop()
+
+        # 작업 프로세스가 비정상 종료해 빠진 번호는 오류로 채움
+        for i in range(len(ordered), total):
+            result = merged.pop(i, None) or {
+                'resident_number': resident_numbers[i],
+                'household_count': 0,
+                'status': 'error',
+                'message': 'Worker exited before this record was looked up',
+                'render_latency': None,
+                'cached': False
+            }
+            ordered.append(result)
+            if callback:
+                callback(i + 1, total, result)
+
+        return ordered
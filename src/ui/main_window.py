@@ -23,7 +23,11 @@ class MainWindow:
         # 변수
         self.input_file_path = tk.StringVar()
         self.output_file_path = tk.StringVar()
+        self.pipeline_mode = tk.BooleanVar(value=False)
+        self.resume_mode = tk.BooleanVar(value=False)
+        self.cache_mode = tk.BooleanVar(value=True)
         self.is_running = False
+        self.save_thread = None
         self.total_count = 0
         self.current_index = 0
         
@@ -119,6 +123,31 @@ class MainWindow:
             fg="black",
             width=10
         ).grid(row=1, column=2, pady=5)
+
+        # 실행 옵션
+        tk.Checkbutton(
+            file_frame,
+            text="파이프라인 모드 (다음 번호를 입력하는 동안 이전 결과 화면 분석)",
+            variable=self.pipeline_mode,
+            font=("맑은 고딕", 9),
+            bg="#f5f5f5"
+        ).grid(row=3, column=1, sticky=tk.W, padx=10, pady=(5, 0))
+
+        tk.Checkbutton(
+            file_frame,
+            text="이어서 실행 (출력 파일 옆 실행 기록에서 완료된 번호는 건너뜀)",
+            variable=self.resume_mode,
+            font=("맑은 고딕", 9),
+            bg="#f5f5f5"
+        ).grid(row=4, column=1, sticky=tk.W, padx=10)
+
+        tk.Checkbutton(
+            file_frame,
+            text="결과 캐시 사용 (최근 30일 안에 조회한 번호는 다시 조회하지 않음)",
+            variable=self.cache_mode,
+            font=("맑은 고딕", 9),
+            bg="#f5f5f5"
+        ).grid(row=5, column=1, sticky=tk.W, padx=10)
         
         # 진행 상황 영역
         progress_frame = tk.LabelFrame(
@@ -347,23 +376,48 @@ class MainWindow:
     
     def run_automation(self):
         """자동화 실행 (별도 스레드)"""
+        search_service = None
+        cache = None
         try:
             self.log("=" * 60)
             self.log("자동화 시작")
             self.log("=" * 60)
 
+            # 이전 실행의 결과 파일 저장이 아직 진행 중이면 끝날 때까지 대기
+            if self.save_thread is not None and self.save_thread.is_alive():
+                self.log("이전 결과 파일 저장 완료 대기 중...")
+                self.save_thread.join()
+
             # 1. Excel 파일 읽기
             from ..services.excel_service import ExcelService
             excel_service = ExcelService()
 
-            self.log(f"입력 파일 읽기: {self.input_file_path.get()}")
-            records = excel_service.read_residents(self.input_file_path.get())
+            # 입력은 조회하면서 한 건씩 읽음 (여기서는 건수만 확인)
+            input_path = self.input_file_path.get()
+            self.log(f"입력 파일: {input_path}")
+            total = excel_service.count_residents(input_path)
+
+            self.log(f"총 {total}건")
+
+            # 실행 기록: 조회 1건마다 출력 파일 옆 저널에 기록 (중단 후 이어서 실행)
+            from ..services.run_journal import RunJournal
+            journal = RunJournal.for_output(self.output_file_path.get())
+            # 입력 파일(경로, 수정 시각, 크기)이 저널과 다르면 이어서 실행하지 않고 새로 시작
+            resume = journal.start(resume=self.resume_mode.get() and journal.exists(), input=input_path)
+            done = journal.completed(input_path) if resume else set()
 
-            self.log(f"총 {len(records)}건 로드됨")
+            if done:
+                self.log(f"이어서 실행: 완료된 {len(done)}건 건너뜀")
+            self.log(f"실행 기록: {journal.path}")
 
             # 2. 검색 자동화 서비스 초기화 (템플릿 매칭 모드)
             from ..services.search_service import SearchAutomationService
-            search_service = SearchAutomationService()
+            from ..services.result_cache import ResultCache
+            if self.cache_mode.get():
+                cache = ResultCache()
+                cache.evict()
+                self.log(f"- 결과 캐시: {cache.path} ({len(cache)}건)")
+            search_service = SearchAutomationService(cache=cache)
 
             self.log("- 검색 자동화 서비스 초기화 완료")
             self.log("- 모드: OpenCV 템플릿 매칭")
@@ -378,16 +432,30 @@ class MainWindow:
 
             self.log("")
 
-            # 3. 각 주민등록번호 검색
-            results = []
-            total = len(records)
+            # 3. 각 주민등록번호 검색 (결과는 입력 순서대로 도착)
+            pipeline = self.pipeline_mode.get()
+            if pipeline:
+                self.log("- 파이프라인 모드: 결과 화면 분석을 다음 번호 입력과 동시에 실행")
 
-            for i, record in enumerate(records, 1):
-                # 중지 요청 확인
-                if not self.is_running:
-                    self.log("사용자가 중지했습니다.")
-                    break
+            # 조회에 넘긴 순서 → (입력 순번, 행), 결과가 나오면 꺼냄
+            pending = {}
+            sent = 0
 
+            def resident_numbers():
+                nonlocal sent
+                for i, record in enumerate(excel_service.iter_residents(input_path), 1):
+                    if record['주민등록번호'] in done:
+                        continue
+                    # 중지 요청 확인 (이미 입력한 번호의 분석은 마저 끝냄)
+                    if not self.is_running:
+                        self.log("사용자가 중지했습니다.")
+                        return
+                    pending[sent] = (i, record)
+                    sent += 1
+                    yield record['주민등록번호']
+
+            for index, result in search_service.iter_search(resident_numbers(), pipeline=pipeline):
+                i, record = pending.pop(index)
                 resident_number = record.get('주민등록번호', '')
                 name = record.get('이름', '')
 
@@ -395,54 +463,85 @@ class MainWindow:
                 self.log(f"[{i}/{total}] {name} ({resident_number})")
                 self.log(f"{'='*60}")
 
-                # 검색 실행 (이미지 매칭 사용)
-                result = search_service.search_resident(resident_number)
-
-                # 결과 기록 (정확한 컬럼 형식: 순번, 주민등록번호, 이름, 세대원 수, 상태, 메시지)
+                # 결과 기록 (정확한 컬럼 형식: 순번, 주민등록번호, 이름, 세대원 수, 상태, 메시지, 캐시)
                 output_record = {
                     '순번': record.get('순번', i),
                     '주민등록번호': resident_number,
                     '이름': name,
                     '세대원 수': result['household_count'],
                     '상태': '완료' if result['status'] == 'success' else '오류',
-                    '메시지': result['message']
+                    '메시지': result['message'],
+                    '캐시': 'Y' if result.get('cached') else ''
                 }
-                results.append(output_record)
+                journal.append(output_record)
 
                 # 진행 상황 업데이트
                 self.update_progress(i, total)
 
-                if result['status'] == 'success':
+                if result.get('cached'):
+                    self.log(f"완료 (캐시): {result['household_count']}명")
+                elif result['status'] == 'success':
                     self.log(f"완료: {result['household_count']}명")
                 else:
                     self.log(f"오류: {result['message']}")
 
-                # 다음 검색 전 대기 (1초)
-                if i < total:
-                    time.sleep(1)
+            # 오류 화면 스크린샷 저장 완료 대기
+            search_service.capture.frames.flush()
+            self.log(f"대기 시간: {search_service.automation.format_report()}")
+            self.log(search_service.ui_cache_report())
+            for line in (search_service.pacing_report() or "").splitlines():
+                self.log(line)
+            if cache is not None:
+                self.log(f"결과 캐시: 사용 {cache.hits}건, 조회 {cache.misses}건")
 
             # 4. 결과 저장
             self.log("")
             self.log("=" * 60)
             self.log("결과 저장 중...")
 
-            excel_service.write_results(self.output_file_path.get(), results)
+            # 남은 실행 기록을 디스크에 반영
+            journal.close()
 
             # 실제 저장된 파일 경로
             base_path = os.path.splitext(self.output_file_path.get())[0]
             excel_path = base_path + '.xlsx'
 
-            self.log(f"Excel 저장 완료: {excel_path}")
-            self.log("=" * 60)
-            self.log(f"전체 작업 완료: (총 {len(results)}건 처리)")
-            self.log("=" * 60)
+            def on_saved(count, error):
+                if error is not None:
+                    self.log(f"Excel 저장 실패: {error} (실행 기록: {journal.path})")
+                    messagebox.showerror("오류", f"결과 저장 중 오류가 발생했습니다:\n\n{error}")
+                    return
+
+                self.log(f"Excel 저장 완료: {excel_path}")
+
+                # 여러 실행을 빠르게 합쳐 분석할 수 있도록 열 형식으로도 보관 (pyarrow가 있을 때)
+                from ..services.run_store import RunStore
+                if RunStore.available():
+                    try:
+                        run_path = RunStore().write_run(
+                            journal.results(excel_service.iter_residents(input_path), input_path), source=input_path
+                        )
+                        self.log(f"실행 결과 보관: {run_path}")
+                    except Exception as e:
+                        self.log(f"실행 결과 보관 실패: {e}")
+
+                self.log("=" * 60)
+                self.log(f"전체 작업 완료: (총 {count}건 처리)")
+                self.log("=" * 60)
+
+                # 완료 메시지
+                messagebox.showinfo(
+                    "완료",
+                    f"자동화가 완료되었습니다!\n\n"
+                    f"처리 건수: {count}건\n"
+                    f"저장 위치: {excel_path}"
+                )
 
-            # 완료 메시지
-            messagebox.showinfo(
-                "완료",
-                f"자동화가 완료되었습니다!\n\n"
-                f"처리 건수: {len(results)}건\n"
-                f"저장 위치: {excel_path}"
+            # 이전 실행에서 완료된 건까지 포함해 실행 기록으로 결과 파일 생성 (백그라운드)
+            self.save_thread = excel_service.write_results_in_background(
+                self.output_file_path.get(),
+                journal.results(excel_service.iter_residents(input_path), input_path),
+                callback=on_saved
             )
 
         except Exception as e:
@@ -452,6 +551,11 @@ class MainWindow:
             messagebox.showerror("오류", f"자동화 중 오류가 발생했습니다:\n\n{error_msg}")
 
         finally:
+            # 캡처 백엔드의 X 연결/공유 메모리, 샘플러 스레드, 결과 캐시 DB 연결 해제
+            if search_service is not None:
+                search_service.close()
+            if cache is not None:
+                cache.close()
             self.is_running = False
             self.start_button.config(state=tk.NORMAL)
             self.stop_button.config(state=tk.DISABLED)
@@ -459,6 +563,9 @@ class MainWindow:
 
 def main():
     """메인 함수"""
+    # Xlib 멀티스레드 지원은 Tk가 X 디스플레이를 열기 전에 켜야 함
+    from ..core import xlib
+    xlib.init_threads()
     root = tk.Tk()
     app = MainWindow(root)
     root.mainloop()
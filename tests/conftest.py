@@ -0,0 +1,62 @@
+"""
+pytest 공용 설정
+Xvfb가 필요한 테스트는 xvfb 픽스처를 사용하며, Xvfb가 없으면 건너뛴다.
+"""
+
+import os
+import sys
+import shutil
+import platform
+import subprocess
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# 실제 화면을 조작하는 수동 실행 스크립트 (pytest 테스트가 아님)
+collect_ignore = ['test_click.py', 'test_macro.py', 'test_macro_fixed.py', 'test_search.py', 'test_search_macroX.py']
+
+
+@pytest.fixture(scope="session")
+def xvfb():
+    """
+    테스트 세션 동안 쓰는 Xvfb 가상 디스플레이 (DISPLAY도 이 디스플레이로 설정)
+
+    pyautogui는 import 시점의 DISPLAY에 연결하므로 디스플레이 하나를 세션 전체에서 공유한다.
+    """
+    if platform.system() != 'Linux' or shutil.which('Xvfb') is None:
+        pytest.skip("Xvfb가 필요합니다")
+
+    from src.services.sharded_executor import XvfbDisplay
+
+    display = XvfbDisplay(size=(1280, 800)).start()
+    previous = os.environ.get('DISPLAY')
+    os.environ['DISPLAY'] = display.name
+    yield display
+    if previous is None:
+        os.environ.pop('DISPLAY', None)
+    else:
+        os.environ['DISPLAY'] = previous
+    display.stop()
+
+
+@pytest.fixture
+def show_window(xvfb):
+    """
+    xvfb 디스플레이에 파이썬 스크립트(Tk 창 등)를 띄우는 함수. 테스트가 끝나면 종료한다.
+
+    Returns:
+        function: show(script) -> subprocess.Popen
+    """
+    processes = []
+
+    def show(script):
+        process = subprocess.Popen([sys.executable, '-c', script], env=dict(os.environ, DISPLAY=xvfb.name))
+        processes.append(process)
+        return process
+
+    yield show
+    for process in processes:
+        process.terminate()
+        process.wait(timeout=5)
@@ -0,0 +1,92 @@
+"""
+XShm 캡처 백엔드 테스트 (Xvfb 필요)
+알려진 색 패턴 창을 띄우고 캡처한 픽셀을 확인한다.
+"""
+
+import time
+
+import numpy as np
+
+# 왼쪽 위 300x100: 빨강 / 초록 / 파랑 세로 띠 (창 관리자가 없으므로 +0+0에 그대로 뜬다)
+PATTERN_SCRIPT = """
+import tkinter as tk
+root = tk.Tk()
+root.overrideredirect(True)
+root.geometry('300x100+0+0')
+for i, color in enumerate(('#ff0000', '#00ff00', '#0000ff')):
+    tk.Frame(root, bg=color, width=100, height=100).place(x=i * 100, y=0)
+root.mainloop()
+"""
+
+RED, GREEN, BLUE = (0, 0, 255), (0, 255, 0), (255, 0, 0)
+
+
+def wait_for_pixel(backend, point, color, timeout=10.0):
+    """point의 BGR 값이 color가 될 때까지 대기"""
+    x, y = point
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if tuple(backend.grab((x, y, 1, 1))[0, 0]) == color:
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def test_xshm_grabs_pattern(xvfb, show_window):
+    from src.core.capture_backends import XShmBackend
+
+    backend = XShmBackend(xvfb.name)
+    try:
+        assert backend.use_shm
+        assert backend.size() == xvfb.size
+
+        show_window(PATTERN_SCRIPT)
+        assert wait_for_pixel(backend, (50, 50), RED)
+
+        frame = backend.grab((0, 0, 300, 100))
+        assert frame.shape == (100, 300, 3)
+        assert (frame[:, 5:95] == RED).all()
+        assert (frame[:, 105:195] == GREEN).all()
+        assert (frame[:, 205:295] == BLUE).all()
+
+        # 그레이스케일 + 버퍼 재사용
+        out = np.empty((100, 300), dtype=np.uint8)
+        gray = backend.grab((0, 0, 300, 100), grayscale=True, out=out)
+        assert gray is out
+        assert gray[50, 50] == 76 and gray[50, 150] == 150 and gray[50, 250] == 29
+
+        # 화면 밖으로 걸친 영역은 화면 안쪽만 (왼쪽/위로 걸치면 잘린 만큼 작아짐)
+        width, height = xvfb.size
+        assert backend.grab((width - 10, height - 10, 50, 50)).shape == (10, 10, 3)
+        clipped = backend.grab((-50, -20, 200, 100))
+        assert clipped.shape == (80, 150, 3)
+        assert (clipped[:, 105:145] == GREEN).all()
+    finally:
+        backend.close()
+
+
+def test_xshm_without_shm_matches(xvfb, show_window):
+    from src.core.capture_backends import XShmBackend
+
+    show_window(PATTERN_SCRIPT)
+    shm = XShmBackend(xvfb.name)
+    plain = XShmBackend(xvfb.name)
+    try:
+        assert wait_for_pixel(shm, (50, 50), RED)
+        plain._release_shm()
+        plain.use_shm = False
+        assert np.array_equal(shm.grab((0, 0, 300, 100)), plain.grab((0, 0, 300, 100)))
+    finally:
+        shm.close()
+        plain.close()
+
+
+def test_auto_backend_uses_verified_xshm(xvfb):
+    from src.core.capture_backends import create_backend
+
+    backend = create_backend('auto')
+    try:
+        assert backend.name == 'xshm'
+        assert backend.use_shm
+    finally:
+        backend.close()
@@ -0,0 +1,142 @@
+"""
+병렬 조회 실행기 통합 테스트 (Xvfb 필요)
+작업 프로세스 2개가 mock_system/app.py를 조회해 입력 순서대로 결과를 합치는지,
+작업 프로세스가 죽으면 남은 번호를 오류로 채우는지 확인한다.
+
+UI 템플릿과 레이아웃은 Xvfb에 띄운 Mock 시스템의 위젯 위치에서 만든다 (글꼴이 달라 기본 템플릿은 맞지 않음).
+"""
+
+import os
+import sys
+import json
+import time
+import subprocess
+import multiprocessing
+
+import cv2
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Mock 시스템을 띄우고 입력 필드/버튼/결과 패널/상태바와 첫 체크박스의 화면 위치를 출력
+GEOMETRY_SCRIPT = """
+import sys, json
+sys.path.insert(0, {root!r})
+import tkinter as tk
+from mock_system.app import HaengbokEumMockSystem
+
+root = tk.Tk()
+app = HaengbokEumMockSystem(root)
+app.show_result(app.df.iloc[0])
+root.update()
+
+def rect(widget):
+    return [widget.winfo_rootx(), widget.winfo_rooty(), widget.winfo_width(), widget.winfo_height()]
+
+item = app.result_content_frame.winfo_children()[2]
+print(json.dumps({{
+    'input_field': rect(app.resident_number_entry),
+    'search_button': rect(app.search_button),
+    'result_panel': rect(app.result_canvas),
+    'status_bar': rect(app.status_label),
+    'checkbox': rect(item.winfo_children()[0]),
+}}), flush=True)
+root.mainloop()
+"""
+
+LAYOUT_REFERENCE_HEIGHT = 45
+LAYOUT_MARGIN = 10
+
+
+def expected_counts():
+    """database.csv의 주민등록번호별 세대원 수 (중복 번호는 Mock 시스템처럼 첫 행)"""
+    df = pd.read_csv(os.path.join(PROJECT_ROOT, "mock_system", "database.csv"), dtype=str)
+    df = df.drop_duplicates('주민등록번호')
+    members = df[[f'세대원{i}' for i in range(1, 4)]].fillna('').apply(lambda col: col.str.strip().ne(''))
+    return dict(zip(df['주민등록번호'], 1 + members.sum(axis=1)))
+
+
+@pytest.fixture(scope="module")
+def mock_templates(xvfb, tmp_path_factory):
+    """
+    Xvfb 화면의 Mock 시스템에서 잘라 낸 UI 템플릿 디렉토리와 레이아웃
+
+    Returns:
+        dict: ShardedExecutor의 service_options (template_dir, layout)
+    """
+    from src.core.capture_backends import XShmBackend
+
+    app = subprocess.Popen(
+        [sys.executable, '-c', GEOMETRY_SCRIPT.format(root=PROJECT_ROOT)],
+        env=dict(os.environ, DISPLAY=xvfb.name), cwd=PROJECT_ROOT, stdout=subprocess.PIPE, text=True
+    )
+    try:
+        rects = json.loads(app.stdout.readline())
+        time.sleep(0.5)
+        backend = XShmBackend(xvfb.name)
+        try:
+            screen = backend.grab()
+        finally:
+            backend.close()
+    finally:
+        app.terminate()
+        app.wait(timeout=5)
+
+    template_dir = tmp_path_factory.mktemp("templates")
+    for name in ('input_field', 'search_button', 'checkbox'):
+        x, y, w, h = rects[name]
+        cv2.imwrite(str(template_dir / f"{name}.png"), screen[y:y + h, x:x + w])
+
+    # 레이아웃은 입력 필드 좌상단 기준, 입력 필드 높이 45 기준 단위 (여백 포함)
+    ax, ay, _, ah = rects['input_field']
+    scale = LAYOUT_REFERENCE_HEIGHT / ah
+    layout = {}
+    for name in ('result_panel', 'status_bar'):
+        x, y, w, h = rects[name]
+        layout[name] = (
+            int((x - ax - LAYOUT_MARGIN) * scale), int((y - ay - LAYOUT_MARGIN) * scale),
+            int((w + 2 * LAYOUT_MARGIN) * scale), int((h + 2 * LAYOUT_MARGIN) * scale)
+        )
+    return {'template_dir': str(template_dir), 'layout': layout}
+
+
+def test_two_workers_merge_in_input_order(mock_templates):
+    from src.services.sharded_executor import ShardedExecutor
+
+    counts = expected_counts()
+    numbers = list(counts)[:6]
+    seen = []
+
+    executor = ShardedExecutor(workers=2, **mock_templates)
+    results = executor.run(numbers, callback=lambda index, total, result: seen.append(index))
+
+    assert seen == list(range(1, len(numbers) + 1))
+    assert [r['resident_number'] for r in results] == numbers
+    assert all(r['status'] == 'success' for r in results), results
+    assert [r['household_count'] for r in results] == [counts[n] for n in numbers]
+
+
+def test_killed_workers_leave_errors(mock_templates):
+    from src.services.sharded_executor import ShardedExecutor
+
+    counts = expected_counts()
+    numbers = list(counts)[:8]
+
+    def kill_workers(index, total, result):
+        # 첫 결과가 합쳐지면 작업 프로세스를 모두 강제 종료
+        if index == 1:
+            for process in multiprocessing.active_children():
+                process.kill()
+
+    executor = ShardedExecutor(workers=2, **mock_templates)
+    results = executor.run(numbers, callback=kill_workers)
+
+    assert [r['resident_number'] for r in results] == numbers
+    assert results[0]['status'] == 'success'
+    errors = [r for r in results if r['status'] == 'error']
+    assert errors
+    assert all(r['message'] == 'Worker exited before this record was looked up' for r in errors)
+    for r in results:
+        if r['status'] == 'success':
+            assert r['household_count'] == counts[r['resident_number']]
@@ -0,0 +1,86 @@
+"""
+X11 윈도우 위치 찾기 테스트 (Xvfb 필요)
+"""
+
+import time
+
+WINDOW_SCRIPT = """
+import tkinter as tk
+root = tk.Tk()
+root.title('Locator Test Window')
+root.geometry('200x100+40+30')
+root.mainloop()
+"""
+
+
+def wait_for_region(locator, timeout=10.0):
+    """창이 뜰 때까지 다시 조회"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        locator.invalidate()
+        region = locator.region()
+        if region is not None:
+            return region
+        time.sleep(0.1)
+    return None
+
+
+def test_locates_window_by_title(xvfb, show_window):
+    from src.core.window_locator import WindowLocator
+
+    window = show_window(WINDOW_SCRIPT)
+    locator = WindowLocator('Locator Test')
+    assert wait_for_region(locator) == (40, 30, 200, 100)
+
+    # 캐시된 위치는 다시 조회하지 않음
+    count = locator.locate_count
+    assert locator.region(screen_size=xvfb.size) == (40, 30, 200, 100)
+    assert locator.locate_count == count
+
+    window.terminate()
+    window.wait(timeout=5)
+    locator.invalidate()
+    assert locator.region() is None
+    assert WindowLocator('No Such Window').region() is None
+
+
+def test_bad_window_invalidates_cache(xvfb, show_window, monkeypatch):
+    from src.core import window_locator
+    from src.core.window_locator import WindowLocator
+
+    show_window(WINDOW_SCRIPT)
+    locator = WindowLocator('Locator Test')
+    assert wait_for_region(locator) is not None
+
+    # 조회 중 윈도우가 사라진 것처럼 존재하지 않는 윈도우 ID를 끼워 넣음
+    children = window_locator._x11_children
+    monkeypatch.setattr(window_locator, '_x11_children',
+                        lambda x11, display, window: [0x7ffffff0] + children(x11, display, window))
+    locator.invalidate()
+    assert locator.region() is None
+    assert locator._located_at is None
+
+    monkeypatch.setattr(window_locator, '_x11_children', children)
+    assert locator.region() == (40, 30, 200, 100)
+
+
+def test_trap_errors_restores_previous_handler(xvfb):
+    import ctypes
+    from src.core import xlib
+
+    x11, _, _ = xlib.load()
+    display = x11.XOpenDisplay(xvfb.name.encode())
+    try:
+        before = x11.XSetErrorHandler(None)
+        x11.XSetErrorHandler(before)
+
+        with xlib.trap_errors(display) as errors:
+            attributes = xlib.XWindowAttributes()
+            x11.XGetWindowAttributes(display, 0x7ffffff0, ctypes.byref(attributes))
+        assert errors == [xlib.BadWindow]
+
+        after = x11.XSetErrorHandler(None)
+        x11.XSetErrorHandler(after)
+        assert after == before
+    finally:
+        x11.XCloseDisplay(display)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+화면 캡처 지연 벤치마크
+
+사용 가능한 캡처 백엔드(pyautogui, xshm)별로 전체 화면과
+상태바/결과 패널 크기 영역의 캡처 시간을 측정합니다.
+영역 캡처는 재사용 버퍼(out=)에 쓰는 경우도 함께 측정합니다.
+
+사용법:
+    python tools/benchmark_capture.py [--trials 50] [--backend xshm]
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.capture_backends import BACKENDS
+
+
+# SCREEN_LAYOUT 기본 영역 크기 (상태바, 결과 패널)
+REGIONS = {
+    'status bar (420x70)': (420, 70),
+    'result panel (850x400)': (850, 400),
+}
+
+
+def measure(func, trials):
+    """
+    func를 trials번 실행
+
+    Returns:
+        tuple: (중앙값 ms, p95 ms)
+    """
+    func()  # 첫 호출(버퍼/이미지 생성)은 제외
+    latencies = []
+    for _ in range(trials):
+        start = time.perf_counter()
+        func()
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+
+def report(label, median, p95):
+    fps = 1000 / median if median > 0 else float('inf')
+    print(f"  {label:<44} median {median:7.2f} ms   p95 {p95:7.2f} ms   {fps:7.1f} fps")
+
+
+def run_backend(name, trials):
+    """한 백엔드의 캡처 시간 측정"""
+    try:
+        backend = BACKENDS[name]()
+    except Exception as e:
+        print(f"\n[{name}] 사용 불가: {e}")
+        return
+
+    width, height = backend.size()
+    print(f"\n[{name}] 화면 {width}x{height}")
+
+    try:
+        report("full screen (BGR)", *measure(lambda: backend.grab(), trials))
+        report("full screen (gray)", *measure(lambda: backend.grab(grayscale=True), trials))
+
+        for label, (w, h) in REGIONS.items():
+            region = (max(0, (width - w) // 2), max(0, (height - h) // 2), min(w, width), min(h, height))
+            report(f"{label} gray", *measure(lambda: backend.grab(region, grayscale=True), trials))
+
+            buffer = backend.grab(region, grayscale=True)
+            report(f"{label} gray, reused buffer",
+                   *measure(lambda: backend.grab(region, grayscale=True, out=buffer), trials))
+    finally:
+        backend.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="화면 캡처 지연 벤치마크")
+    parser.add_argument("--trials", type=int, default=50)
+    parser.add_argument("--backend", choices=list(BACKENDS), help="측정할 백엔드 (기본: 전체)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("화면 캡처 지연 벤치마크")
+    print("=" * 60)
+
+    for name in ([args.backend] if args.backend else BACKENDS):
+        run_backend(name, args.trials)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+세대원 수 계산 벤치마크
+
+Mock 시스템 결과 패널과 비슷한 합성 화면(체크박스 + 이름 행)을 만들어
+템플릿 매칭(전체 화면 / 결과 패널), 연결 요소 분석, 가로 투영 방식의
+속도와 정확도를 비교합니다.
+
+사용법:
+    python tools/benchmark_counting.py [--trials 50] [--template-dir data/templates/templates_window]
+"""
+
+import sys
+import os
+import io
+import time
+import argparse
+import contextlib
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+
+from src.core.image_matcher import ImageMatcher, ColorMatcher
+from src.core.template_registry import TemplateRegistry
+
+
+SCREEN_SIZE = (1920, 1080)
+PANEL_SIZE = (740, 380)
+NAMES = ["Kim Seojin", "Han Taehyun", "Song Domin", "Park Yeu", "Choi Jihyuk", "Lee Hyunyoung"]
+RELATIONS = ["(self)", "(spouse)", "(child)"]
+
+
+def make_result_screen(count, checkbox, rng):
+    """
+    결과 패널 합성 화면 생성
+
+    Returns:
+        tuple: (그레이스케일 화면, 결과 패널 영역 (x, y, w, h))
+    """
+    width, height = SCREEN_SIZE
+    screen = np.full((height, width), 240, dtype=np.uint8)
+
+    # 창 밖 잡음 (다른 창의 글자/사각형)
+    for _ in range(40):
+        x, y = int(rng.integers(0, width - 200)), int(rng.integers(20, height))
+        cv2.putText(screen, "Lorem 123", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 30, 1)
+
+    panel_w, panel_h = PANEL_SIZE
+    px = int(rng.integers(0, width - panel_w - 40))
+    py = int(rng.integers(0, height - panel_h - 40))
+    screen[py:py + panel_h, px:px + panel_w] = 255
+
+    if count == 0:
+        cv2.putText(screen, "No result", (px + 300, py + 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, 40, 2)
+        return screen, (px - 20, py - 20, panel_w + 40, panel_h + 40)
+
+    # 제목 + 구분선
+    cv2.putText(screen, "Household (name)", (px + 20, py + 35), cv2.FONT_HERSHEY_SIMPLEX, 0.6, 50, 2)
+    screen[py + 50:py + 52, px + 20:px + panel_w - 20] = 204
+
+    # 항목 행: 체크박스 + 이름 + 관계
+    ch, cw = checkbox.shape
+    for i in range(count):
+        y = py + 60 + i * (ch + 10)
+        screen[y:y + ch, px + 30:px + 30 + cw] = checkbox
+        cv2.putText(screen, NAMES[int(rng.integers(0, len(NAMES)))], (px + 40 + cw, y + ch - 8),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.45, 0, 1)
+        cv2.putText(screen, RELATIONS[min(i, 2)], (px + 160 + cw, y + ch - 8),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, 102, 1)
+
+    return screen, (px - 20, py - 20, panel_w + 40, panel_h + 40)
+
+
+def run_case(label, func, cases):
+    """한 가지 계산 방식을 모든 케이스에 대해 실행"""
+    latencies = []
+    correct = 0
+
+    for screen, region, truth in cases:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            count = func(screen, region)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if count == truth:
+            correct += 1
+
+    latencies.sort()
+    median = latencies[len(latencies) // 2]
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"  {label:<28} median {median:7.2f} ms   p95 {p95:7.2f} ms   "
+          f"accuracy {correct}/{len(cases)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세대원 수 계산 벤치마크")
+    parser.add_argument("--trials", type=int, default=50)
+    parser.add_argument("--template-dir", default="data/templates/templates_window")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    checkbox = TemplateRegistry(args.template_dir).get('checkbox')
+    matcher = ImageMatcher(confidence=0.7)
+    box_size = ColorMatcher.box_size_from_template(checkbox) or (14, 14)
+
+    def by_template(screen, region):
+        return len(matcher.find_all_templates(screen, checkbox, threshold=0.7))
+
+    def by_template_roi(screen, region):
+        return len(matcher.find_all_templates(screen, checkbox, threshold=0.7, region=region))
+
+    def by_components(screen, region):
+        panel = ColorMatcher.find_panel(screen, region) or region
+        return len(ColorMatcher.find_checkboxes(screen, panel, box_size=box_size))
+
+    def by_projection(screen, region):
+        panel = ColorMatcher.find_panel(screen, region) or region
+        return max(0, len(ColorMatcher.find_rows(screen, panel)) - 1)
+
+    cases = []
+    for i in range(args.trials):
+        count = i % 5
+        screen, region = make_result_screen(count, checkbox.gray, rng)
+        cases.append((screen, region, count))
+
+    print("=" * 60)
+    print("세대원 수 계산 벤치마크")
+    print(f"화면 {SCREEN_SIZE[0]}x{SCREEN_SIZE[1]}, 체크박스 테두리 {box_size}, {len(cases)}건")
+    print("=" * 60)
+
+    run_case("template (full screen)", by_template, cases)
+    run_case("template (result panel)", by_template_roi, cases)
+    run_case("connected components", by_components, cases)
+    run_case("projection profile", by_projection, cases)
+
+
+if __name__ == "__main__":
+    main()
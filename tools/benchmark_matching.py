@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+템플릿 매칭 벤치마크
+
+합성 화면(1080p / 4K)에 UI 템플릿을 100/125/150% 배율로 붙여 넣고
+기존 find_template과 피라미드 매칭(find_template_pyramid)의 지연 시간과 적중률을 비교합니다.
+
+사용법:
+    python tools/benchmark_matching.py [--trials 20] [--template-dir data/templates/templates_window]
+"""
+
+import sys
+import os
+import io
+import time
+import argparse
+import contextlib
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+
+from src.core.image_matcher import ImageMatcher, DPI_SCALES
+from src.core.template_registry import TemplateRegistry
+
+
+SCREEN_SIZES = [(1920, 1080), (3840, 2160)]
+PLACEMENT_SCALES = [1.0, 1.25, 1.5]
+
+
+def make_screen(width, height, rng):
+    """UI처럼 보이는 합성 화면 생성 (사각형, 텍스트 잡음)"""
+    screen = np.full((height, width), 240, dtype=np.uint8)
+
+    for _ in range(width * height // 40000):
+        x, y = int(rng.integers(0, width - 60)), int(rng.integers(0, height - 30))
+        w, h = int(rng.integers(20, 300)), int(rng.integers(10, 80))
+        shade = int(rng.integers(120, 255))
+        cv2.rectangle(screen, (x, y), (x + w, y + h), shade, -1 if rng.random() < 0.5 else 1)
+
+    for _ in range(width * height // 60000):
+        x, y = int(rng.integers(0, width - 100)), int(rng.integers(20, height))
+        cv2.putText(screen, "ABC 123", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, 40, 1)
+
+    return screen
+
+
+def place_template(screen, template_gray, scale, rng):
+    """템플릿을 배율 적용 후 임의 위치에 붙여 넣고 정답 중심 좌표 반환"""
+    scaled = cv2.resize(template_gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR)
+    h, w = scaled.shape
+    x = int(rng.integers(0, screen.shape[1] - w))
+    y = int(rng.integers(0, screen.shape[0] - h))
+    screen[y:y + h, x:x + w] = scaled
+    return (x + w // 2, y + h // 2), max(w, h)
+
+
+def run_case(label, func, cases):
+    """한 가지 매칭 방식을 모든 케이스에 대해 실행"""
+    latencies = []
+    hits = 0
+
+    for screen, template, truth, size in cases:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func(screen, template)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        if result is not None:
+            dx = result['center_x'] - truth[0]
+            dy = result['center_y'] - truth[1]
+            if (dx * dx + dy * dy) ** 0.5 <= max(4, size * 0.15):
+                hits += 1
+
+    latencies.sort()
+    median = latencies[len(latencies) // 2]
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"  {label:<28} median {median:8.1f} ms   p95 {p95:8.1f} ms   hit {hits}/{len(cases)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="템플릿 매칭 벤치마크")
+    parser.add_argument("--trials", type=int, default=20, help="배율별 시도 횟수")
+    parser.add_argument("--template-dir", default="data/templates/templates_window")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    registry = TemplateRegistry(args.template_dir)
+    names = [n for n in ('input_field', 'search_button') if registry.exists(n)]
+    matcher = ImageMatcher(confidence=0.7)
+
+    methods = [
+        ("find_template", lambda s, t: matcher.find_template(s, t)),
+        ("pyramid (1.0)", lambda s, t: matcher.find_template_pyramid(s, t)),
+        ("pyramid (DPI_SCALES)", lambda s, t: matcher.find_template_pyramid(s, t, scales=DPI_SCALES)),
+    ]
+
+    print("=" * 60)
+    print("템플릿 매칭 벤치마크")
+    print(f"템플릿: {args.template_dir} ({', '.join(names)})")
+    print("=" * 60)
+
+    for width, height in SCREEN_SIZES:
+        for scale in PLACEMENT_SCALES:
+            cases = []
+            for i in range(args.trials):
+                template = registry.get(names[i % len(names)])
+                screen = make_screen(width, height, rng)
+                truth, size = place_template(screen, template.gray, scale, rng)
+                cases.append((screen, template, truth, size))
+
+            print(f"\n화면 {width}x{height}, 화면 배율 {int(scale * 100)}%")
+            for label, func in methods:
+                run_case(label, func, cases)
+
+
+if __name__ == "__main__":
+    main()
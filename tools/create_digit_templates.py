@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상태바 숫자 템플릿 생성 도구
+
+상태바("조회 결과: N명")와 같은 글꼴로 0~9 숫자를 렌더링해
+<템플릿 디렉토리>/digits/0.png ~ 9.png 로 저장합니다.
+SearchAutomationService는 이 템플릿이 있으면 상태바 숫자로 세대원 수를 읽습니다.
+
+사용법:
+    python tools/create_digit_templates.py [--font 글꼴경로] [--size 12] [--output 디렉토리]
+
+기본값:
+    Windows  맑은 고딕 9pt (12px, 100% 배율)
+    macOS    Apple SD Gothic Neo 9pt (Retina 2배 → 18px)
+"""
+
+import sys
+import os
+import argparse
+import platform
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.digit_reader import DEFAULT_FONTS, FALLBACK_FONT, create_digit_templates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상태바 숫자 템플릿 생성")
+    parser.add_argument("--font", help="TrueType 글꼴 경로 (기본: OS별 상태바 글꼴)")
+    parser.add_argument("--size", type=int, help="글꼴 픽셀 크기 (기본: OS별 값)")
+    parser.add_argument("--output", help="저장 디렉토리 (기본: <템플릿 디렉토리>/digits)")
+    args = parser.parse_args()
+
+    font_path, font_size = DEFAULT_FONTS.get(platform.system(), FALLBACK_FONT)
+    font_path = args.font or font_path
+    font_size = args.size or font_size
+
+    output_dir = args.output
+    if output_dir is None:
+        from src.services.search_service import get_template_dir
+        output_dir = os.path.join(get_template_dir(), 'digits')
+    os.makedirs(output_dir, exist_ok=True)
+
+    print("=" * 60)
+    print("상태바 숫자 템플릿 생성")
+    print("=" * 60)
+    print(f"글꼴: {font_path} ({font_size}px)")
+
+    try:
+        paths = create_digit_templates(output_dir, font_path, font_size)
+    except OSError as e:
+        print(f"글꼴을 열 수 없습니다: {e}")
+        print("--font 옵션으로 상태바와 같은 글꼴 경로를 지정하세요.")
+        return
+
+    for path in paths:
+        print(f" 저장됨: {path}")
+
+    print("\n완료! 실제 화면과 글꼴/배율이 다르면 --font / --size로 다시 생성하세요.")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ from PIL import Image
 import tkinter as tk
 from tkinter import messagebox
 
+from src.core.digit_reader import create_digit_templates
+
 
 class TemplateCreator:
     """템플릿 이미지 생성기"""
@@ -172,6 +174,19 @@ class TemplateCreator:
         
         return True
     
+    def create_digits(self):
+        """상태바 글꼴로 숫자 템플릿(digits/0~9.png) 생성"""
+        digit_dir = os.path.join(self.templates_dir, "digits")
+        try:
+            paths = create_digit_templates(digit_dir)
+        except OSError as e:
+            print(f"\n상태바 숫자 템플릿 생성 실패: {e}")
+            print("   tools/create_digit_templates.py --font 로 글꼴을 지정해 다시 생성하세요.")
+            return False
+
+        print(f"\n상태바 숫자 템플릿 {len(paths)}개 저장됨: {digit_dir}/")
+        return True
+    
     def run(self):
         """실행"""
         print("="*60)
@@ -222,6 +237,9 @@ class TemplateCreator:
             ):
                 success_count += 1
         
+        # 상태바 숫자 템플릿 (세대원 수를 상태바 숫자로 읽는 빠른 경로)
+        self.create_digits()
+
         # 완료 메시지
         print("\n" + "="*60)
         print(f"완료! ({success_count}/{len(templates)}개 생성)")
@@ -18,6 +18,8 @@ import cv2
 import numpy as np
 from PIL import Image
 
+from src.core.digit_reader import create_digit_templates
+
 
 def create_templates_from_screenshot():
     """스크린샷에서 자동으로 템플릿 생성"""
@@ -87,6 +89,15 @@ def create_templates_from_screenshot():
     cv2.imwrite(checkbox_path, checkbox_resized)
     print(f"   저장됨: {checkbox_path}")
     
+    # 6. 상태바 숫자 템플릿 생성 (상태바 글꼴 렌더링)
+    print("\n상태바 숫자 템플릿 생성 중...")
+    digit_dir = os.path.join(templates_dir, "digits")
+    try:
+        create_digit_templates(digit_dir)
+        print(f"   저장됨: {digit_dir}/0.png ~ 9.png")
+    except OSError as e:
+        print(f"   생성 실패: {e} (tools/create_digit_templates.py --font 로 다시 생성)")
+
     print("\n" + "=" * 60)
     print(" 템플릿 생성 완료!")
     print("=" * 60)